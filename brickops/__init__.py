@@ -1,3 +1,7 @@
 import logging
 
+from brickops.databricks.context import init
+
+__all__ = ["init"]
+
 logging.getLogger("brickops").addHandler(logging.NullHandler())
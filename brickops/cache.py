@@ -0,0 +1,101 @@
+"""In-process cache with per-entry expiry and a bound on the entry count."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+K = TypeVar("K", bound="Hashable")
+V = TypeVar("V")
+
+# Marker for "use the cache default" in TTLCache.set, since None means "never expire"
+DEFAULT_TTL = -1.0
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Hit and miss counters of a cache."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe LRU cache whose entries expire after a time to live.
+
+    A ttl of None means entries never expire. When maxsize is reached the least
+    recently used entry is evicted.
+    """
+
+    def __init__(
+        self: TTLCache[K, V], maxsize: int = 256, ttl: float | None = None
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self: TTLCache[K, V], key: K, default: V | None = None) -> V | None:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(
+        self: TTLCache[K, V], key: K, value: V, ttl: float | None = DEFAULT_TTL
+    ) -> None:
+        """Store value under key. ttl overrides the cache default for this entry."""
+        if ttl == DEFAULT_TTL:
+            ttl = self.ttl
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self: TTLCache[K, V], key: K) -> None:
+        """Remove key from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self: TTLCache[K, V], predicate: Callable[[K], bool]) -> int:
+        """Remove all entries whose key matches predicate, returning the count."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self: TTLCache[K, V]) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self: TTLCache[K, V]) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits, misses=self.misses, size=len(self._entries)
+            )
+
+    def __len__(self: TTLCache[K, V]) -> int:
+        return len(self._entries)
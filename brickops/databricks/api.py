@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+import copy
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import requests
 from requests.exceptions import RequestException
 
+from brickops.databricks import transport
+from brickops.databricks.index import JobIndex, PipelineIndex
+from brickops.databricks.responsecache import response_key
+from brickops.databricks.transport import (
+    DEFAULT_POOL_SIZE,
+    DEFAULT_RETRY_POLICIES,
+    NO_RETRY,
+    RateLimiter,
+    RetryPolicy,
+    SingleFlight,
+    get_rate_limiter,
+    get_session,
+    get_single_flight,
+)
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator, Mapping
     from typing import Any, ParamSpec, TypeVar
 
+    from brickops.databricks.responsecache import ResponseCache
+
     Param = ParamSpec("Param")
     RetType = TypeVar("RetType")
 
@@ -17,6 +36,14 @@ from functools import wraps
 
 logger = logging.getLogger(__name__)
 
+# Maximum page sizes accepted by the listing endpoints
+JOBS_PAGE_SIZE = 100
+PIPELINES_PAGE_SIZE = 100
+# Unity Catalog caps this at a server configured page length
+UC_PAGE_SIZE = 1000
+# Workspace folders that can contain repos and git folders
+REPO_PATH_PREFIXES = ("/Repos", "/Users", "/Shared")
+
 
 # This provides a common error handling decorator for the API client methods.
 # The nested decorator pattern is used to allow the error_handling decorator to
@@ -53,79 +80,176 @@ class ApiClientError(Exception):
 
 
 class ApiClient:
-    """Wrapper for databricks API."""
+    """Wrapper for databricks API.
+
+    Clients for the same host and token share a pooled keep-alive session,
+    and all clients for a host share one rate limiter, see
+    brickops.databricks.transport. retry_policies overrides the default
+    RetryPolicy per HTTP verb.
 
-    def __init__(self: ApiClient, host: str, token: str) -> None:
+    Pass a ResponseCache as cache to reuse GET responses, see
+    brickops.databricks.responsecache. Identical GETs issued concurrently
+    from several threads are sent once and share the response, unless
+    coalesce_requests is False.
+
+    After build_job_index() or build_pipeline_index(), name lookups are
+    answered from memory and the index is updated when jobs or pipelines
+    are created or deleted through this client.
+    """
+
+    def __init__(
+        self: ApiClient,
+        host: str,
+        token: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        session: requests.Session | None = None,
+        retry_policies: Mapping[str, RetryPolicy] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = True,
+    ) -> None:
         self.api_host = host
         self.api_token = token
+        self.session = session or get_session(host, token, pool_size=pool_size)
+        self.retry_policies = {**DEFAULT_RETRY_POLICIES, **(retry_policies or {})}
+        self.rate_limiter = rate_limiter or get_rate_limiter(host)
+        self.cache = cache
+        self.single_flight: SingleFlight[dict[str, Any]] | None = (
+            get_single_flight(host, token) if coalesce_requests else None
+        )
+        self.job_index: JobIndex | None = None
+        self.pipeline_index: PipelineIndex | None = None
         self.headers = {
             "Authorization": f"Bearer {self.api_token}",
             "Content-Type": "application/json",
         }
 
+    def build_job_index(self: ApiClient) -> JobIndex:
+        """Index all jobs by name with one paginated sweep and attach the index."""
+        self.job_index = JobIndex.build(self)
+        return self.job_index
+
     def get_job_by_name(self: ApiClient, job_name: str) -> dict[str, Any] | None:
+        if self.job_index is not None:
+            return self.job_index.get(job_name)
         result = self.get("jobs/list", params={"name": job_name})
         jobs: list[dict[str, Any]] = result.get("jobs", [])
         if jobs is None or len(jobs) == 0:
             return None
         return jobs[0]
 
+    def get_job(self: ApiClient, job_id: str | int) -> dict[str, Any]:
+        return self.get("jobs/get", params={"job_id": str(job_id)})
+
     def get_jobs(self: ApiClient) -> list[dict[str, Any]]:
-        result = self.get("jobs/list", version="2.2")
-        job_list: list[dict[str, Any]] = result.get("jobs", [])
-        while next_page_token := result.get("next_page_token"):
-            result = self.get(
-                "jobs/list", version="2.2", params={"page_token": next_page_token}
-            )
-            job_list.extend(result.get("jobs", []))
-        return job_list
+        return list(self.iter_jobs())
+
+    def iter_jobs(
+        self: ApiClient,
+        page_size: int = JOBS_PAGE_SIZE,
+        expand_tasks: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield all jobs, fetching one page at a time."""
+        return self.paginate(
+            "jobs/list",
+            key="jobs",
+            version="2.2",
+            params={
+                "limit": str(page_size),
+                "expand_tasks": str(expand_tasks).lower(),
+            },
+        )
 
     def delete_job(self: ApiClient, job_id: str) -> dict[str, Any]:
-        return self.post("jobs/delete", payload={"job_id": job_id})
+        response = self.post("jobs/delete", payload={"job_id": job_id})
+        if self.job_index is not None:
+            self.job_index.remove(job_id)
+        return response
+
+    def build_pipeline_index(self: ApiClient) -> PipelineIndex:
+        """Index all pipelines by name with one paginated sweep and attach the index."""
+        self.pipeline_index = PipelineIndex.build(self)
+        return self.pipeline_index
 
     def get_pipeline_by_name(
         self: ApiClient, pipeline_name: str
     ) -> dict[str, Any] | None:
-        result = self.get(
-            "pipelines",
-            version="2.0",
-            # equals is not supported, so use strict like
-            params={"filter": f"name like '{pipeline_name}%'"},
-        )
-
-        pipelines: list[dict[str, Any]] = result.get("statuses", [])
-        if pipelines is None or len(pipelines) == 0:
-            return None
-        return pipelines[0]
+        """Return the pipeline named exactly pipeline_name, or None."""
+        if self.pipeline_index is not None:
+            return self.pipeline_index.get(pipeline_name)
+        # equals is not supported. A like without % only matches names of the
+        # same length, and _ may match any character, so compare exactly here.
+        escaped_name = pipeline_name.replace("'", "''")
+        pipelines = self.iter_pipelines(filter_expr=f"name like '{escaped_name}'")
+        return next((p for p in pipelines if p.get("name") == pipeline_name), None)
+
+    def get_pipeline(self: ApiClient, pipeline_id: str) -> dict[str, Any]:
+        return self.get(f"pipelines/{pipeline_id}", version="2.0")
 
     def get_pipelines(self: ApiClient) -> list[dict[str, Any]]:
-        result = self.get("pipelines", version="2.0")
-        pipeline_list: list[dict[str, Any]] = result.get("statuses", [])
-        while next_page_token := result.get("next_page_token"):
-            result = self.get(
-                "pipelines/list", version="2.0", params={"page_token": next_page_token}
-            )
-            pipeline_list.extend(result.get("statuses", []))
-        return pipeline_list
+        return list(self.iter_pipelines())
+
+    def iter_pipelines(
+        self: ApiClient,
+        page_size: int = PIPELINES_PAGE_SIZE,
+        filter_expr: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield all pipelines, or those matching filter_expr, one page at a time."""
+        params = {"max_results": str(page_size)}
+        if filter_expr:
+            params["filter"] = filter_expr
+        return self.paginate("pipelines", key="statuses", version="2.0", params=params)
 
     def delete_pipeline(self: ApiClient, pipeline_id: str) -> dict[str, Any]:
-        return self.post("pipelines/delete", payload={"pipeline_id": pipeline_id})
+        response = self.post("pipelines/delete", payload={"pipeline_id": pipeline_id})
+        if self.pipeline_index is not None:
+            self.pipeline_index.remove(pipeline_id)
+        return response
 
     def get_catalogs(self: ApiClient) -> list[dict[str, Any]]:
-        return self.get("unity-catalog/catalogs").get("catalogs", [])  # type: ignore [no-any-return]
+        return list(self.iter_catalogs())
+
+    def iter_catalogs(
+        self: ApiClient, page_size: int = UC_PAGE_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        """Yield all catalogs, fetching one page at a time."""
+        return self.paginate(
+            "unity-catalog/catalogs",
+            key="catalogs",
+            params={"max_results": str(page_size)},
+        )
 
     def get_schemas(self: ApiClient, catalog: str) -> list[dict[str, Any]]:
-        return self.get("unity-catalog/schemas", params={"catalog_name": catalog}).get(  # type: ignore [no-any-return]
-            "schemas", []
+        return list(self.iter_schemas(catalog))
+
+    def iter_schemas(
+        self: ApiClient, catalog: str, page_size: int = UC_PAGE_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        """Yield all schemas in a catalog, fetching one page at a time."""
+        return self.paginate(
+            "unity-catalog/schemas",
+            key="schemas",
+            params={"catalog_name": catalog, "max_results": str(page_size)},
         )
 
     def get_volumes(
         self: ApiClient, catalog: str, schema: str
     ) -> list[dict[str, Any]] | Any:
-        return self.get(
+        return list(self.iter_volumes(catalog, schema))
+
+    def iter_volumes(
+        self: ApiClient, catalog: str, schema: str, page_size: int = UC_PAGE_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        """Yield all volumes in a schema, fetching one page at a time."""
+        return self.paginate(
             "unity-catalog/volumes",
-            params={"catalog_name": catalog, "schema_name": schema},
-        ).get("volumes", [])
+            key="volumes",
+            params={
+                "catalog_name": catalog,
+                "schema_name": schema,
+                "max_results": str(page_size),
+            },
+        )
 
     def delete_schema(self: ApiClient, full_name: str) -> dict[str, Any]:
         return self.delete(f"unity-catalog/schemas/{full_name}")
@@ -134,10 +258,32 @@ class ApiClient:
         return self.delete(f"unity-catalog/volumes/{full_name}")
 
     def get_tables(self: ApiClient, catalog: str, schema: str) -> list[dict[str, Any]]:
-        return self.get(  # type: ignore [no-any-return]
+        return list(self.iter_tables(catalog, schema))
+
+    def iter_tables(
+        self: ApiClient,
+        catalog: str,
+        schema: str,
+        page_size: int = UC_PAGE_SIZE,
+        omit_columns: bool = False,
+        omit_properties: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield all tables in a schema, fetching one page at a time.
+
+        Set omit_columns and omit_properties when only names are needed, to
+        skip the column and property metadata of every table.
+        """
+        return self.paginate(
             "unity-catalog/tables",
-            params={"catalog_name": catalog, "schema_name": schema},
-        ).get("tables", [])
+            key="tables",
+            params={
+                "catalog_name": catalog,
+                "schema_name": schema,
+                "max_results": str(page_size),
+                "omit_columns": str(omit_columns).lower(),
+                "omit_properties": str(omit_properties).lower(),
+            },
+        )
 
     def get_dashboards(self: ApiClient) -> list[dict[str, Any]]:
         return self.get("lakeview/dashboards", version="2.0").get("dashboards", [])  # type: ignore [no-any-return]
@@ -191,7 +337,10 @@ class ApiClient:
     ) -> dict[str, Any]:
         logger.info(f"Resetting job: {job_name}")
         data = {"job_id": job_id, "new_settings": job_config}
-        return self.post("jobs/reset", payload=data)
+        response = self.post("jobs/reset", payload=data)
+        if self.job_index is not None:
+            self.job_index.set_tags(job_id, job_config.get("tags"))
+        return response
 
     def update_pipeline(
         self: ApiClient,
@@ -216,20 +365,33 @@ class ApiClient:
         self: ApiClient, job_name: str, job_config: dict[str, Any]
     ) -> dict[str, Any]:
         logger.info(f"Creating job: {job_name}")
-        return self.post("jobs/create", payload=job_config)
+        response = self.post("jobs/create", payload=job_config)
+        if self.job_index is not None:
+            self.job_index.add(
+                response["job_id"],
+                name=job_config.get("name", job_name),
+                tags=job_config.get("tags"),
+            )
+        return response
 
     def create_pipeline(
         self: ApiClient, pipeline_name: str, pipeline_config: dict[str, Any]
     ) -> dict[str, Any]:
         logger.info(f"Creating pipeline: {pipeline_name}")
         try:
-            return self.post("pipelines", payload=pipeline_config, version="2.0")
+            response = self.post("pipelines", payload=pipeline_config, version="2.0")
         except ApiClientError as e:
             logger.error(
                 "create_pipeline() ApiClientError:pipeline_config:"
                 + repr(pipeline_config)
             )
             raise e
+        if self.pipeline_index is not None:
+            self.pipeline_index.add(
+                response["pipeline_id"],
+                name=pipeline_config.get("name", pipeline_name),
+            )
+        return response
 
     def get_clusters(self: ApiClient) -> list[dict[str, Any]]:
         response = self.get("clusters/list")
@@ -241,21 +403,56 @@ class ApiClient:
     def get_repo(self: ApiClient, repo_id: str) -> dict[str, Any]:
         return self.get(f"repos/{repo_id}", version="2.0")
 
+    def iter_repos(
+        self: ApiClient, path_prefix: str | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield all repos, or those under path_prefix, one page at a time."""
+        params = {"path_prefix": path_prefix} if path_prefix else None
+        return self.paginate("repos", key="repos", version="2.0", params=params)
+
     def get_repos(self: ApiClient) -> list[dict[str, Any]]:
-        repos_response = self.get(
-            "repos", version="2.0", params={"path_prefix": "/Repos"}
-        )
-        folders_response = self.get(
-            "repos", version="2.0", params={"path_prefix": "/Users"}
-        )
-        shared_response = self.get(
-            "repos", version="2.0", params={"path_prefix": "/Shared"}
-        )
-        return (
-            repos_response.get("repos", [])
-            + folders_response.get("repos", [])
-            + shared_response.get("repos", [])
-        )  # type: ignore[no-any-return]
+        """List repos and git folders under all REPO_PATH_PREFIXES concurrently."""
+        with ThreadPoolExecutor(max_workers=len(REPO_PATH_PREFIXES)) as executor:
+            results = executor.map(
+                lambda prefix: list(self.iter_repos(prefix)), REPO_PATH_PREFIXES
+            )
+            return [repo for repos in results for repo in repos]
+
+    def find_repo(self: ApiClient, path: str) -> dict[str, Any] | None:
+        """Return the repo or git folder containing the workspace path, or None.
+
+        Only repos under the top two levels of path are listed, e.g.
+        /Repos/<user> for /Repos/<user>/<repo>/notebook, and listing stops at
+        the first repo containing path.
+        """
+        path = path.removeprefix("/Workspace")
+        parts = path.split("/")
+        if len(parts) > 2 and f"/{parts[1]}" in REPO_PATH_PREFIXES:
+            repos: Iterable[dict[str, Any]] = self.iter_repos("/".join(parts[:3]))
+        else:
+            repos = self.get_repos()
+        return next((repo for repo in repos if _contains(repo["path"], path)), None)
+
+    def paginate(
+        self: ApiClient,
+        stub: str,
+        key: str,
+        version: str = "2.1",
+        params: dict[str, str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the items under key from every page of a listing endpoint.
+
+        Pages are requested lazily, following next_page_token on the same stub,
+        so callers can filter or stop early without loading the full listing.
+        """
+        page_params = dict(params or {})
+        while True:
+            result = self.get(stub, version=version, params=page_params)
+            yield from result.get(key) or []
+            next_page_token = result.get("next_page_token")
+            if not next_page_token:
+                return
+            page_params["page_token"] = next_page_token
 
     def unpack_response(self: ApiClient, response: requests.Response) -> dict[str, Any]:
         response.raise_for_status()
@@ -263,6 +460,28 @@ class ApiClient:
         logger.debug(f"Api response: {response_json}")
         return response_json  # type: ignore [no-any-return]
 
+    def send(
+        self: ApiClient,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request through the shared session, limiter and retry policy."""
+        return transport.send(
+            self.session,
+            method,
+            url,
+            headers=self.headers,
+            limiter=self.rate_limiter,
+            policy=self.retry_policies.get(method, NO_RETRY),
+            **kwargs,
+        )
+
+    def _invalidate_cache(self: ApiClient, stub: str) -> None:
+        """Drop cached responses made stale by a successful mutating call."""
+        if self.cache is not None:
+            self.cache.invalidate(stub)
+
     def build_url(self: ApiClient, stub: str, version: str = "2.1") -> str:
         return f"{self.api_host}/api/{version}/{stub}"
 
@@ -286,14 +505,15 @@ class ApiClient:
         version: str = "2.1",
         payload: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return self.unpack_response(
-            requests.post(
-                url=self.build_url(stub, version),
-                headers=self.headers,
+        response = self.unpack_response(
+            self.send(
+                "POST",
+                self.build_url(stub, version),
                 json=payload,
-                timeout=10,
             )
         )
+        self._invalidate_cache(stub)
+        return response
 
     @error_handling("DELETE")
     def delete(
@@ -301,13 +521,14 @@ class ApiClient:
         stub: str,
         version: str = "2.1",
     ) -> dict[str, Any]:
-        return self.unpack_response(
-            requests.delete(
+        response = self.unpack_response(
+            self.send(
+                "DELETE",
                 self.build_url(stub, version),
-                headers=self.headers,
-                timeout=10,
             )
         )
+        self._invalidate_cache(stub)
+        return response
 
     @error_handling("GET")
     def get(
@@ -316,37 +537,59 @@ class ApiClient:
         version: str = "2.1",
         params: dict[str, str] | None = None,
     ) -> dict[str, Any]:
-        return self.unpack_response(
-            requests.get(
-                self.build_url(stub, version),
-                headers=self.headers,
-                params=params,
-                timeout=10,
+        cached = self.cache.get(stub, version, params) if self.cache else None
+        if cached is not None:
+            return cached
+
+        def fetch() -> dict[str, Any]:
+            response = self.unpack_response(
+                self.send(
+                    "GET",
+                    self.build_url(stub, version),
+                    params=params,
+                )
             )
+            if self.cache is not None:
+                self.cache.set(stub, version, params, response)
+            return response
+
+        if self.single_flight is None:
+            return fetch()
+        response, shared = self.single_flight.do(
+            response_key(stub, version, params), fetch
         )
+        # Callers may mutate the response, so a shared one is copied per caller
+        return copy.deepcopy(response) if shared else response
 
     @error_handling("PUT")
     def put(
         self: ApiClient, stub: str, payload: dict[str, Any], version: str = "2.1"
     ) -> dict[str, Any]:
-        return self.unpack_response(
-            requests.put(
-                url=self.build_url(stub, version),
-                headers=self.headers,
+        response = self.unpack_response(
+            self.send(
+                "PUT",
+                self.build_url(stub, version),
                 json=payload,
-                timeout=10,
             )
         )
+        self._invalidate_cache(stub)
+        return response
 
     @error_handling("PATCH")
     def patch(
         self: ApiClient, stub: str, payload: dict[str, Any], version: str = "2.1"
     ) -> dict[str, Any]:
-        return self.unpack_response(
-            requests.patch(
-                url=self.build_url(stub, version),
-                headers=self.headers,
+        response = self.unpack_response(
+            self.send(
+                "PATCH",
+                self.build_url(stub, version),
                 json=payload,
-                timeout=10,
             )
         )
+        self._invalidate_cache(stub)
+        return response
+
+
+def _contains(folder: str, path: str) -> bool:
+    """Check if path is folder or lies below it."""
+    return path == folder or path.startswith(folder.rstrip("/") + "/")
@@ -0,0 +1,340 @@
+"""Asyncio variant of the Databricks API client.
+
+AsyncApiClient exposes the same methods as ApiClient as coroutines, and the
+paginated iter_* methods as async iterators. Calls run on a dedicated thread
+pool through the regular ApiClient, so they share its pooled session, rate
+limiter, retry policies and ApiClientError error model.
+The pool has `concurrency` workers, so at most that many requests are in
+flight at the same time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from brickops.databricks.api import (
+    JOBS_PAGE_SIZE,
+    PIPELINES_PAGE_SIZE,
+    UC_PAGE_SIZE,
+    ApiClient,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator
+    from types import TracebackType
+    from typing import ParamSpec, TypeVar
+
+    from typing_extensions import Self
+
+    from brickops.databricks.index import JobIndex, PipelineIndex
+
+    Param = ParamSpec("Param")
+    RetType = TypeVar("RetType")
+
+DEFAULT_CONCURRENCY = 16
+
+
+class AsyncApiClient:
+    """Coroutine based wrapper for databricks API."""
+
+    def __init__(
+        self: AsyncApiClient,
+        host: str,
+        token: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        api_client: ApiClient | None = None,
+    ) -> None:
+        self.concurrency = concurrency
+        self.api_client = api_client or ApiClient(host, token, pool_size=concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="brickops-api"
+        )
+
+    async def __aenter__(self: Self) -> Self:
+        return self
+
+    async def __aexit__(
+        self: AsyncApiClient,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self: AsyncApiClient) -> None:
+        """Shut down the worker threads. The shared http session stays open."""
+        self._executor.shutdown(wait=False)
+
+    async def _run(
+        self: AsyncApiClient,
+        func: Callable[Param, RetType],
+        *args: Param.args,
+        **kwargs: Param.kwargs,
+    ) -> RetType:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def _iterate(
+        self: AsyncApiClient,
+        func: Callable[Param, Iterator[dict[str, Any]]],
+        *args: Param.args,
+        **kwargs: Param.kwargs,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the items of a paginated ApiClient iterator.
+
+        Each step runs in the thread pool, so pages are fetched without
+        blocking the event loop.
+        """
+        iterator = func(*args, **kwargs)
+        while (item := await self._run(next, iterator, None)) is not None:
+            yield item
+
+    async def build_job_index(self: AsyncApiClient) -> JobIndex:
+        return await self._run(self.api_client.build_job_index)
+
+    async def get_job_by_name(
+        self: AsyncApiClient, job_name: str
+    ) -> dict[str, Any] | None:
+        return await self._run(self.api_client.get_job_by_name, job_name)
+
+    async def get_job(self: AsyncApiClient, job_id: str | int) -> dict[str, Any]:
+        return await self._run(self.api_client.get_job, job_id)
+
+    async def get_jobs(self: AsyncApiClient) -> list[dict[str, Any]]:
+        return await self._run(self.api_client.get_jobs)
+
+    def iter_jobs(
+        self: AsyncApiClient,
+        page_size: int = JOBS_PAGE_SIZE,
+        expand_tasks: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self._iterate(
+            self.api_client.iter_jobs, page_size=page_size, expand_tasks=expand_tasks
+        )
+
+    async def delete_job(self: AsyncApiClient, job_id: str) -> dict[str, Any]:
+        return await self._run(self.api_client.delete_job, job_id)
+
+    async def build_pipeline_index(self: AsyncApiClient) -> PipelineIndex:
+        return await self._run(self.api_client.build_pipeline_index)
+
+    async def get_pipeline_by_name(
+        self: AsyncApiClient, pipeline_name: str
+    ) -> dict[str, Any] | None:
+        return await self._run(self.api_client.get_pipeline_by_name, pipeline_name)
+
+    async def get_pipeline(self: AsyncApiClient, pipeline_id: str) -> dict[str, Any]:
+        return await self._run(self.api_client.get_pipeline, pipeline_id)
+
+    async def get_pipelines(self: AsyncApiClient) -> list[dict[str, Any]]:
+        return await self._run(self.api_client.get_pipelines)
+
+    def iter_pipelines(
+        self: AsyncApiClient,
+        page_size: int = PIPELINES_PAGE_SIZE,
+        filter_expr: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self._iterate(
+            self.api_client.iter_pipelines, page_size=page_size, filter_expr=filter_expr
+        )
+
+    async def delete_pipeline(self: AsyncApiClient, pipeline_id: str) -> dict[str, Any]:
+        return await self._run(self.api_client.delete_pipeline, pipeline_id)
+
+    async def get_catalogs(self: AsyncApiClient) -> list[dict[str, Any]]:
+        return await self._run(self.api_client.get_catalogs)
+
+    def iter_catalogs(
+        self: AsyncApiClient, page_size: int = UC_PAGE_SIZE
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self._iterate(self.api_client.iter_catalogs, page_size=page_size)
+
+    async def get_schemas(self: AsyncApiClient, catalog: str) -> list[dict[str, Any]]:
+        return await self._run(self.api_client.get_schemas, catalog)
+
+    def iter_schemas(
+        self: AsyncApiClient, catalog: str, page_size: int = UC_PAGE_SIZE
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self._iterate(self.api_client.iter_schemas, catalog, page_size=page_size)
+
+    async def get_volumes(
+        self: AsyncApiClient, catalog: str, schema: str
+    ) -> list[dict[str, Any]] | Any:
+        return await self._run(self.api_client.get_volumes, catalog, schema)
+
+    def iter_volumes(
+        self: AsyncApiClient, catalog: str, schema: str, page_size: int = UC_PAGE_SIZE
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self._iterate(
+            self.api_client.iter_volumes, catalog, schema, page_size=page_size
+        )
+
+    async def delete_schema(self: AsyncApiClient, full_name: str) -> dict[str, Any]:
+        return await self._run(self.api_client.delete_schema, full_name)
+
+    async def delete_volume(self: AsyncApiClient, full_name: str) -> dict[str, Any]:
+        return await self._run(self.api_client.delete_volume, full_name)
+
+    async def get_tables(
+        self: AsyncApiClient,
+        catalog: str,
+        schema: str,
+        omit_columns: bool = False,
+        omit_properties: bool = False,
+    ) -> list[dict[str, Any]]:
+        return await self._run(
+            lambda: list(
+                self.api_client.iter_tables(
+                    catalog,
+                    schema,
+                    omit_columns=omit_columns,
+                    omit_properties=omit_properties,
+                )
+            )
+        )
+
+    def iter_tables(
+        self: AsyncApiClient,
+        catalog: str,
+        schema: str,
+        page_size: int = UC_PAGE_SIZE,
+        omit_columns: bool = False,
+        omit_properties: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self._iterate(
+            self.api_client.iter_tables,
+            catalog,
+            schema,
+            page_size=page_size,
+            omit_columns=omit_columns,
+            omit_properties=omit_properties,
+        )
+
+    async def get_dashboards(self: AsyncApiClient) -> list[dict[str, Any]]:
+        return await self._run(self.api_client.get_dashboards)
+
+    async def patch_permissions(
+        self: AsyncApiClient,
+        request_object_type: str,
+        request_object_id: str,
+        permission_principals: dict[str, str],
+        permission_level: str,
+    ) -> dict[str, Any]:
+        return await self._run(
+            self.api_client.patch_permissions,
+            request_object_type,
+            request_object_id,
+            permission_principals,
+            permission_level,
+        )
+
+    async def get_job_permissions(self: AsyncApiClient, job_id: str) -> dict[str, Any]:
+        return await self._run(self.api_client.get_job_permissions, job_id)
+
+    async def get_pipeline_permissions(
+        self: AsyncApiClient, pipeline_id: str
+    ) -> dict[str, Any]:
+        return await self._run(self.api_client.get_pipeline_permissions, pipeline_id)
+
+    async def delete_table(self: AsyncApiClient, full_name: str) -> dict[str, Any]:
+        return await self._run(self.api_client.delete_table, full_name)
+
+    async def run_job_now(self: AsyncApiClient, job_id: str) -> dict[str, Any]:
+        return await self._run(self.api_client.run_job_now, job_id)
+
+    async def run_pipeline_now(
+        self: AsyncApiClient, pipeline_id: str
+    ) -> dict[str, Any]:
+        return await self._run(self.api_client.run_pipeline_now, pipeline_id)
+
+    async def update_job(
+        self: AsyncApiClient, *, job_id: str, job_name: str, job_config: dict[str, Any]
+    ) -> dict[str, Any]:
+        return await self._run(
+            self.api_client.update_job,
+            job_id=job_id,
+            job_name=job_name,
+            job_config=job_config,
+        )
+
+    async def update_pipeline(
+        self: AsyncApiClient,
+        *,
+        pipeline_id: str,
+        pipeline_name: str,
+        pipeline_config: dict[str, Any],
+    ) -> dict[str, Any]:
+        return await self._run(
+            self.api_client.update_pipeline,
+            pipeline_id=pipeline_id,
+            pipeline_name=pipeline_name,
+            pipeline_config=pipeline_config,
+        )
+
+    async def create_job(
+        self: AsyncApiClient, job_name: str, job_config: dict[str, Any]
+    ) -> dict[str, Any]:
+        return await self._run(self.api_client.create_job, job_name, job_config)
+
+    async def create_pipeline(
+        self: AsyncApiClient, pipeline_name: str, pipeline_config: dict[str, Any]
+    ) -> dict[str, Any]:
+        return await self._run(
+            self.api_client.create_pipeline, pipeline_name, pipeline_config
+        )
+
+    async def get_clusters(self: AsyncApiClient) -> list[dict[str, Any]]:
+        return await self._run(self.api_client.get_clusters)
+
+    async def get_workspace_status(self: AsyncApiClient, path: str) -> dict[str, Any]:
+        return await self._run(self.api_client.get_workspace_status, path)
+
+    async def get_repo(self: AsyncApiClient, repo_id: str) -> dict[str, Any]:
+        return await self._run(self.api_client.get_repo, repo_id)
+
+    def iter_repos(
+        self: AsyncApiClient, path_prefix: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self._iterate(self.api_client.iter_repos, path_prefix)
+
+    async def get_repos(self: AsyncApiClient) -> list[dict[str, Any]]:
+        return await self._run(self.api_client.get_repos)
+
+    async def find_repo(self: AsyncApiClient, path: str) -> dict[str, Any] | None:
+        return await self._run(self.api_client.find_repo, path)
+
+    async def get(
+        self: AsyncApiClient,
+        stub: str,
+        version: str = "2.1",
+        params: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        return await self._run(self.api_client.get, stub, version, params)
+
+    async def post(
+        self: AsyncApiClient,
+        stub: str,
+        version: str = "2.1",
+        payload: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return await self._run(self.api_client.post, stub, version, payload)
+
+    async def put(
+        self: AsyncApiClient, stub: str, payload: dict[str, Any], version: str = "2.1"
+    ) -> dict[str, Any]:
+        return await self._run(self.api_client.put, stub, payload, version)
+
+    async def patch(
+        self: AsyncApiClient, stub: str, payload: dict[str, Any], version: str = "2.1"
+    ) -> dict[str, Any]:
+        return await self._run(self.api_client.patch, stub, payload, version)
+
+    async def delete(
+        self: AsyncApiClient, stub: str, version: str = "2.1"
+    ) -> dict[str, Any]:
+        return await self._run(self.api_client.delete, stub, version)
@@ -1,14 +1,34 @@
 from __future__ import annotations
 
-import inspect
+import sys
+import threading
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from types import FrameType
+
     from pyspark.sql.session import SparkSession
 
     from databricks.sdk.runtime.dbutils_stub import dbutils as dbutils_type
 
+# dbutils and spark registered with init()
+_registered: dict[str, Any] = {}
+# Last context read, and the dbutils object it was read from
+_cached_context: tuple[Any, DbContext] | None = None
+_context_lock = threading.Lock()
+
+
+def init(dbutils: dbutils_type, spark: SparkSession | None = None) -> None:
+    """Register dbutils and spark once, e.g. at the top of a notebook.
+
+    Registered objects are used instead of searching the call stack.
+    """
+    _registered["dbutils"] = dbutils
+    if spark is not None:
+        _registered["spark"] = spark
+    refresh_context()
+
 
 def current_env(db_context: DbContext | None = None) -> str:
     """Get the current environment.
@@ -27,29 +47,55 @@ def current_env(db_context: DbContext | None = None) -> str:
     return "prod"
 
 
-def get_context(dbutils: dbutils_type | None = None) -> DbContext:
+def get_context(
+    dbutils: dbutils_type | None = None, refresh: bool = False
+) -> DbContext:
+    """Return the databricks context, read once per dbutils object.
+
+    The context is cached for the process, as reading it takes several
+    round trips to the driver. Pass refresh=True, or call refresh_context(),
+    to read it again, e.g. after changing widget values.
+    """
+    global _cached_context
     if dbutils is None:
         dbutils = get_dbutils()
-    return _convert_to_data(dbutils)
+    with _context_lock:
+        if not refresh and _cached_context and _cached_context[0] is dbutils:
+            return _cached_context[1]
+    db_context = _convert_to_data(dbutils)
+    with _context_lock:
+        _cached_context = (dbutils, db_context)
+    return db_context
 
 
-def get_dbutils() -> dbutils_type:
-    """Iterate through the stack to find the dbutils object."""
-    for stack in inspect.stack():
-        if "dbutils" in stack[0].f_globals:
-            return stack[0].f_globals["dbutils"]  # type: ignore [no-any-return]
+def refresh_context() -> None:
+    """Forget the cached context, so the next get_context() reads it again."""
+    global _cached_context
+    with _context_lock:
+        _cached_context = None
 
-    msg = "dbutils not found in the stack."
-    raise RuntimeError(msg)
+
+def get_dbutils() -> dbutils_type:
+    """Return the registered dbutils, or find it in the calling frames."""
+    return _find_global("dbutils")  # type: ignore [no-any-return]
 
 
 def get_spark() -> SparkSession:
-    """Iterate through the stack to find the dbutils object."""
-    for stack in inspect.stack():
-        if "spark" in stack[0].f_globals:
-            return stack[0].f_globals["spark"]  # type: ignore [no-any-return]
+    """Return the registered spark session, or find it in the calling frames."""
+    return _find_global("spark")  # type: ignore [no-any-return]
+
+
+def _find_global(name: str) -> Any:
+    """Walk up the call stack to find name in the globals of a frame."""
+    if name in _registered:
+        return _registered[name]
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        if name in frame.f_globals:
+            return frame.f_globals[name]
+        frame = frame.f_back
 
-    msg = "spark not found in the stack."
+    msg = f"{name} not found in the stack."
     raise RuntimeError(msg)
 
 
@@ -68,6 +114,8 @@ class DbContext:
     username: str
     widgets: dict[str, str] = field(default_factory=dict)
     is_service_principal: bool = False
+    # Folder to look up .brickopscfg from, instead of the working directory
+    config_dir: str | None = None
 
     def __post_init__(self: DbContext) -> None:
         """Set up calculated fields."""
@@ -0,0 +1,163 @@
+"""In-memory name indexes of workspace resources.
+
+An index is built from one paginated listing sweep and answers name
+lookups without further API calls. ApiClient keeps an attached index up to
+date when resources are created or deleted through it.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from typing_extensions import Self
+
+    from brickops.databricks.api import ApiClient
+
+logger = logging.getLogger(__name__)
+
+
+class NameIndex:
+    """Index of resources by exact name.
+
+    Names are not unique, so a name maps to all resources carrying it, in
+    listing order, and lookups return the first one.
+    """
+
+    id_key: ClassVar[str]
+    kind: ClassVar[str]
+
+    def __init__(self: NameIndex) -> None:
+        self._by_name: dict[str, list[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_items(cls: type[Self], items: Iterable[dict[str, Any]]) -> Self:
+        index = cls()
+        for item in items:
+            index.add(item[cls.id_key], name=cls.name_of(item), tags=cls.tags_of(item))
+        logger.info(f"Indexed {len(index)} {cls.kind}")
+        return index
+
+    @staticmethod
+    def name_of(item: dict[str, Any]) -> str:
+        return item["name"]  # type: ignore [no-any-return]
+
+    @staticmethod
+    def tags_of(item: dict[str, Any]) -> dict[str, Any] | None:
+        return None
+
+    def entry(
+        self: NameIndex,
+        resource_id: str | int,
+        name: str,
+        tags: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return {self.id_key: resource_id, "name": name}
+
+    def add(
+        self: NameIndex,
+        resource_id: str | int,
+        *,
+        name: str,
+        tags: dict[str, Any] | None = None,
+    ) -> None:
+        with self._lock:
+            self._by_name.setdefault(name, []).append(
+                self.entry(resource_id, name, tags)
+            )
+
+    def set_tags(
+        self: NameIndex, resource_id: str | int, tags: dict[str, Any] | None
+    ) -> None:
+        """Replace the tags of the resource with resource_id, if indexed."""
+        with self._lock:
+            for name, items in self._by_name.items():
+                self._by_name[name] = [
+                    self.entry(item[self.id_key], name, tags)
+                    if str(item[self.id_key]) == str(resource_id)
+                    else item
+                    for item in items
+                ]
+
+    def remove(self: NameIndex, resource_id: str | int) -> None:
+        """Remove the resource with resource_id, if indexed."""
+        with self._lock:
+            for name, items in list(self._by_name.items()):
+                remaining = [
+                    item for item in items if str(item[self.id_key]) != str(resource_id)
+                ]
+                if len(remaining) == len(items):
+                    continue
+                if remaining:
+                    self._by_name[name] = remaining
+                else:
+                    del self._by_name[name]
+
+    def get(self: NameIndex, name: str) -> dict[str, Any] | None:
+        """Return the first resource with the given name, or None."""
+        with self._lock:
+            items = self._by_name.get(name)
+            return copy.deepcopy(items[0]) if items else None
+
+    def __contains__(self: NameIndex, name: object) -> bool:
+        return name in self._by_name
+
+    def __len__(self: NameIndex) -> int:
+        return sum(len(items) for items in self._by_name.values())
+
+
+class JobIndex(NameIndex):
+    """Index of jobs by name.
+
+    Entries have the same shape as jobs/list items, reduced to job_id,
+    settings.name and settings.tags.
+    """
+
+    id_key = "job_id"
+    kind = "jobs"
+
+    @classmethod
+    def build(cls: type[JobIndex], api_client: ApiClient) -> JobIndex:
+        """Build the index from a single sweep over jobs/list."""
+        return cls.from_items(api_client.iter_jobs())
+
+    @staticmethod
+    def name_of(item: dict[str, Any]) -> str:
+        return item["settings"]["name"]  # type: ignore [no-any-return]
+
+    @staticmethod
+    def tags_of(item: dict[str, Any]) -> dict[str, Any] | None:
+        return item["settings"].get("tags")  # type: ignore [no-any-return]
+
+    def entry(
+        self: JobIndex,
+        resource_id: str | int,
+        name: str,
+        tags: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        settings: dict[str, Any] = {"name": name}
+        if tags is not None:
+            settings["tags"] = dict(tags)
+        return {"job_id": resource_id, "settings": settings}
+
+
+class PipelineIndex(NameIndex):
+    """Index of pipelines by name.
+
+    Entries have the same shape as pipelines listing items, reduced to
+    pipeline_id and name. The listing has no tags, so none are kept.
+    """
+
+    id_key = "pipeline_id"
+    kind = "pipelines"
+
+    @classmethod
+    def build(cls: type[PipelineIndex], api_client: ApiClient) -> PipelineIndex:
+        """Build the index from a single sweep over the pipelines listing."""
+        return cls.from_items(api_client.iter_pipelines())
@@ -0,0 +1,103 @@
+"""Opt-in cache for read-only Databricks API responses.
+
+Pass a ResponseCache to ApiClient to cache GET responses, keyed on stub,
+API version and query parameters. Each endpoint can have its own time to
+live, and a successful mutating call drops all cached responses of the same
+resource family, e.g. a POST to jobs/reset invalidates cached jobs/list
+responses.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Any
+
+from brickops.cache import TTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from brickops.cache import CacheStats
+
+ResponseKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+# Time to live in seconds per stub prefix. The longest matching prefix wins.
+DEFAULT_TTLS: Mapping[str, float] = {
+    "clusters/list": 300.0,
+    "repos": 60.0,
+    "unity-catalog/catalogs": 300.0,
+}
+
+# Families spanning two path segments, e.g. unity-catalog/tables
+_NESTED_FAMILIES = {"unity-catalog", "permissions"}
+
+
+class ResponseCache:
+    """TTL and LRU bound cache of parsed GET responses."""
+
+    def __init__(
+        self: ResponseCache,
+        maxsize: int = 512,
+        default_ttl: float = 60.0,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        self.default_ttl = default_ttl
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._cache: TTLCache[ResponseKey, dict[str, Any]] = TTLCache(maxsize=maxsize)
+
+    def get(
+        self: ResponseCache,
+        stub: str,
+        version: str,
+        params: Mapping[str, str] | None,
+    ) -> dict[str, Any] | None:
+        """Return a copy of the cached response, or None on a miss."""
+        response = self._cache.get(response_key(stub, version, params))
+        return None if response is None else copy.deepcopy(response)
+
+    def set(
+        self: ResponseCache,
+        stub: str,
+        version: str,
+        params: Mapping[str, str] | None,
+        response: dict[str, Any],
+    ) -> None:
+        """Store a copy of response, unless the endpoint ttl is zero."""
+        ttl = self.ttl_for(stub)
+        if ttl <= 0:
+            return
+        self._cache.set(
+            response_key(stub, version, params), copy.deepcopy(response), ttl=ttl
+        )
+
+    def ttl_for(self: ResponseCache, stub: str) -> float:
+        matches = [prefix for prefix in self.ttls if stub.startswith(prefix)]
+        if not matches:
+            return self.default_ttl
+        return self.ttls[max(matches, key=len)]
+
+    def invalidate(self: ResponseCache, stub: str) -> int:
+        """Drop cached responses in the resource family of stub."""
+        family = resource_family(stub)
+        return self._cache.invalidate(lambda key: resource_family(key[0]) == family)
+
+    def clear(self: ResponseCache) -> None:
+        self._cache.clear()
+
+    def stats(self: ResponseCache) -> CacheStats:
+        """Return hit and miss counters."""
+        return self._cache.stats()
+
+
+def response_key(
+    stub: str, version: str, params: Mapping[str, str] | None
+) -> ResponseKey:
+    return (stub, version, tuple(sorted((params or {}).items())))
+
+
+def resource_family(stub: str) -> str:
+    """Return the resource family of a stub, e.g. jobs for jobs/reset."""
+    parts = stub.split("/")
+    if parts[0] in _NESTED_FAMILIES and len(parts) > 1:
+        return "/".join(parts[:2])
+    return parts[0]
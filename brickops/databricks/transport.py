@@ -0,0 +1,311 @@
+"""Shared HTTP transport for the Databricks API client.
+
+Every ApiClient for the same host and token reuses one pooled, keep-alive
+requests.Session, so repeated calls skip the TCP and TLS handshake.
+Requests are paced by a token bucket shared by all clients of a host, and
+throttled or transiently failing calls are retried according to a
+RetryPolicy per HTTP verb. Identical GETs in flight at the same time are
+coalesced into one request through a SingleFlight group.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RATE = 20.0  # requests per second per host
+DEFAULT_BURST = 20
+DEFAULT_TIMEOUT = 10
+HTTP_TOO_MANY_REQUESTS = 429
+
+_TOKEN_EPSILON = 1e-9
+
+_sessions: dict[tuple[str, str], requests.Session] = {}
+_pool_sizes: dict[tuple[str, str], int] = {}
+_sessions_lock = threading.Lock()
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+_flights: dict[tuple[str, str], SingleFlight[Any]] = {}
+_flights_lock = threading.Lock()
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry settings for one HTTP verb.
+
+    Delays use exponential backoff with full jitter, unless the server
+    sends a Retry-After header, which is honoured up to max_retry_after.
+    """
+
+    max_attempts: int = 5
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    max_retry_after: float = 120.0
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 500, 502, 503, 504})
+    )
+    retry_on_connection_error: bool = True
+
+    def backoff(self: RetryPolicy, attempt: int) -> float:
+        """Return a jittered delay in seconds before retry number attempt + 1."""
+        ceiling = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, ceiling)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+# Only idempotent verbs are retried by default. POST and PATCH can be
+# opted in per client, e.g. ApiClient(..., retry_policies={"POST": RetryPolicy()}).
+DEFAULT_RETRY_POLICIES: Mapping[str, RetryPolicy] = {
+    "GET": RetryPolicy(),
+    "PUT": RetryPolicy(),
+    "DELETE": RetryPolicy(),
+    "POST": NO_RETRY,
+    "PATCH": NO_RETRY,
+}
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    A pause, e.g. after a 429 response, holds back every caller sharing the
+    limiter, so parallel workers slow down together instead of all retrying
+    at the same moment.
+    """
+
+    def __init__(
+        self: RateLimiter, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self: RateLimiter) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1 - _TOKEN_EPSILON:
+                        self._tokens = max(self._tokens - 1, 0.0)
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self: RateLimiter, seconds: float) -> None:
+        """Hold back all callers for at least the given number of seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def _refill(self: RateLimiter, now: float) -> None:
+        elapsed = max(now - max(self._updated, self._paused_until), 0.0)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated = now
+
+
+class _Call(Generic[T]):
+    def __init__(self: _Call[T]) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function. Callers arriving while it
+    is in flight wait and share its result or exception.
+    """
+
+    def __init__(self: SingleFlight[T]) -> None:
+        self._calls: dict[Hashable, _Call[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(
+        self: SingleFlight[T], key: Hashable, func: Callable[[], T]
+    ) -> tuple[T, bool]:
+        """Return func's result and whether it was shared with another caller.
+
+        A shared result is the same object for every caller, so callers that
+        mutate it should copy it first.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True  # type: ignore [return-value]
+        try:
+            call.result = func()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                shared = call.waiters > 0
+            call.done.set()
+        return call.result, shared
+
+
+def get_session(
+    host: str, token: str, pool_size: int = DEFAULT_POOL_SIZE
+) -> requests.Session:
+    """Return the process-wide session for (host, token), creating it if needed.
+
+    The connection pool of the session grows to the largest pool_size asked
+    for, so a concurrent caller keeps its connections alive even if a client
+    with a smaller pool created the session.
+    """
+    key = (host, token)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            logger.debug(f"Creating http session for {host} (pool_size={pool_size})")
+            session = requests.Session()
+            _sessions[key] = session
+        elif pool_size <= _pool_sizes[key]:
+            return session
+        else:
+            logger.debug(f"Growing http pool for {host} to {pool_size}")
+        _mount_adapter(session, pool_size)
+        _pool_sizes[key] = pool_size
+        return session
+
+
+def get_rate_limiter(
+    host: str, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST
+) -> RateLimiter:
+    """Return the process-wide rate limiter for host, creating it if needed.
+
+    rate and burst only take effect when the limiter is first created.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(rate=rate, burst=burst)
+            _limiters[host] = limiter
+        return limiter
+
+
+def get_single_flight(host: str, token: str) -> SingleFlight[Any]:
+    """Return the process-wide single-flight group for (host, token)."""
+    key = (host, token)
+    with _flights_lock:
+        flight = _flights.get(key)
+        if flight is None:
+            flight = SingleFlight()
+            _flights[key] = flight
+        return flight
+
+
+def send(
+    session: requests.Session,
+    method: str,
+    url: str,
+    *,
+    limiter: RateLimiter,
+    policy: RetryPolicy,
+    **kwargs: Any,
+) -> requests.Response:
+    """Send a request, retrying throttled and transient failures per policy.
+
+    The last response is returned when retries are exhausted, so the caller
+    decides how to report the error.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    attempt = 1
+    while True:
+        limiter.acquire()
+        try:
+            response = session.request(method, url, **kwargs)
+        except (RequestsConnectionError, Timeout) as err:
+            if not policy.retry_on_connection_error or attempt >= policy.max_attempts:
+                raise
+            delay = policy.backoff(attempt - 1)
+            reason = repr(err)
+        else:
+            if (
+                response.status_code not in policy.retry_statuses
+                or attempt >= policy.max_attempts
+            ):
+                return response
+            retry_after = parse_retry_after(response)
+            if retry_after is None:
+                delay = policy.backoff(attempt - 1)
+            else:
+                delay = min(retry_after, policy.max_retry_after)
+            if response.status_code == HTTP_TOO_MANY_REQUESTS:
+                limiter.pause(delay)
+            reason = f"HTTP {response.status_code}"
+        logger.warning(
+            f"{method} {url} failed with {reason}, "
+            f"retry {attempt}/{policy.max_attempts - 1} in {delay:.2f}s"
+        )
+        time.sleep(delay)
+        attempt += 1
+
+
+def parse_retry_after(response: requests.Response) -> float | None:
+    """Return the Retry-After header in seconds, or None if absent or invalid."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def close_sessions() -> None:
+    """Close and forget all shared sessions."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _pool_sizes.clear()
+
+
+def _mount_adapter(session: requests.Session, pool_size: int) -> None:
+    # Requests in flight finish on the replaced adapter, which is not closed
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
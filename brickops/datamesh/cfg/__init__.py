@@ -1,49 +1,107 @@
-import yaml
 import logging
+import threading
 
-from functools import cache
 from pathlib import Path
 from typing import Any
 
+from brickops.yamlutils import read_yaml
+
 logger = logging.getLogger(__name__)
 
+# Parsed configs by config path, with the (mtime, size) they were read at
+_configs: dict[Path, tuple[tuple[int, int] | None, Any]] = {}
+# Config path, or None if there is none, for each directory looked up
+_config_paths: dict[Path, Path | None] = {}
+_lock = threading.Lock()
+
+
+def get_config(
+    key: str, default: str | None = None, start_dir: str | Path | None = None
+) -> Any | None:
+    """Get a specific configuration value from the config file.
 
-def get_config(key: str, default: str | None = None) -> Any | None:
-    """Get a specific configuration value from the config file."""
-    config = read_config()
+    The config file is looked up from start_dir, see find_config().
+    """
+    config = read_config(start_dir)
     if config is None:
         return None
     return config.get(key, None)
 
 
-@cache
-def read_config() -> dict[Any, Any] | None:
-    """Read the configuration from the YAML file."""
+def read_config(start_dir: str | Path | None = None) -> dict[Any, Any] | None:
+    """Read the configuration from the YAML file found from start_dir.
+
+    The parsed config is cached per config path, and parsed again when the
+    file's modification time or size changes. Use clear_config_cache() to
+    forget cached configs and config locations.
+    """
     # Define the path to the config file
-    config_path = find_config()
+    config_path = find_config(start_dir)
     if not config_path:
         return None
-    return _read_yaml(config_path)
+    return _read_cached_yaml(config_path)
 
 
-def find_config() -> Path | None:
+def clear_config_cache() -> None:
+    """Forget parsed configs and config locations."""
+    with _lock:
+        _configs.clear()
+        _config_paths.clear()
+
+
+def find_config(start_dir: str | Path | None = None) -> Path | None:
     """
-    Look for a .brickopscfg folder in the current directory and each parent
-    directory until reaching the system root or encountering an error.
+    Look for a .brickopscfg folder in start_dir, by default the current
+    directory, and each parent directory until reaching the system root or
+    encountering an error.
     We cannot use .git folder to find root of repo, since it is not available in Databricks.
 
+    The result is remembered for every directory visited, also when no config
+    is found, so later lookups from the same directories do not walk again.
+
     Returns:
         Path: The full path to the first .brickopscfg folder found, or None if not found.
     """
-    current_dir = Path.cwd()
+    start_dir = Path(start_dir) if start_dir is not None else Path.cwd()
+    with _lock:
+        if start_dir in _config_paths:
+            return _config_paths[start_dir]
+    visited = []
+    config_path = None
+    current_dir = start_dir
     while str(current_dir) != current_dir.root:
+        with _lock:
+            if current_dir in _config_paths:
+                config_path = _config_paths[current_dir]
+                break
+        visited.append(current_dir)
         config_dir = current_dir / ".brickopscfg"
         if config_dir.exists():
-            return config_dir / "config.yml"
+            config_path = config_dir / "config.yml"
+            break
         current_dir = current_dir.parent
-    return None
+    with _lock:
+        for folder in visited:
+            _config_paths[folder] = config_path
+    return config_path
+
+
+def _read_cached_yaml(config_path: Path) -> Any | None:
+    """Return the parsed config, reading the file only if it changed."""
+    try:
+        stat = config_path.stat()
+        stamp: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = None
+    with _lock:
+        cached = _configs.get(config_path)
+    if cached is not None and (stamp is None or cached[0] == stamp):
+        return cached[1]
+    config = _read_yaml(config_path)
+    with _lock:
+        _configs[config_path] = (stamp, config)
+    return config
 
 
 def _read_yaml(config_path: Path) -> Any | None:
-    with config_path.open("r") as file:
-        return yaml.safe_load(file)
+    return read_yaml(config_path)
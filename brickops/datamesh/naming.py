@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import dataclasses
+import json
+import logging
+import os
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from brickops.cache import TTLCache
 from brickops.databricks.context import current_env, get_context
+from brickops.databricks.transport import SingleFlight
 from brickops.databricks.username import get_username
-from brickops.dataops.deploy.repo import git_source
+from brickops.diskcache import get_disk_cache
+from brickops.dataops.deploy.repo import GIT_SOURCE_TTL, git_source
 from brickops.gitutils import clean_branch, commit_shortref
 from brickops.datamesh.parsepath.extractname import (
     extract_name_from_path,
@@ -13,7 +21,35 @@ from brickops.datamesh.parsepath.extractname import PipelineContext
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from brickops.databricks.context import DbContext
+    from brickops.diskcache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Environment variables carrying git info, e.g. set by a CI runner
+GIT_ENV_VARS = {
+    "git_url": "BRICKOPS_GIT_URL",
+    "git_branch": "BRICKOPS_GIT_BRANCH",
+    "git_commit": "BRICKOPS_GIT_COMMIT",
+    "git_path": "BRICKOPS_GIT_PATH",
+}
+# Path of a JSON file with git_url, git_branch, git_commit and git_path
+GIT_SOURCE_FILE_ENV_VAR = "BRICKOPS_GIT_SOURCE_FILE"
+# Set to 1/true/yes to never ask the repos api for git info
+OFFLINE_ENV_VAR = "BRICKOPS_OFFLINE"
+
+# Git fields needed to compose names
+_REQUIRED_GIT_FIELDS = ("git_branch", "git_commit")
+
+# (notebook_path, env, username, git_url, git_branch, git_commit, git_path, api_url)
+ContextKey = tuple[str, str, str, str, str, str, str, str]
+
+_GIT_WIDGETS = ("git_url", "git_branch", "git_commit", "git_path")
+
+_pipeline_contexts: TTLCache[ContextKey, PipelineContext] = TTLCache(maxsize=256)
+_pipeline_context_flight: SingleFlight[PipelineContext] = SingleFlight()
 
 
 def tablename(
@@ -31,26 +67,92 @@ def tablename(
     Cat is the Unity Catalog catalog name.
     
     db can either be a <catalog>.<db> path or a simply the database name.
+
+    Use tablenames() or a NamingSession to name many tables at once.
     """
     # Get dbutils from calling module, as databricks lib not available in UC cluster
+    _check_name(tbl=tbl, db=db)
+    session = NamingSession(cat=cat, env=env, db_context=db_context)
+    return session.tablename(tbl=tbl, db=db)
+
+
+def tablenames(
+    tbls: Iterable[str | tuple[str, str]],
+    db: str | None = None,
+    cat: str | None = None,
+    env: str | None = None,
+    db_context: DbContext | None = None,
+) -> list[str]:
+    """Return table names for many tables, in the order given.
+
+    Items of tbls are either table names in db, or (db, tbl) pairs. The
+    context, env, catalog and db prefix are resolved once for all tables,
+    e.g.
+
+    tablenames(["orders", "customers", ("raw", "events")], db="sales")
+    """
+    session = NamingSession(cat=cat, env=env, db_context=db_context)
+    return session.tablenames(tbls, db=db)
+
+
+class NamingSession:
+    """Naming context resolved once, for deriving many names.
+
+    The db context, env and catalog are resolved when the session is created,
+    like in tablename(), and database names are reused per db.
+    """
+
+    def __init__(
+        self: NamingSession,
+        cat: str | None = None,
+        env: str | None = None,
+        db_context: DbContext | None = None,
+    ) -> None:
+        self.db_context = db_context or get_context()
+        self.env = env or current_env(self.db_context)
+        self.cat = cat or catname_from_path(db_context=self.db_context, env=self.env)
+        self._dbnames: dict[str, str] = {}
+
+    def dbname(self: NamingSession, db: str) -> str:
+        """Return the database name for db, see dbname()."""
+        if "." in db:
+            return db
+        db_name = self._dbnames.get(db)
+        if db_name is None:
+            db_name = dbname(
+                db=db, cat=self.cat, db_context=self.db_context, env=self.env
+            )
+            self._dbnames[db] = db_name
+        return db_name
+
+    def tablename(self: NamingSession, tbl: str, db: str) -> str:
+        """Return the table name for tbl in db, see tablename()."""
+        _check_name(tbl=tbl, db=db)
+        return _escape_sql_name(f"{self.dbname(db)}.{tbl}")
+
+    def tablenames(
+        self: NamingSession,
+        tbls: Iterable[str | tuple[str, str]],
+        db: str | None = None,
+    ) -> list[str]:
+        """Return names for table names in db or (db, tbl) pairs, in order."""
+        names = []
+        for item in tbls:
+            if isinstance(item, str):
+                tbl_db, tbl = db or "", item
+            else:
+                tbl_db, tbl = item
+            names.append(self.tablename(tbl=tbl, db=tbl_db))
+        return names
+
+
+def _check_name(*, tbl: str, db: str) -> None:
     if not tbl:
         msg = "tbl must be a non-empty string"
         raise ValueError(msg)
     if not db:
         msg = "db must be a non-empty string"
         raise ValueError(msg)
-    if not db_context:
-        db_context = get_context()
-    if not env:
-        env = current_env(db_context)
-    if not cat:
-        cat = catname_from_path(db_context=db_context, env=env)
-
-    if "." not in db:
-        db_name = dbname(db=db, cat=cat, db_context=db_context, env=env)
-    else:
-        db_name = db
-    return _escape_sql_name(f"{db_name}.{tbl}")
 
 
 def name_from_path(*, resource: str, db_context: DbContext, env: str) -> str:
@@ -77,6 +179,7 @@ def name_from_path(*, resource: str, db_context: DbContext, env: str) -> str:
             path=nb_path,
             resource=resource,
             pipeline_context=pipeline_context,
+            config_dir=db_context.config_dir,
         )
     )
 
@@ -107,7 +210,11 @@ def dbname(
     nb_path = db_context.notebook_path
     pipeline_context = _get_pipeline_context(db_context, env=env)
     db_only = extract_name_from_path(
-        path=nb_path, resource="db", resource_name=db, pipeline_context=pipeline_context
+        path=nb_path,
+        resource="db",
+        resource_name=db,
+        pipeline_context=pipeline_context,
+        config_dir=db_context.config_dir,
     )
     name = db_only
     if prepend_cat:
@@ -120,24 +227,67 @@ build_table_name = tablename
 
 
 def _git_src(db_context: DbContext) -> dict[str, Any]:
-    """Get git src params from either task params or repos api.
+    """Get git src params, checking the cheap sources first.
 
-    Widget parameters take precedence over repos api.
+    Each field is taken from the first source that has it: widget parameters,
+    BRICKOPS_GIT_* environment variables, the JSON file named by
+    BRICKOPS_GIT_SOURCE_FILE and finally the repos api. The repos api is only
+    called when git_branch or git_commit is still missing, and never in
+    offline mode (BRICKOPS_OFFLINE=1), which raises instead.
     """
-    git_data = git_source(db_context)
-    git_data_from_widgets = _git_src_from_widget_params(db_context)
-    return git_data | git_data_from_widgets
+    git_data: dict[str, Any] = {}
+    for source in (
+        _git_src_from_widget_params,
+        _git_src_from_env,
+        _git_src_from_file,
+    ):
+        git_data = source(db_context) | git_data
+        if _has_required_git_fields(git_data):
+            return git_data
+    if _is_offline():
+        missing = [key for key in _REQUIRED_GIT_FIELDS if not git_data.get(key)]
+        msg = (
+            f"Offline mode ({OFFLINE_ENV_VAR}) is on, but {', '.join(missing)} "
+            "not found in widgets, environment variables or git source file."
+        )
+        raise RuntimeError(msg)
+    return git_source(db_context) | git_data
 
 
 def _git_src_from_widget_params(db_context: DbContext) -> dict[str, Any]:
-    """TODO: document why this function is needed"""
-    widget_data = {
-        "git_url": db_context.widgets.get("git_url"),
-        "git_branch": db_context.widgets.get("git_branch"),
-        "git_commit": db_context.widgets.get("git_commit"),
-        "git_path": db_context.widgets.get("git_path"),
-    }
-    return {k: v for k, v in widget_data.items() if v is not None}
+    """Git info passed as job parameters, see build_context_parameters()."""
+    return _non_empty({key: db_context.widgets.get(key) for key in GIT_ENV_VARS})
+
+
+def _git_src_from_env(db_context: DbContext) -> dict[str, Any]:
+    return _non_empty({key: os.environ.get(var) for key, var in GIT_ENV_VARS.items()})
+
+
+def _git_src_from_file(db_context: DbContext) -> dict[str, Any]:
+    path = os.environ.get(GIT_SOURCE_FILE_ENV_VAR)
+    if not path:
+        return {}
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        logger.warning(f"Could not read git source file {path}")
+        return {}
+    if not isinstance(data, dict):
+        logger.warning(f"Git source file {path} does not contain a json object")
+        return {}
+    return _non_empty({key: data.get(key) for key in GIT_ENV_VARS})
+
+
+def _non_empty(data: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in data.items() if v}
+
+
+def _has_required_git_fields(git_data: dict[str, Any]) -> bool:
+    return all(git_data.get(key) for key in _REQUIRED_GIT_FIELDS)
+
+
+def _is_offline() -> bool:
+    return os.environ.get(OFFLINE_ENV_VAR, "").lower() in {"1", "true", "yes"}
 
 
 def catname_from_path(
@@ -167,6 +317,7 @@ def catname_from_path(
             path=nb_path,
             resource="catalog",
             pipeline_context=pipeline_context,
+            config_dir=db_context.config_dir,
         )
     )
 
@@ -195,6 +346,7 @@ def jobname(db_context: DbContext, env: str) -> str:
             path=nb_path,
             resource="job",
             pipeline_context=pipeline_context,
+            config_dir=db_context.config_dir,
         )
     )
 
@@ -223,23 +375,112 @@ def pipelinename(db_context: DbContext, env: str) -> str:
             path=nb_path,
             resource="pipeline",
             pipeline_context=pipeline_context,
+            config_dir=db_context.config_dir,
         )
     )
 
 
 def _get_pipeline_context(db_context: DbContext, env: str) -> PipelineContext:
     """Get pipeline context from databricks context and env.
-    It is used to derive correct name in extract_name_from_path()."""
-    git_src = _git_src(db_context)
-    pipeline_context = PipelineContext(
-        username=get_username(db_context),
-        gitbranch=clean_branch(git_src["git_branch"]),
-        gitshortref=commit_shortref(git_src["git_commit"]),
-        env=env,
+    It is used to derive correct name in extract_name_from_path().
+
+    The context is resolved once per notebook path, env, username, git widget
+    parameters and workspace, and then reused, see set_pipeline_context_ttl()
+    and clear_pipeline_contexts(). Concurrent callers with the same key share
+    one resolution. If BRICKOPS_CACHE_DIR is set, contexts are also shared
+    with other processes through the disk cache, see brickops.diskcache.
+
+    Contexts not pinned by git_branch and git_commit widget parameters
+    follow the checked out branch, e.g. of an interactive Git folder, and
+    are reused for at most GIT_SOURCE_TTL seconds, also from the disk
+    cache, like the git source they are resolved from.
+    """
+    key = _pipeline_context_key(db_context, env)
+    pipeline_context = _pipeline_contexts.get(key)
+    if pipeline_context is not None:
+        return pipeline_context
+    pipeline_context, _ = _pipeline_context_flight.do(
+        key, lambda: _resolve_pipeline_context(key, db_context, env)
     )
     return pipeline_context
 
 
+def _resolve_pipeline_context(
+    key: ContextKey, db_context: DbContext, env: str
+) -> PipelineContext:
+    disk_cache = get_disk_cache()
+    ttl = _pipeline_context_ttl(key)
+    pipeline_context = _stored_pipeline_context(disk_cache, key)
+    if pipeline_context is None:
+        git_src = _git_src(db_context)
+        pipeline_context = PipelineContext(
+            username=get_username(db_context),
+            gitbranch=clean_branch(git_src["git_branch"]),
+            gitshortref=commit_shortref(git_src["git_commit"]),
+            env=env,
+        )
+        if disk_cache:
+            disk_ttl = disk_cache.ttl if ttl is None else min(disk_cache.ttl, ttl)
+            disk_cache.set(
+                "pipeline_context", key, dataclasses.asdict(pipeline_context), disk_ttl
+            )
+    _pipeline_contexts.set(key, pipeline_context, ttl=ttl)
+    return pipeline_context
+
+
+def _pipeline_context_ttl(key: ContextKey) -> float | None:
+    """Bound the reuse of contexts not pinned to a branch and commit."""
+    ttl = _pipeline_contexts.ttl
+    _, _, _, _, git_branch, git_commit, _, _ = key
+    if git_branch and git_commit:
+        return ttl
+    return GIT_SOURCE_TTL if ttl is None else min(ttl, GIT_SOURCE_TTL)
+
+
+def _stored_pipeline_context(
+    disk_cache: DiskCache | None, key: ContextKey
+) -> PipelineContext | None:
+    stored = disk_cache.get("pipeline_context", key) if disk_cache else None
+    if stored is None:
+        return None
+    try:
+        return PipelineContext(**stored)
+    except TypeError:  # Written by another brickops version
+        return None
+
+
+def _pipeline_context_key(db_context: DbContext, env: str) -> ContextKey:
+    git_url, git_branch, git_commit, git_path = (
+        db_context.widgets.get(name) or "" for name in _GIT_WIDGETS
+    )
+    return (
+        db_context.notebook_path,
+        env,
+        db_context.username,
+        git_url,
+        git_branch,
+        git_commit,
+        git_path,
+        db_context.api_url,
+    )
+
+
+def set_pipeline_context_ttl(ttl: float | None) -> None:
+    """Set how many seconds a resolved pipeline context is reused.
+
+    None, the default, keeps contexts pinned by git widget parameters for
+    the lifetime of the process, and others for GIT_SOURCE_TTL seconds.
+    Contexts resolved so far are dropped.
+    """
+    _pipeline_contexts.ttl = ttl
+    _pipeline_contexts.clear()
+
+
+def clear_pipeline_contexts() -> None:
+    """Forget resolved pipeline contexts, e.g. after switching git branch."""
+    _pipeline_contexts.clear()
+
+
 def _escape_sql_name(name: str) -> str:
     parts = name.split(".")
     return ".".join(
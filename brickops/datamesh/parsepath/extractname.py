@@ -1,5 +1,8 @@
+import functools
 import logging
 import re
+import string
+from collections.abc import Callable
 from typing import Any
 from dataclasses import dataclass
 from brickops.datamesh.cfg import get_config
@@ -8,7 +11,7 @@ from brickops.datamesh.parsepath.parse import parsepath, ParsedPath
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class PipelineContext:
     username: str
     gitbranch: str
@@ -22,8 +25,16 @@ def extract_name_from_path(
     resource: str,
     pipeline_context: PipelineContext,
     resource_name: str | None = None,
+    config_dir: str | None = None,
 ) -> str:
-    naming_config = _get_naming_config(resource=resource, env=pipeline_context.env)
+    """Compose the name of a resource from path and the naming config.
+
+    The naming config is read from the .brickopscfg found from config_dir,
+    by default the current directory.
+    """
+    naming_config = _get_naming_config(
+        resource=resource, env=pipeline_context.env, config_dir=config_dir
+    )
     parsed_path = parsepath(path)
     if not parsed_path:
         return ""
@@ -47,35 +58,89 @@ def _compose_name(
 
     Example naming_config string: "{env}_{username}_{gitbranch}_{gitref}_{db}"
     """
-    # Create a dictionary with all possible variables
-    format_dict = {
-        "org": parsed_path.org if parsed_path.org else "",
-        "domain": parsed_path.domain,
-        "project": parsed_path.project,
-        "activity": parsed_path.activity if parsed_path.activity else "",
-        "flowtype": parsed_path.flowtype,
-        "flow": parsed_path.flow,
-        "env": pipeline_context.env,
-        "username": pipeline_context.username,
-        "gitbranch": pipeline_context.gitbranch,
-        "gitshortref": pipeline_context.gitshortref,
-        resource: resource_name,
-    }
-    logger.info("extractname.py:" + repr(61) + ":naming_config:" + repr(naming_config))
-    # Replace the variables in the template with actual values
-    return naming_config.format(**format_dict)
-
-
-def _get_naming_config(resource: str, env: str) -> str:
+    return compile_naming_config(resource, naming_config).render(
+        parsed_path=parsed_path,
+        pipeline_context=pipeline_context,
+        resource_name=resource_name,
+    )
+
+
+# Values available to naming configs, besides the resource name itself
+FIELDS: dict[str, Callable[[ParsedPath, PipelineContext], str]] = {
+    "org": lambda path, _: path.org or "",
+    "domain": lambda path, _: path.domain,
+    "project": lambda path, _: path.project,
+    "activity": lambda path, _: path.activity or "",
+    "flowtype": lambda path, _: path.flowtype,
+    "flow": lambda path, _: path.flow,
+    "env": lambda _, ctx: ctx.env,
+    "username": lambda _, ctx: ctx.username,
+    "gitbranch": lambda _, ctx: ctx.gitbranch,
+    "gitshortref": lambda _, ctx: ctx.gitshortref,
+}
+
+
+@dataclass(frozen=True)
+class NamingTemplate:
+    """A validated naming config, knowing which fields it needs."""
+
+    resource: str
+    template: str
+    fields: tuple[str, ...]
+
+    def render(
+        self: "NamingTemplate",
+        *,
+        parsed_path: ParsedPath,
+        pipeline_context: PipelineContext,
+        resource_name: str | None,
+    ) -> str:
+        values = {
+            field: (
+                resource_name
+                if field == self.resource
+                else FIELDS[field](parsed_path, pipeline_context)
+            )
+            for field in self.fields
+        }
+        return self.template.format(**values)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_naming_config(resource: str, naming_config: str) -> NamingTemplate:
+    """Validate a naming config once and return a reusable template.
+
+    Raises ValueError for invalid characters and unknown placeholders.
+    """
+    _validate_naming_config(naming_config)
+    fields = tuple(
+        dict.fromkeys(
+            field
+            for _, field, _, _ in string.Formatter().parse(naming_config)
+            if field is not None
+        )
+    )
+    unknown = [field for field in fields if field not in FIELDS and field != resource]
+    if unknown:
+        msg = (
+            f"Invalid naming config '{naming_config}' for {resource}. "
+            f"Unknown placeholders: {', '.join(repr(field) for field in unknown)}."
+        )
+        raise ValueError(msg)
+    logger.debug(f"Compiled naming config {naming_config!r} for {resource}")
+    return NamingTemplate(resource=resource, template=naming_config, fields=fields)
+
+
+def _get_naming_config(resource: str, env: str, config_dir: str | None = None) -> str:
     """Get the naming configuration for the given resource."""
-    config = _get_nested_config("naming", resource)
+    config = _get_nested_config("naming", resource, config_dir=config_dir)
     if not config:
         config = DEFAULT_CONFIGS[resource]
     if env in config:
         config_str = config[env]
     else:  # Use default 'other' config if env not specified
         config_str = config["other"]
-    _validate_naming_config(config_str)
+    compile_naming_config(resource, config_str)
     return config_str
 
 
@@ -89,9 +154,11 @@ def _validate_naming_config(config: str) -> None:
         )
 
 
-def _get_nested_config(key: str, resource: str) -> Any | None:
+def _get_nested_config(
+    key: str, resource: str, config_dir: str | None = None
+) -> Any | None:
     """Get a nested configuration value from yaml config or default."""
-    config = get_config(key)
+    config = get_config(key, start_dir=config_dir)
     if config is None:
         return None
     return config.get(resource, None)
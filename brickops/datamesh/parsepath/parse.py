@@ -1,12 +1,12 @@
+import functools
 import logging
-import re
 from dataclasses import dataclass
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedPath:
     domain: str
     project: str
@@ -16,74 +16,84 @@ class ParsedPath:
     activity: Optional[str] = None
 
 
-def parsepath(path: str) -> ParsedPath | None:
-    """Parse path to extract org, domain, project, and flow."""
-    empty_parsed_path = ParsedPath(
-        domain="",
-        project="",
-        flowtype="",
-        flow="",
-    )
-    parsed_path = _parsebase(path=path, parsed_path=empty_parsed_path)
-    if parsed_path is None:
-        return empty_parsed_path
+EMPTY_PARSED_PATH = ParsedPath(domain="", project="", flowtype="", flow="")
+
 
-    return _parseflow(path=path, parsed_path=empty_parsed_path)
+@functools.lru_cache(maxsize=1024)
+def parsepath(path: str) -> ParsedPath:
+    """Parse path to extract org, domain, project, and flow.
 
+    The path is split into segments once and scanned for the last
+    .../domains/<domain>/projects/<project>/... section. The domains,
+    projects and orgs markers are case insensitive. If the path contains
+    /orgs/, the section must be preceded by orgs/<org>.
+    """
+    segments = path.split("/")
+    base = _parsebase(path=path, segments=segments)
+    if base is None:
+        return EMPTY_PARSED_PATH
+    org, domain, project = base
+    activity, flowtype, flow = _parseflow(segments)
+    return ParsedPath(
+        domain=domain,
+        project=project,
+        flowtype=flowtype,
+        flow=flow,
+        org=org,
+        activity=activity,
+    )
 
-def _parsebase(*, path: str, parsed_path: ParsedPath) -> ParsedPath | None:
+
+def _parsebase(*, path: str, segments: list[str]) -> tuple[str | None, str, str] | None:
     """Parse base section of path to extract org, domain, project."""
     has_org = "/orgs/" in path
-    if has_org:  # Include org section if required
-        rexp = r".*\/orgs/([^/]+)\/domains/([^/]+)\/projects\/([^/]+)\/.+"
-    else:
-        rexp = r".*\/domains\/([^/]+)\/projects\/([^/]+)\/.+"
-    re_ret = re.search(
-        rexp,
-        path,
-        re.IGNORECASE,
+    for start in _mesh_starts(segments):
+        rest = "/".join(segments[start + 4 :])
+        if not rest:  # Need something after projects/<project>/
+            continue
+        if not has_org:
+            return None, segments[start + 1], segments[start + 3]
+        org = segments[start - 1]
+        if start >= 3 and segments[start - 2].lower() == "orgs" and org:
+            return org, segments[start + 1], segments[start + 3]
+    logger.info(
+        """_parsebase: path regexp not matching, could be valid,
+        e.g. for dbname() run outside mesh structure, where mesh names
+        (org, domain, project etc) are not used"""
     )
-    if re_ret is None:
-        logger.info(
-            """_parsebase: path regexp not matching, could be valid,
-            e.g. for dbname() run outside mesh structure, where mesh names
-            (org, domain, project etc) are not used"""
-        )
-        return None
-    if has_org:
-        parsed_path.org = re_ret[1]
-        parsed_path.domain = re_ret[2]
-        parsed_path.project = re_ret[3]
-    else:
-        parsed_path.domain = re_ret[1]
-        parsed_path.project = re_ret[2]
-    return parsed_path
+    return None
 
 
-def _parseflow(*, path: str, parsed_path: ParsedPath) -> ParsedPath:
+def _parseflow(segments: list[str]) -> tuple[str | None, str, str]:
     """Parse flow section of path to extract activity, flowtype and flow.
-    If only two directory levels are present, assume no activity."""
-    rexp = r".*\/domains\/[^/]+\/projects\/[^/]+\/([^/]+)\/([^/]+)\/([^/]+).*"
-    re_ret = re.search(
-        rexp,
-        path,
-        re.IGNORECASE,
-    )
-    if re_ret:
-        parsed_path.activity = re_ret[1]  # E.g. Flow or explore
-        parsed_path.flowtype = re_ret[2]  # E.g prep or ml
-        parsed_path.flow = re_ret[3]  # Name of notebook
-        return parsed_path
+    If only two directory levels are present, assume no flowtype."""
+    starts = _mesh_starts(segments)
+    for start in starts:
+        levels = segments[start + 4 : start + 7]
+        if len(levels) == 3 and all(levels):
+            activity, flowtype, flow = levels  # E.g. flows, prep, notebook name
+            return activity, flowtype, flow
     # missing a level, so assume no flowtype
-    rexp = r".*\/domains\/[^/]+\/projects\/[^/]+\/([^/]+)\/([^/]+).*"
-    re_ret = re.search(
-        rexp,
-        path,
-        re.IGNORECASE,
-    )
-    if re_ret:
-        parsed_path.activity = re_ret[1]  # E.g. Flow or explore
-        parsed_path.flow = re_ret[2]  # Name of notebook
-        return parsed_path
+    for start in starts:
+        levels = segments[start + 4 : start + 6]
+        if len(levels) == 2 and all(levels):
+            activity, flow = levels  # E.g. explore, notebook name
+            return activity, "", flow
     logger.info("""_parseflow: no matching explore/flow pattern found""")
-    return parsed_path
+    return None, "", ""
+
+
+def _mesh_starts(segments: list[str]) -> list[int]:
+    """Return indexes of domains/<domain>/projects/<project>, last first.
+
+    The domains marker must be preceded by a slash, i.e. not be the first
+    segment.
+    """
+    return [
+        index
+        for index in range(len(segments) - 4, 0, -1)
+        if segments[index].lower() == "domains"
+        and segments[index + 1]
+        and segments[index + 2].lower() == "projects"
+        and segments[index + 3]
+    ]
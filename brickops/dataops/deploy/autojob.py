@@ -6,6 +6,15 @@ from typing import TYPE_CHECKING, Any
 
 from brickops.databricks import api
 from brickops.databricks.context import DbContext, current_env, get_context
+from brickops.dataops.deploy.diff import (
+    CONFIG_HASH_TAG,
+    CREATED,
+    UNCHANGED,
+    UPDATED,
+    DeployResult,
+    deployed_config_hash,
+    job_settings_equal,
+)
 from brickops.dataops.deploy.job.buildconfig import build_job_config
 from brickops.dataops.deploy.readconfig import read_config_yaml
 from brickops.dataops.deploy.repo import git_source
@@ -44,22 +53,47 @@ def autojob(
         "\njob_config:\n" + json.dumps(job_config.dict(), sort_keys=True, indent=4)
     )
 
-    response = create_or_update_job(db_context, job_config)
+    result = create_or_update_job(db_context, job_config)
 
-    logger.info("Job deploy finished.")
-    return {"job_name": job_config.name, "response": response}
+    logger.info(f"Job deploy finished, job {result.status}.")
+    return {
+        "job_name": job_config.name,
+        "response": result.response,
+        "status": result.status,
+    }
 
 
 def create_or_update_job(
-    db_context: DbContext, job_config: JobConfig
-) -> dict[str, Any]:
-    api_client = api.ApiClient(db_context.api_url, db_context.api_token)
+    db_context: DbContext,
+    job_config: JobConfig,
+    api_client: api.ApiClient | None = None,
+) -> DeployResult:
+    """Create the job, or reset it if a job with the same name exists.
+
+    An existing job is only reset if its current settings differ from
+    job_config, see brickops.dataops.deploy.diff. If the listed job carries
+    the config_hash tag of job_config, it is unchanged without fetching it.
+    Pass a shared api_client, e.g. one with a job index, when deploying many jobs.
+    """
+    if api_client is None:
+        api_client = api.ApiClient(db_context.api_url, db_context.api_token)
+    settings = job_config.dict()
     if job := api_client.get_job_by_name(job_name=job_config.name):
-        return api_client.update_job(
-            job_id=job["job_id"], job_name=job_config.name, job_config=job_config.dict()
+        job_id = job["job_id"]
+        desired_hash = job_config.tags.get(CONFIG_HASH_TAG)
+        if desired_hash and deployed_config_hash(job) == desired_hash:
+            logger.info(f"Job {job_config.name} has the same config hash, skipping")
+            return DeployResult(status=UNCHANGED, resource_id=job_id)
+        current = api_client.get_job(job_id).get("settings", {})
+        if job_settings_equal(settings, current):
+            logger.info(f"Job {job_config.name} is unchanged, skipping reset")
+            return DeployResult(status=UNCHANGED, resource_id=job_id)
+        response = api_client.update_job(
+            job_id=job_id, job_name=job_config.name, job_config=settings
         )
+        return DeployResult(status=UPDATED, resource_id=job_id, response=response)
 
-    return api_client.create_job(
-        job_name=job_config.name,
-        job_config=job_config.dict(),
+    response = api_client.create_job(job_name=job_config.name, job_config=settings)
+    return DeployResult(
+        status=CREATED, resource_id=response.get("job_id"), response=response
     )
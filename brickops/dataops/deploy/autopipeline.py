@@ -6,6 +6,13 @@ from typing import TYPE_CHECKING, Any
 
 from brickops.databricks import api
 from brickops.databricks.context import DbContext, current_env, get_context
+from brickops.dataops.deploy.diff import (
+    CREATED,
+    UNCHANGED,
+    UPDATED,
+    DeployResult,
+    pipeline_spec_equal,
+)
 from brickops.dataops.deploy.pipeline.buildconfig import build_pipeline_config
 from brickops.dataops.deploy.readconfig import read_config_yaml
 from brickops.dataops.deploy.repo import git_source
@@ -49,24 +56,49 @@ def autopipeline(
         + json.dumps(pipeline_config.export_dict(), sort_keys=True, indent=4)
     )
 
-    response = create_or_update_pipeline(db_context, pipeline_config)
+    result = create_or_update_pipeline(db_context, pipeline_config)
 
-    logging.info("Pipeline deploy finished.")
-    return {"pipeline_name": pipeline_config.name, "response": response}
+    logging.info(f"Pipeline deploy finished, pipeline {result.status}.")
+    return {
+        "pipeline_name": pipeline_config.name,
+        "response": result.response,
+        "status": result.status,
+    }
 
 
 def create_or_update_pipeline(
-    db_context: DbContext, pipeline_config: PipelineConfig
-) -> dict[str, Any]:
-    api_client = api.ApiClient(db_context.api_url, db_context.api_token)
+    db_context: DbContext,
+    pipeline_config: PipelineConfig,
+    api_client: api.ApiClient | None = None,
+) -> DeployResult:
+    """Create the pipeline, or update the one with exactly the same name.
+
+    An existing pipeline is only updated if its current spec differs from
+    pipeline_config, see brickops.dataops.deploy.diff.
+    Pass a shared api_client, e.g. one with a pipeline index, when deploying
+    many pipelines.
+    """
+    if api_client is None:
+        api_client = api.ApiClient(db_context.api_url, db_context.api_token)
+    spec = pipeline_config.export_dict()
     if pipeline := api_client.get_pipeline_by_name(pipeline_name=pipeline_config.name):
-        return api_client.update_pipeline(
-            pipeline_id=pipeline["pipeline_id"],
+        pipeline_id = pipeline["pipeline_id"]
+        current = api_client.get_pipeline(pipeline_id).get("spec", {})
+        if pipeline_spec_equal(spec, current):
+            logger.info(
+                f"Pipeline {pipeline_config.name} is unchanged, skipping update"
+            )
+            return DeployResult(status=UNCHANGED, resource_id=pipeline_id)
+        response = api_client.update_pipeline(
+            pipeline_id=pipeline_id,
             pipeline_name=pipeline_config.name,
-            pipeline_config=pipeline_config.export_dict(),
+            pipeline_config=spec,
         )
+        return DeployResult(status=UPDATED, resource_id=pipeline_id, response=response)
 
-    return api_client.create_pipeline(
-        pipeline_name=pipeline_config.name,
-        pipeline_config=pipeline_config.export_dict(),
+    response = api_client.create_pipeline(
+        pipeline_name=pipeline_config.name, pipeline_config=spec
+    )
+    return DeployResult(
+        status=CREATED, resource_id=response.get("pipeline_id"), response=response
     )
@@ -0,0 +1,333 @@
+"""Deploy every flow of a mesh tree from one process.
+
+deploy_all() discovers deployment.yml files, builds the job or pipeline
+config of each flow in-process and deploys them concurrently. All flows
+share one pooled ApiClient with job and pipeline name indexes, so existing
+jobs and pipelines are looked up without an API call per flow, and one
+cluster catalog, so clusters are listed at most once.
+
+A flow is deployed as if its deploy notebook, next to deployment.yml, had
+called autojob() or autopipeline(). A deployment.yml with pipeline_tasks
+defines a pipeline, anything else a job.
+
+deploy_changed() only deploys the flows affected by git changes since a
+commit, e.g. the commit the flows were last deployed from.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from brickops.databricks import api
+from brickops.databricks.context import DbContext, current_env, get_context
+from brickops.datamesh.naming import jobname, pipelinename
+from brickops.dataops.deploy import changes
+from brickops.dataops.deploy.autojob import create_or_update_job
+from brickops.dataops.deploy.autopipeline import create_or_update_pipeline
+from brickops.dataops.deploy.diff import UNCHANGED
+from brickops.dataops.deploy.job.buildconfig import build_job_config
+from brickops.dataops.deploy.job.buildconfig.clusters import ClusterCatalog
+from brickops.dataops.deploy.pipeline.buildconfig import build_pipeline_config
+from brickops.dataops.deploy.readconfig import read_config_yaml
+from brickops.dataops.deploy.repo import WORKSPACE_MOUNT, git_source
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+DEPLOYMENT_FILE = "deployment.yml"
+# Name of the deploy notebook next to deployment.yml, used for naming
+DEPLOY_NOTEBOOK = "deploy"
+
+_GIT_WIDGETS = ("git_url", "git_branch", "git_commit", "git_path")
+
+
+@dataclass
+class FlowResult:
+    """Outcome of deploying one flow."""
+
+    path: str
+    kind: str = ""
+    name: str | None = None
+    status: str | None = None
+    response: dict[str, Any] | None = None
+    error: str | None = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self: FlowResult) -> bool:
+        return self.error is None
+
+    def dict(self: FlowResult) -> dict[str, Any]:
+        return asdict(self)
+
+
+def discover_deployments(
+    root: str | Path, exclude: Iterable[str] = ("example_",)
+) -> list[Path]:
+    """Return all deployment.yml files below root, skipping excluded paths."""
+    exclude = tuple(exclude)
+    return sorted(
+        path
+        for path in Path(root).glob(f"**/{DEPLOYMENT_FILE}")
+        if not any(pattern in str(path) for pattern in exclude)
+    )
+
+
+def deploy_all(
+    root: str | Path,
+    env: str | None = None,
+    db_context: DbContext | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    exclude: Iterable[str] = ("example_",),
+    api_client: api.ApiClient | None = None,
+) -> list[FlowResult]:
+    """Deploy the job or pipeline of every deployment.yml below root.
+
+    root is a folder on the driver filesystem, e.g.
+    /Workspace/Repos/Production/dp-notebooks/domains. Flows are deployed
+    with at most `concurrency` in flight, and a failing flow does not stop
+    the others. Results are returned in discovery order.
+    """
+    cfg_paths = discover_deployments(root, exclude=exclude)
+    logger.info(f"Found {len(cfg_paths)} deployments below {root}")
+    if not cfg_paths:
+        return []
+    deployer = _Deployer.create(
+        db_context=db_context, env=env, api_client=api_client, concurrency=concurrency
+    )
+    return deployer.deploy_many(cfg_paths, concurrency=concurrency)
+
+
+def deploy_changed(
+    root: str | Path,
+    base: str | None = None,
+    env: str | None = None,
+    db_context: DbContext | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    exclude: Iterable[str] = ("example_",),
+    api_client: api.ApiClient | None = None,
+) -> list[FlowResult]:
+    """Deploy the flows below root affected by git changes since base.
+
+    root must be inside a git checkout with history, see
+    brickops.dataops.deploy.changes for which changes affect a flow. Without
+    base, each flow is compared with the git_commit tag of its deployed job
+    or pipeline, and flows that are not deployed yet are deployed. If the
+    changes since a commit cannot be read, e.g. in a shallow clone, the
+    flows compared with it are deployed.
+    """
+    cfg_paths = discover_deployments(root, exclude=exclude)
+    logger.info(f"Found {len(cfg_paths)} deployments below {root}")
+    if not cfg_paths:
+        return []
+    deployer = _Deployer.create(
+        db_context=db_context, env=env, api_client=api_client, concurrency=concurrency
+    )
+    repo_root = changes.git_toplevel(root)
+    bases: dict[str, list[Path]] = {}
+    selected: set[Path] = set()
+    if base:
+        flow_bases: list[str | None] = [base] * len(cfg_paths)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            flow_bases = list(executor.map(deployer.deployed_commit, cfg_paths))
+    for cfg_path, flow_base in zip(cfg_paths, flow_bases):
+        if flow_base is None:
+            selected.add(cfg_path)
+        else:
+            bases.setdefault(flow_base, []).append(cfg_path)
+
+    for flow_base, flow_paths in bases.items():
+        try:
+            changed = changes.changed_files(repo_root, flow_base)
+        except RuntimeError:
+            logger.exception(f"Could not diff against {flow_base}, deploying flows")
+            selected.update(flow_paths)
+            continue
+        selected |= changes.affected_deployments(
+            repo_root, flow_paths, changed, base=flow_base
+        )
+    logger.info(f"{len(selected)} of {len(cfg_paths)} flows changed")
+    return deployer.deploy_many(
+        [cfg_path for cfg_path in cfg_paths if cfg_path in selected],
+        concurrency=concurrency,
+    )
+
+
+def flow_context(
+    db_context: DbContext, cfg_path: Path, git_src: dict[str, Any]
+) -> DbContext:
+    """Return the context the deploy notebook of a flow would have.
+
+    Git info is passed as widget parameters, so naming does not look it up.
+    The naming config is looked up from the flow folder, as from the deploy
+    notebook, whatever the working directory of the caller.
+    """
+    notebook_path = str(cfg_path.parent / DEPLOY_NOTEBOOK)
+    if notebook_path.startswith(WORKSPACE_MOUNT + "/"):
+        notebook_path = notebook_path[len(WORKSPACE_MOUNT) :]
+    widgets = {k: v for k, v in db_context.widgets.items() if k not in _GIT_WIDGETS}
+    widgets |= {key: git_src[key] for key in _GIT_WIDGETS if git_src.get(key)}
+    return DbContext(
+        api_url=db_context.api_url,
+        api_token=db_context.api_token,
+        notebook_path=notebook_path,
+        username=db_context.username,
+        widgets=widgets,
+        config_dir=str(cfg_path.parent),
+    )
+
+
+class _Deployer:
+    def __init__(
+        self: _Deployer, db_context: DbContext, env: str, api_client: api.ApiClient
+    ) -> None:
+        self.db_context = db_context
+        self.env = env
+        self.api_client = api_client
+        self.cluster_catalog = ClusterCatalog(api_client)
+        self._git_sources: list[dict[str, Any]] = []
+        self._git_lock = threading.Lock()
+        self._name_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._name_locks_lock = threading.Lock()
+
+    @classmethod
+    def create(
+        cls: type[_Deployer],
+        db_context: DbContext | None,
+        env: str | None,
+        api_client: api.ApiClient | None,
+        concurrency: int,
+    ) -> _Deployer:
+        """Validate env and set up a shared, indexed api client."""
+        if db_context is None:
+            db_context = get_context()
+        if not env:
+            env = current_env(db_context)
+        if env not in ("test", "dev", "prod"):
+            msg = f"env must be 'test', 'dev' or 'prod', not {env}"
+            raise ValueError(msg)
+        if api_client is None:
+            api_client = api.ApiClient(
+                db_context.api_url, db_context.api_token, pool_size=concurrency
+            )
+        api_client.build_job_index()
+        api_client.build_pipeline_index()
+        return cls(db_context=db_context, env=env, api_client=api_client)
+
+    def deploy_many(
+        self: _Deployer, cfg_paths: list[Path], concurrency: int
+    ) -> list[FlowResult]:
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="brickops-deploy"
+        ) as executor:
+            results = list(executor.map(self.deploy, cfg_paths))
+
+        failed = [result for result in results if not result.ok]
+        unchanged = [result for result in results if result.status == UNCHANGED]
+        logger.info(
+            f"Deployed {len(results) - len(failed)} of {len(results)} flows"
+            + (f", {len(unchanged)} unchanged" if unchanged else "")
+            + (f", {len(failed)} failed" if failed else "")
+        )
+        return results
+
+    def deployed_commit(self: _Deployer, cfg_path: Path) -> str | None:
+        """Return the git_commit tag of the deployed job or pipeline of a flow.
+
+        Returns None if the flow is not deployed or its commit is unknown.
+        """
+        try:
+            cfg = read_config_yaml(cfg_path)
+            ctx = flow_context(
+                self.db_context,
+                cfg_path,
+                self._git_source(flow_context(self.db_context, cfg_path, {})),
+            )
+            if "pipeline_tasks" in cfg:
+                pipeline = self.api_client.get_pipeline_by_name(
+                    pipelinename(ctx, env=self.env)
+                )
+                if pipeline is None:
+                    return None
+                spec = self.api_client.get_pipeline(pipeline["pipeline_id"])["spec"]
+                return spec.get("tags", {}).get("git_commit")  # type: ignore [no-any-return]
+            job = self.api_client.get_job_by_name(jobname(ctx, env=self.env))
+        except Exception:
+            logger.exception(f"Could not find deployed commit of {cfg_path}")
+            return None
+        if job is None:
+            return None
+        return job["settings"].get("tags", {}).get("git_commit")  # type: ignore [no-any-return]
+
+    def deploy(self: _Deployer, cfg_path: Path) -> FlowResult:
+        started = time.monotonic()
+        result = FlowResult(path=str(cfg_path.parent))
+        try:
+            cfg = read_config_yaml(cfg_path)
+            result.kind = "pipeline" if "pipeline_tasks" in cfg else "job"
+            base_context = flow_context(self.db_context, cfg_path, {})
+            cfg["git_source"] = self._git_source(base_context)
+            ctx = flow_context(self.db_context, cfg_path, cfg["git_source"])
+            if result.kind == "pipeline":
+                pipeline_config = build_pipeline_config(
+                    cfg=cfg, env=self.env, db_context=ctx
+                )
+                result.name = pipeline_config.name
+                with self._name_lock(result.kind, result.name):
+                    deployed = create_or_update_pipeline(
+                        ctx, pipeline_config, api_client=self.api_client
+                    )
+            else:
+                job_config = build_job_config(
+                    cfg=cfg,
+                    env=self.env,
+                    db_context=ctx,
+                    cluster_catalog=self.cluster_catalog,
+                )
+                result.name = job_config.name
+                with self._name_lock(result.kind, result.name):
+                    deployed = create_or_update_job(
+                        ctx, job_config, api_client=self.api_client
+                    )
+            result.status = deployed.status
+            result.response = deployed.response
+        except Exception as err:
+            logger.exception(f"Deploy of {cfg_path} failed")
+            result.error = repr(err)
+        result.seconds = time.monotonic() - started
+        return result
+
+    def _name_lock(self: _Deployer, kind: str, name: str) -> threading.Lock:
+        """Lock deploys of one job or pipeline name, so it is created once.
+
+        Flows can resolve to the same name, e.g. all jobs of a project with
+        the default job naming. They are then deployed one after the other,
+        the first creating the job and the others updating it.
+        """
+        with self._name_locks_lock:
+            return self._name_locks.setdefault((kind, name), threading.Lock())
+
+    def _git_source(self: _Deployer, db_context: DbContext) -> dict[str, Any]:
+        """Resolve git source once per repo, as flows usually share one."""
+        with self._git_lock:
+            for src in self._git_sources:
+                repo_folder = src["git_path"].rstrip("/") + "/"
+                if db_context.notebook_path.startswith(repo_folder):
+                    return dict(src)
+            src = git_source(db_context)
+            if not src:
+                msg = f"No git source found for {db_context.notebook_path}"
+                raise RuntimeError(msg)
+            if src.get("git_path"):
+                self._git_sources.append(src)
+            return dict(src)
@@ -0,0 +1,183 @@
+"""Find the flows affected by changes between two git commits.
+
+A flow is affected if a file below its folder, the folder holding its
+deployment.yml, changed. Changed files are bucketed by domain and project
+with parsepath, so each file is only compared with the flows of its own
+project.
+
+A changed .brickopscfg/config.yml affects the flows it applies to, i.e. the
+flows below its parent folder without a closer config, if the parsed
+config differs between the commits. A change to the job naming only
+affects jobs, and a change to pipeline, catalog or db naming only
+pipelines. Any other change affects both.
+
+Reading the commits requires a git checkout with history and the git
+command, e.g. on a CI runner.
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+from brickops.datamesh.parsepath.parse import EMPTY_PARSED_PATH, parsepath
+from brickops.dataops.deploy.readconfig import read_config_yaml
+from brickops.yamlutils import load_yaml
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+CONFIG_DIR = ".brickopscfg"
+CONFIG_FILE = f"{CONFIG_DIR}/config.yml"
+# Kinds of flows whose config uses each naming resource
+NAMING_KINDS = {
+    "job": frozenset({"job"}),
+    "pipeline": frozenset({"pipeline"}),
+    "catalog": frozenset({"pipeline"}),
+    "db": frozenset({"pipeline"}),
+}
+ALL_KINDS = frozenset({"job", "pipeline"})
+
+
+def git_toplevel(path: str | Path) -> Path:
+    """Return the root folder of the git checkout containing path."""
+    return Path(_git(path, "rev-parse", "--show-toplevel").strip())
+
+
+def changed_files(repo_root: str | Path, base: str) -> list[str]:
+    """Return paths, relative to repo_root, changed between base and HEAD.
+
+    Renames are listed as a deletion and an addition, so both the old and
+    the new location count as changed.
+    """
+    output = _git(repo_root, "diff", "--name-only", "--no-renames", base, "HEAD")
+    return [line for line in output.splitlines() if line]
+
+
+def affected_deployments(
+    repo_root: str | Path,
+    cfg_paths: Iterable[Path],
+    changed: Iterable[str],
+    base: str,
+) -> set[Path]:
+    """Return the deployment.yml paths of the flows affected by changed files.
+
+    changed are paths relative to repo_root, as from changed_files(), and
+    base is the commit they were changed since.
+    """
+    repo_root = Path(repo_root).resolve()
+    flows = {cfg_path: _relative(cfg_path.parent, repo_root) for cfg_path in cfg_paths}
+    by_project: dict[tuple[str, str], list[Path]] = {}
+    for cfg_path, folder in flows.items():
+        by_project.setdefault(_project_key(folder), []).append(cfg_path)
+
+    affected: set[Path] = set()
+    changed_configs: list[str] = []
+    for path in changed:
+        if path == CONFIG_FILE or path.endswith(f"/{CONFIG_FILE}"):
+            changed_configs.append(path)
+            continue
+        for cfg_path in by_project.get(_project_key(path), []):
+            if path.startswith(flows[cfg_path] + "/"):
+                affected.add(cfg_path)
+
+    for config in changed_configs:
+        kinds = _changed_kinds(repo_root, config, base)
+        if not kinds:
+            continue
+        config_root = config[: -len(CONFIG_FILE)]
+        for cfg_path, folder in flows.items():
+            if cfg_path in affected or not (folder + "/").startswith(config_root):
+                continue
+            if _has_closer_config(repo_root, folder, config_root):
+                continue
+            kind = _flow_kind(cfg_path) if kinds != ALL_KINDS else None
+            if kind is None or kind in kinds:
+                affected.add(cfg_path)
+    return affected
+
+
+def _project_key(path: str) -> tuple[str, str]:
+    parsed = parsepath("/" + path)
+    if parsed == EMPTY_PARSED_PATH:
+        return ("", "")
+    return (parsed.domain.lower(), parsed.project.lower())
+
+
+def _relative(path: Path, repo_root: Path) -> str:
+    return path.resolve().relative_to(repo_root).as_posix()
+
+
+def _has_closer_config(repo_root: Path, folder: str, config_root: str) -> bool:
+    """Whether a config between config_root and folder applies to folder."""
+    current = repo_root / folder
+    top = repo_root / config_root
+    while current != top and current != repo_root:
+        if (current / CONFIG_DIR).exists():
+            return True
+        current = current.parent
+    return False
+
+
+def _changed_kinds(repo_root: Path, config: str, base: str) -> frozenset[str]:
+    """Return the kinds of flows whose naming a config change affects."""
+    before = _config_at(repo_root, config, base)
+    after = _config_at(repo_root, config, "HEAD")
+    if before == after:
+        return frozenset()
+    if not isinstance(before, dict) or not isinstance(after, dict):
+        return ALL_KINDS
+    kinds: set[str] = set()
+    for key in before.keys() | after.keys():
+        if before.get(key) == after.get(key):
+            continue
+        if key != "naming":
+            return ALL_KINDS
+        naming_before = before.get("naming") or {}
+        naming_after = after.get("naming") or {}
+        if not isinstance(naming_before, dict) or not isinstance(naming_after, dict):
+            return ALL_KINDS
+        for resource in naming_before.keys() | naming_after.keys():
+            if naming_before.get(resource) != naming_after.get(resource):
+                kinds |= NAMING_KINDS.get(resource, ALL_KINDS)
+    logger.info(f"{config} changed since {base}, affecting {sorted(kinds)} flows")
+    return frozenset(kinds)
+
+
+def _config_at(repo_root: Path, config: str, commit: str) -> Any | None:
+    try:
+        return load_yaml(_git(repo_root, "show", f"{commit}:{config}"))
+    except RuntimeError:  # The config did not exist at commit
+        return None
+
+
+def _flow_kind(cfg_path: Path) -> str | None:
+    """Return job or pipeline, or None if deployment.yml cannot be read."""
+    try:
+        cfg = read_config_yaml(cfg_path)
+    except (OSError, yaml.YAMLError):
+        logger.warning(f"Could not read {cfg_path}, treating it as affected")
+        return None
+    return "pipeline" if isinstance(cfg, dict) and "pipeline_tasks" in cfg else "job"
+
+
+def _git(cwd: str | Path, *args: str) -> str:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as err:
+        stderr = getattr(err, "stderr", "") or ""
+        msg = f"git {' '.join(args)} failed in {cwd}: {stderr.strip() or err!r}"
+        raise RuntimeError(msg) from err
+    return result.stdout
@@ -0,0 +1,184 @@
+"""Detect deploys that would not change a job or pipeline.
+
+The settings read back from the API contain server-side defaults and may
+order lists differently from the config we send. Both sides are normalized
+before comparing: None and empty values and known defaults are dropped,
+numbers are compared as strings, and lists of tasks, parameters, clusters
+and similar are sorted by their key. Fields the server may not echo back are
+only compared when it does. Any difference left means the resource is
+updated, so an unknown server default costs a write, never a missed change.
+
+Configs built by brickops also carry a config_hash tag, a hash of the
+canonical config. A job listing includes tags, so a job whose tag matches
+the config about to be deployed is known to be unchanged without fetching
+its settings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+
+CONFIG_HASH_TAG = "config_hash"
+
+# Keys identifying items in lists of dicts, tried in order
+_SORT_KEYS = ("task_key", "job_cluster_key", "pipeline_key", "name", "label")
+
+JOB_DEFAULTS: dict[str, Any] = {
+    "format": "MULTI_TASK",
+    "timeout_seconds": 0,
+    "max_concurrent_runs": 1,
+}
+TASK_DEFAULTS: dict[str, Any] = {
+    "run_if": "ALL_SUCCESS",
+    "timeout_seconds": 0,
+    "max_retries": 0,
+    "min_retry_interval_millis": 0,
+    "retry_on_timeout": False,
+}
+# Fields of a job git_source the jobs api stores
+GIT_SOURCE_FIELDS = ("git_url", "git_provider", "git_branch", "git_tag", "git_commit")
+# Job settings only echoed by some api versions
+JOB_OPTIONAL = frozenset({"run_as"})
+
+PIPELINE_DEFAULTS: dict[str, Any] = {
+    "channel": "CURRENT",
+    "edition": "ADVANCED",
+    "continuous": False,
+    "development": False,
+    "photon": False,
+    "serverless": False,
+    "data_sampling": False,
+    "pipeline_type": "WORKSPACE",
+}
+PIPELINE_IGNORED = frozenset({"id"})
+# Pipeline config fields the pipelines api may not store
+PIPELINE_OPTIONAL = frozenset(
+    {"schedule", "parameters", "pipeline_type", "data_sampling"}
+)
+
+
+@dataclass
+class DeployResult:
+    """Outcome of deploying one job or pipeline."""
+
+    status: str
+    resource_id: str | int | None = None
+    response: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def changed(self: DeployResult) -> bool:
+        return self.status != UNCHANGED
+
+
+def config_hash(config: dict[str, Any]) -> str:
+    """Return a stable hash of a job or pipeline config, ignoring its hash tag."""
+    tags = {
+        key: value
+        for key, value in (config.get("tags") or {}).items()
+        if key != CONFIG_HASH_TAG
+    }
+    content = json.dumps(
+        canonical({**config, "tags": tags}), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+def deployed_config_hash(resource: dict[str, Any]) -> str | None:
+    """Return the config_hash tag of a listed or fetched job or pipeline."""
+    settings = resource.get("settings") or resource.get("spec") or {}
+    tags = settings.get("tags") or {}
+    return tags.get(CONFIG_HASH_TAG)
+
+
+def job_settings_equal(desired: dict[str, Any], current: dict[str, Any]) -> bool:
+    """Whether job settings from jobs/get match the settings we would send."""
+    return bool(
+        normalize_job_settings(desired, current)
+        == normalize_job_settings(current, current)
+    )
+
+
+def pipeline_spec_equal(desired: dict[str, Any], current: dict[str, Any]) -> bool:
+    """Whether a pipeline spec from the api matches the spec we would send."""
+    return bool(
+        normalize_pipeline_spec(desired, current)
+        == normalize_pipeline_spec(current, current)
+    )
+
+
+def normalize_job_settings(settings: dict[str, Any], current: dict[str, Any]) -> Any:
+    """Return job settings in a canonical form, see the module docstring."""
+    settings = _without_unechoed(settings, current, JOB_OPTIONAL)
+    settings = _without_defaults(settings, JOB_DEFAULTS)
+    if isinstance(settings.get("git_source"), dict):
+        git_source = settings["git_source"]
+        settings["git_source"] = {
+            key: git_source[key] for key in GIT_SOURCE_FIELDS if key in git_source
+        }
+    if isinstance(settings.get("tasks"), list):
+        settings["tasks"] = [
+            _without_defaults(task, TASK_DEFAULTS) if isinstance(task, dict) else task
+            for task in settings["tasks"]
+        ]
+    return canonical(settings)
+
+
+def normalize_pipeline_spec(spec: dict[str, Any], current: dict[str, Any]) -> Any:
+    """Return a pipeline spec in a canonical form, see the module docstring."""
+    spec = {k: v for k, v in spec.items() if k not in PIPELINE_IGNORED}
+    spec = _without_unechoed(spec, current, PIPELINE_OPTIONAL)
+    return canonical(_without_defaults(spec, PIPELINE_DEFAULTS))
+
+
+def canonical(value: Any) -> Any:
+    """Drop None and empty values, stringify numbers and sort keyed lists."""
+    if isinstance(value, dict):
+        mapping = {key: canonical(item) for key, item in value.items()}
+        return {key: item for key, item in mapping.items() if not _empty(item)}
+    if isinstance(value, list):
+        items = [canonical(item) for item in value]
+        items = [item for item in items if not _empty(item)]
+        if items and all(isinstance(item, dict) for item in items):
+            return sorted(items, key=_sort_key)
+        return items
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _without_defaults(
+    values: dict[str, Any], defaults: dict[str, Any]
+) -> dict[str, Any]:
+    return {
+        key: value
+        for key, value in values.items()
+        if key not in defaults or value != defaults[key]
+    }
+
+
+def _without_unechoed(
+    values: dict[str, Any], current: dict[str, Any], optional: frozenset[str]
+) -> dict[str, Any]:
+    return {
+        key: value
+        for key, value in values.items()
+        if key not in optional or key in current
+    }
+
+
+def _empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _sort_key(item: dict[str, Any]) -> tuple[str, str]:
+    for key in _SORT_KEYS:
+        if key in item:
+            return (key, str(item[key]))
+    return ("", json.dumps(item, sort_keys=True, default=str))
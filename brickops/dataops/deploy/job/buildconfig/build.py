@@ -3,6 +3,8 @@ from typing import Any
 from brickops.databricks.context import DbContext
 from brickops.databricks.username import get_username
 from brickops.datamesh.naming import jobname
+from brickops.dataops.deploy.diff import CONFIG_HASH_TAG, config_hash
+from brickops.dataops.deploy.job.buildconfig.clusters import ClusterCatalog
 from brickops.dataops.deploy.job.buildconfig.enrichtasks import enrich_tasks
 from brickops.dataops.deploy.job.buildconfig.job_config import JobConfig, defaultconfig
 from brickops.gitutils import clean_branch, commit_shortref
@@ -22,8 +24,13 @@ def build_job_config(
     cfg: dict[str, Any],
     env: str,
     db_context: DbContext,
+    cluster_catalog: ClusterCatalog | None = None,
 ) -> JobConfig:
-    """Combine custom parameters with default parameters, and default cluster config."""
+    """Combine custom parameters with default parameters, and default cluster config.
+
+    Pass a shared cluster_catalog to resolve cluster names of many jobs with
+    one cluster listing.
+    """
     full_cfg = defaultconfig()
     if env != "prod":
         full_cfg.email_notifications = {}
@@ -34,7 +41,9 @@ def build_job_config(
     tags = _tags(cfg=cfg, depname=dep_name)
     full_cfg.tags = tags
     full_cfg.parameters.extend(build_context_parameters(env, tags))
-    full_cfg = enrich_tasks(job_config=full_cfg, db_context=db_context)
+    full_cfg = enrich_tasks(
+        job_config=full_cfg, db_context=db_context, cluster_catalog=cluster_catalog
+    )
     if not full_cfg.run_as:
         if db_context.is_service_principal:
             full_cfg.run_as = {"service_principal_name": db_context.username}
@@ -42,6 +51,7 @@ def build_job_config(
             full_cfg.run_as = {
                 "user_name": db_context.username,
             }
+    full_cfg.tags[CONFIG_HASH_TAG] = config_hash(full_cfg.dict())
 
     return full_cfg
 
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import logging
+import threading
 from typing import Any
 
 from brickops.databricks import api
@@ -19,15 +22,62 @@ def add_clusters(job_config: JobConfig, used_clusters: dict[str, Any]) -> JobCon
     return job_config
 
 
-def lookup_cluster_id(*, db_context: DbContext, cluster_name: str) -> dict[str, Any]:
-    api_client = api.ApiClient(db_context.api_url, db_context.api_token)
-    cluster_list = api_client.get_clusters()
+class ClusterCatalog:
+    """Workspace clusters by name, from a single clusters/list call.
+
+    Create one per job build, or share one across all jobs of a bulk
+    deploy. The listing is fetched on the first lookup, so builds without
+    existing_cluster_name tasks make no call.
+    """
+
+    def __init__(self: ClusterCatalog, api_client: api.ApiClient) -> None:
+        self.api_client = api_client
+        self._ids_by_name: dict[str, list[str]] | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_context(
+        cls: type[ClusterCatalog], db_context: DbContext
+    ) -> ClusterCatalog:
+        return cls(api.ApiClient(db_context.api_url, db_context.api_token))
+
+    def cluster_id(self: ClusterCatalog, cluster_name: str) -> str:
+        """Return the id of the cluster named cluster_name.
+
+        Raises RuntimeError if no cluster, or more than one, has the name.
+        """
+        cluster_ids = self._clusters().get(cluster_name, [])
+        if not cluster_ids:
+            msg = f"Cluster {cluster_name} not found"
+            raise RuntimeError(msg)
+        if len(cluster_ids) > 1:
+            msg = f"Cluster name {cluster_name} is ambiguous, ids: {cluster_ids}"
+            raise RuntimeError(msg)
+        return cluster_ids[0]
+
+    def _clusters(self: ClusterCatalog) -> dict[str, list[str]]:
+        with self._lock:
+            if self._ids_by_name is None:
+                ids_by_name: dict[str, list[str]] = {}
+                for cluster in self.api_client.get_clusters():
+                    ids_by_name.setdefault(cluster["cluster_name"], []).append(
+                        cluster["cluster_id"]
+                    )
+                logger.info(f"Indexed {len(ids_by_name)} cluster names")
+                self._ids_by_name = ids_by_name
+            return self._ids_by_name
+
 
-    for cluster in cluster_list:
-        if cluster["cluster_name"] == cluster_name:
-            return cluster["cluster_id"]  # type: ignore [no-any-return]
-    msg = f"Cluster {cluster_name} not found"
-    raise RuntimeError(msg)
+def lookup_cluster_id(
+    *,
+    db_context: DbContext,
+    cluster_name: str,
+    cluster_catalog: ClusterCatalog | None = None,
+) -> str:
+    """Return the id of a cluster by name, using cluster_catalog if given."""
+    if cluster_catalog is None:
+        cluster_catalog = ClusterCatalog.from_context(db_context)
+    return cluster_catalog.cluster_id(cluster_name)
 
 
 def _cluster(*, template_key: str, key: str) -> dict[str, Any]:
@@ -2,6 +2,7 @@ from pathlib import Path
 
 from brickops.databricks.context import DbContext
 from brickops.dataops.deploy.job.buildconfig.clusters import (
+    ClusterCatalog,
     add_clusters,
     lookup_cluster_id,
 )
@@ -9,7 +10,16 @@ from brickops.dataops.deploy.job.buildconfig.job_config import JobConfig
 from brickops.dataops.deploy.nbpath import nbrelfolder
 
 
-def enrich_tasks(job_config: JobConfig, db_context: DbContext) -> JobConfig:
+def enrich_tasks(
+    job_config: JobConfig,
+    db_context: DbContext,
+    cluster_catalog: ClusterCatalog | None = None,
+) -> JobConfig:
+    """Set notebook paths and cluster references of all tasks.
+
+    Cluster names are resolved with cluster_catalog, or with a catalog made
+    for this call, so clusters are listed at most once per job.
+    """
     tasks = job_config.tasks
     used_clusters = {}
     for task in tasks:
@@ -55,8 +65,12 @@ def enrich_tasks(job_config: JobConfig, db_context: DbContext) -> JobConfig:
         elif "existing_cluster_name" in task:
             # Ensure we have a cluster reference
             existing_cluster_name = task.pop("existing_cluster_name")
+            if cluster_catalog is None:
+                cluster_catalog = ClusterCatalog.from_context(db_context)
             task["existing_cluster_id"] = lookup_cluster_id(
-                db_context=db_context, cluster_name=existing_cluster_name
+                db_context=db_context,
+                cluster_name=existing_cluster_name,
+                cluster_catalog=cluster_catalog,
             )
         elif "existing_cluster_id" not in task:
             msg = "No cluster references found"
@@ -3,6 +3,7 @@ from typing import Any
 from brickops.databricks.context import DbContext
 from brickops.databricks.username import get_username
 from brickops.datamesh.naming import pipelinename
+from brickops.dataops.deploy.diff import CONFIG_HASH_TAG, config_hash
 from brickops.dataops.deploy.pipeline.buildconfig.enrichtasks import enrich_tasks
 from brickops.dataops.deploy.pipeline.buildconfig.pipeline_config import (
     PipelineConfig,
@@ -39,6 +40,7 @@ def build_pipeline_config(
     full_cfg.parameters.extend(build_context_parameters(env, tags))
     logger.info("full_cfg:" + repr(full_cfg))
     full_cfg = enrich_tasks(pipeline_config=full_cfg, db_context=db_context, env=env)
+    full_cfg.tags[CONFIG_HASH_TAG] = config_hash(full_cfg.export_dict())
     return full_cfg
 
 
@@ -2,12 +2,11 @@ import json
 from pathlib import Path
 from typing import Any
 
-import yaml
+from brickops.yamlutils import read_yaml
 
 
 def read_config_yaml(cfgfile: str | Path) -> dict[str, Any]:
-    with Path(cfgfile).open() as stream:
-        return yaml.safe_load(stream)  # type: ignore [no-any-return]
+    return read_yaml(cfgfile)  # type: ignore [no-any-return]
 
 
 def read_config_json(cfgfile: str | Path) -> dict[str, Any]:
@@ -1,37 +1,260 @@
 from __future__ import annotations
 
+import configparser
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
+from brickops.cache import TTLCache
 from brickops.databricks import api
+from brickops.diskcache import get_disk_cache
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from brickops.databricks.context import DbContext
 
+    GitSourceProvider = Callable[[DbContext], dict[str, Any]]
+
 logger = logging.getLogger(__name__)
 
+# Seconds a resolved git source is reused within the process
+GIT_SOURCE_TTL = 300.0
+
+# Prefix of workspace files when exposed on the driver filesystem
+WORKSPACE_MOUNT = "/Workspace"
+
+# Databricks git provider names by remote host
+GIT_PROVIDERS = {
+    "github.com": "gitHub",
+    "gitlab.com": "gitLab",
+    "bitbucket.org": "bitbucketCloud",
+    "dev.azure.com": "azureDevOpsServices",
+    "visualstudio.com": "azureDevOpsServices",
+}
+
+_git_source_cache: TTLCache[tuple[str, str], dict[str, Any]] = TTLCache(
+    maxsize=256, ttl=GIT_SOURCE_TTL
+)
+
 
 def git_source(db_context: DbContext) -> dict[str, Any]:
-    """Get git source information for a repo."""
-    if not db_context.api_url:
+    """Get git source information for a repo.
+
+    Providers are tried in order, see register_git_source_provider(), and
+    the first non-empty result is used. By default the local .git folder is
+    read first, then the repos api is asked.
+
+    Results are cached per api url and notebook path for GIT_SOURCE_TTL
+    seconds, see clear_git_source_cache(). If BRICKOPS_CACHE_DIR is set,
+    resolved sources are also shared with other processes through the disk
+    cache, see brickops.diskcache, for at most GIT_SOURCE_TTL seconds.
+    """
+    key = (db_context.api_url, db_context.notebook_path)
+    cached = _git_source_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+
+    disk_cache = get_disk_cache()
+    src = disk_cache.get("git_source", key) if disk_cache else None
+    if src is None:
+        try:
+            src = _resolve_git_source(db_context)
+        except api.ApiClientError:
+            logger.warning("Failed while getting git information from api")
+            return {}
+        if src and disk_cache:
+            ttl = min(disk_cache.ttl, GIT_SOURCE_TTL)
+            disk_cache.set("git_source", key, src, ttl=ttl)
+    _git_source_cache.set(key, src)
+    return dict(src)
+
+
+def _resolve_git_source(db_context: DbContext) -> dict[str, Any]:
+    for provider in _providers:
+        if src := provider(db_context):
+            return src
+    return {}
+
+
+def register_git_source_provider(
+    provider: GitSourceProvider, *, first: bool = False
+) -> None:
+    """Add a git source provider, last in the chain unless first is True.
+
+    A provider returns a dict with git_url, git_provider, git_branch,
+    git_commit and git_path, or an empty dict if it does not know the repo.
+    """
+    if first:
+        _providers.insert(0, provider)
+    else:
+        _providers.append(provider)
+    clear_git_source_cache()
+
+
+def unregister_git_source_provider(provider: GitSourceProvider) -> None:
+    _providers.remove(provider)
+    clear_git_source_cache()
+
+
+def clear_git_source_cache() -> None:
+    """Forget cached git sources, e.g. after checking out another branch."""
+    _git_source_cache.clear()
+
+
+def local_git_source(db_context: DbContext) -> dict[str, Any]:
+    """Read git source information from the .git folder of a checkout.
+
+    The notebook path is looked up as is, e.g. on CI runners, and under
+    /Workspace, where Databricks exposes Git folders on the driver.
+    Checkouts Databricks could not clone are left to the next provider:
+    no origin remote, an origin on an unknown host or a detached HEAD.
+    Credentials in the origin url are dropped and ssh remotes are rewritten
+    to https.
+    """
+    notebook_path = db_context.notebook_path
+    if not notebook_path:
         return {}
+    for mount in ("", WORKSPACE_MOUNT):
+        root = _find_git_root(Path(mount + notebook_path))
+        if root is None:
+            continue
+        src = _read_git_folder(root / ".git")
+        if not src or not src["git_provider"] or not src["git_branch"]:
+            logger.debug(f"Git checkout in {root} is not usable as git source")
+            return {}
+        src["git_path"] = str(root)[len(mount) :]
+        return src
+    return {}
 
-    try:
-        api_client = api.ApiClient(db_context.api_url, db_context.api_token)
-        repos = api_client.get_repos()
-        repo = next(r for r in repos if db_context.notebook_path.startswith(r["path"]))
-        return {
-            "git_url": repo["url"],
-            "git_provider": repo["provider"],
-            "git_branch": repo.get("branch", ""),
-            "git_commit": repo["head_commit_id"],
-            "git_path": repo["path"],
-        }
-    except api.ApiClientError:
-        logger.warning("Failed while getting git information from api")
+
+def repos_api_git_source(db_context: DbContext) -> dict[str, Any]:
+    """Get git source information for a repo from the repos api."""
+    if not db_context.api_url:
         return {}
-    except StopIteration:
+    api_client = api.ApiClient(db_context.api_url, db_context.api_token)
+    repo = api_client.find_repo(db_context.notebook_path)
+    if repo is None:
         logger.info(
             "Repo does not exists or user does not have access to git information."
         )
         return {}
+    return {
+        "git_url": repo["url"],
+        "git_provider": repo["provider"],
+        "git_branch": repo.get("branch", ""),
+        "git_commit": repo["head_commit_id"],
+        "git_path": repo["path"],
+    }
+
+
+def git_provider(url: str) -> str:
+    """Return the Databricks git provider name for a remote url, or ''."""
+    for host, provider in GIT_PROVIDERS.items():
+        if host in url:
+            return provider
+    return ""
+
+
+def _find_git_root(path: Path) -> Path | None:
+    """Return the closest folder above path containing .git, if any."""
+    for folder in path.parents:
+        if folder.parent == folder:  # Do not treat the filesystem root as a repo
+            return None
+        if (folder / ".git").exists():
+            return folder
+    return None
+
+
+def _read_git_folder(dotgit: Path) -> dict[str, Any]:
+    try:
+        git_dir = _resolve_git_dir(dotgit)
+        common_dir = _common_dir(git_dir)
+        head = (git_dir / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            ref = head[len("ref: ") :]
+            branch = ref.removeprefix("refs/heads/")
+            commit = _resolve_ref(git_dir, common_dir, ref)
+        else:  # Detached head
+            branch, commit = "", head
+        url = _https_url(_origin_url(common_dir))
+    except (OSError, ValueError) as err:
+        logger.debug(f"Could not read git metadata in {dotgit}: {err!r}")
+        return {}
+    if not commit:
+        return {}
+    return {
+        "git_url": url,
+        "git_provider": git_provider(url),
+        "git_branch": branch,
+        "git_commit": commit,
+    }
+
+
+def _resolve_git_dir(dotgit: Path) -> Path:
+    """Follow a .git file, as used by worktrees and submodules."""
+    if dotgit.is_file():
+        gitdir = dotgit.read_text().strip().removeprefix("gitdir: ")
+        return (dotgit.parent / gitdir).resolve()
+    return dotgit
+
+
+def _common_dir(git_dir: Path) -> Path:
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        return (git_dir / commondir.read_text().strip()).resolve()
+    return git_dir
+
+
+def _resolve_ref(git_dir: Path, common_dir: Path, ref: str) -> str:
+    for folder in dict.fromkeys((git_dir, common_dir)):
+        ref_file = folder / ref
+        if ref_file.is_file():
+            return ref_file.read_text().strip()
+    packed_refs = common_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            if line.startswith(("#", "^")):
+                continue
+            commit, _, name = line.partition(" ")
+            if name == ref:
+                return commit
+    return ""
+
+
+def _origin_url(common_dir: Path) -> str:
+    config = configparser.ConfigParser(
+        strict=False, interpolation=None, allow_no_value=True
+    )
+    try:
+        config.read(common_dir / "config")
+    except configparser.Error:
+        return ""
+    return config.get('remote "origin"', "url", fallback="") or ""
+
+
+def _https_url(url: str) -> str:
+    """Return url as an https url without credentials, or '' if not possible.
+
+    Handles https urls with a user or token, as in CI clones, and ssh
+    remotes, both ssh://git@host/path and scp-like git@host:path.
+    """
+    if "://" not in url:
+        userhost, sep, path = url.partition(":")
+        if not sep or "/" in userhost:  # A local path
+            return ""
+        url = f"ssh://{userhost}/{path.lstrip('/')}"
+    parts = urlsplit(url)
+    host, path = parts.hostname, parts.path
+    if parts.scheme not in ("https", "ssh") or not host:
+        return ""
+    if host == "ssh.dev.azure.com" and path.startswith("/v3/"):
+        org, project, name = path[len("/v3/") :].split("/", 2)
+        host, path = "dev.azure.com", f"/{org}/{project}/_git/{name}"
+    elif parts.scheme == "https" and parts.port:
+        host = f"{host}:{parts.port}"
+    return f"https://{host}{path}"
+
+
+_providers: list[GitSourceProvider] = [local_git_source, repos_api_git_source]
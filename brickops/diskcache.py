@@ -0,0 +1,113 @@
+"""Opt-in cache of small JSON values shared by processes on the same machine.
+
+Notebook tasks of a multi-task job run in separate Python processes, so
+in-process caches start empty for every task. Set BRICKOPS_CACHE_DIR to a
+folder on the driver or a volume to let them share resolved values, e.g.
+git source and naming context. Entries expire after BRICKOPS_CACHE_TTL
+seconds (default one hour), or earlier if the writer passes a shorter ttl.
+
+Each entry is one JSON file, written to a temporary file and renamed into
+place, so concurrent readers never see a partial write.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV_VAR = "BRICKOPS_CACHE_DIR"
+CACHE_TTL_ENV_VAR = "BRICKOPS_CACHE_TTL"
+DEFAULT_TTL = 3600.0
+
+
+class DiskCache:
+    """JSON file per entry, under directory/namespace/."""
+
+    def __init__(
+        self: DiskCache, directory: str | Path, ttl: float = DEFAULT_TTL
+    ) -> None:
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def get(self: DiskCache, namespace: str, key: Any) -> Any | None:
+        """Return the value stored under key, or None if missing or expired."""
+        path = self._path(namespace, key)
+        try:
+            entry = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {err!r}")
+            return None
+        if not isinstance(entry, dict):
+            return None
+        expired = entry.get("expires", 0) <= time.time()
+        if expired or entry.get("key") != _normalize(key):
+            return None
+        return entry.get("value")
+
+    def set(
+        self: DiskCache,
+        namespace: str,
+        key: Any,
+        value: Any,
+        ttl: float | None = None,
+    ) -> None:
+        """Store a JSON serializable value under key. Failures are only logged."""
+        path = self._path(namespace, key)
+        entry = {
+            "key": _normalize(key),
+            "expires": time.time() + (self.ttl if ttl is None else ttl),
+            "value": value,
+        }
+        try:
+            data = json.dumps(entry)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.")
+        except (OSError, TypeError, ValueError) as err:
+            logger.warning(f"Could not write cache entry {path}: {err!r}")
+            return
+        try:
+            with os.fdopen(fd, "w") as tmp:
+                tmp.write(data)
+            os.replace(tmp_name, path)
+        except OSError as err:
+            logger.warning(f"Could not write cache entry {path}: {err!r}")
+            Path(tmp_name).unlink(missing_ok=True)
+
+    def clear(self: DiskCache, namespace: str) -> None:
+        """Remove all entries of a namespace."""
+        for path in (self.directory / namespace).glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _path(self: DiskCache, namespace: str, key: Any) -> Path:
+        digest = hashlib.sha256(
+            json.dumps(_normalize(key), sort_keys=True).encode()
+        ).hexdigest()
+        return self.directory / namespace / f"{digest}.json"
+
+
+def get_disk_cache() -> DiskCache | None:
+    """Return the cache configured by BRICKOPS_CACHE_DIR, or None if unset."""
+    directory = os.environ.get(CACHE_DIR_ENV_VAR)
+    if not directory:
+        return None
+    ttl = os.environ.get(CACHE_TTL_ENV_VAR)
+    try:
+        return DiskCache(directory, ttl=float(ttl) if ttl else DEFAULT_TTL)
+    except ValueError:
+        logger.warning(f"Invalid {CACHE_TTL_ENV_VAR} {ttl!r}, using {DEFAULT_TTL}")
+        return DiskCache(directory)
+
+
+def _normalize(key: Any) -> Any:
+    """Return key as it reads back from JSON, e.g. tuples become lists."""
+    return json.loads(json.dumps(key))
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
+import asyncio
 import logging
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 
 from brickops.databricks.api import ApiClient
 from brickops.databricks.context import get_context
 from brickops.databricks.username import get_username
 
+if TYPE_CHECKING:
+    from brickops.databricks.asyncapi import AsyncApiClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +30,7 @@ def get_api_client() -> ApiClient:
 def get_jobs(api_client: ApiClient) -> list[Job]:
     context = get_context()
     username = get_username(context)
-    jobs = api_client.get_jobs()
+    jobs = api_client.iter_jobs()
     return [
         Job(job["settings"]["name"], job["job_id"])
         for job in jobs
@@ -43,10 +49,10 @@ def get_schemas(api_client: ApiClient) -> list[str]:
     """Get all schemas that contain the username of the current user."""
     context = get_context()
     username = get_username(context)
-    catalogs = api_client.get_catalogs()
+    catalogs = api_client.iter_catalogs()
     schemas = []
     for catalog in catalogs:
-        schemas_in_catalog = api_client.get_schemas(catalog["name"])
+        schemas_in_catalog = api_client.iter_schemas(catalog["name"])
         schemas.extend(
             [
                 schema["full_name"]
@@ -60,7 +66,12 @@ def get_schemas(api_client: ApiClient) -> list[str]:
 def get_tables_for_schema(api_client: ApiClient, full_name: str) -> list[str]:
     """Find full name of all tables in a schema."""
     catalog, schema = full_name.split(".")
-    return [tbl["full_name"] for tbl in api_client.get_tables(catalog, schema)]
+    return [
+        tbl["full_name"]
+        for tbl in api_client.iter_tables(
+            catalog, schema, omit_columns=True, omit_properties=True
+        )
+    ]
 
 
 def delete_schema(api_client: ApiClient, full_name: str) -> None:
@@ -71,3 +82,40 @@ def delete_schema(api_client: ApiClient, full_name: str) -> None:
             api_client.delete_table(table)
     logger.info(f"Deleting schema={full_name}")
     api_client.delete_schema(full_name)
+
+
+async def get_schemas_concurrently(api_client: AsyncApiClient) -> list[str]:
+    """Get all schemas that contain the username of the current user.
+
+    Like get_schemas, but lists the schemas of all catalogs concurrently.
+    """
+    context = get_context()
+    username = get_username(context)
+    catalogs = await api_client.get_catalogs()
+    schemas_per_catalog = await asyncio.gather(
+        *(api_client.get_schemas(catalog["name"]) for catalog in catalogs)
+    )
+    return [
+        schema["full_name"]
+        for schemas_in_catalog in schemas_per_catalog
+        for schema in schemas_in_catalog
+        if username in schema["full_name"]
+    ]
+
+
+async def delete_schema_concurrently(
+    api_client: AsyncApiClient, full_name: str
+) -> None:
+    """Delete a schema including all tables in it, deleting the tables concurrently."""
+    catalog, schema = full_name.split(".")
+    tables = [
+        tbl["full_name"]
+        for tbl in await api_client.get_tables(
+            catalog, schema, omit_columns=True, omit_properties=True
+        )
+    ]
+    for table in tables:
+        logger.info(f"Deleting {table}")
+    await asyncio.gather(*(api_client.delete_table(table) for table in tables))
+    logger.info(f"Deleting schema={full_name}")
+    await api_client.delete_schema(full_name)
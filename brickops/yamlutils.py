@@ -0,0 +1,61 @@
+"""YAML loading for config files.
+
+Files are parsed with libyaml's CSafeLoader when PyYAML is built with it,
+and the pure Python SafeLoader otherwise. If the disk cache is enabled (see
+brickops.diskcache), the parsed content is also stored as a JSON snapshot
+keyed by the sha256 of the file, so loading an unchanged file again skips
+YAML parsing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from brickops.diskcache import get_disk_cache
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore [assignment]
+
+logger = logging.getLogger(__name__)
+
+# Snapshots are keyed by content, so they only expire to keep the cache small
+SNAPSHOT_TTL = 7 * 24 * 3600.0
+
+
+def load_yaml(content: str | bytes) -> Any:
+    """Parse YAML content with the fastest available safe loader."""
+    return yaml.load(content, Loader=SafeLoader)
+
+
+def read_yaml(path: str | Path) -> Any:
+    """Read and parse a YAML file, reusing a JSON snapshot if available."""
+    content = Path(path).read_bytes()
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return load_yaml(content)
+    digest = hashlib.sha256(content).hexdigest()
+    snapshot = disk_cache.get("yaml", digest)
+    if isinstance(snapshot, dict) and "data" in snapshot:
+        return snapshot["data"]
+    data = load_yaml(content)
+    if _json_safe(data):
+        disk_cache.set("yaml", digest, {"data": data}, ttl=SNAPSHOT_TTL)
+    else:
+        logger.debug(f"Not snapshotting {path}, content does not round trip as json")
+    return data
+
+
+def _json_safe(data: Any) -> bool:
+    """Whether data reads back unchanged from JSON, e.g. has no dates or int keys."""
+    try:
+        return bool(json.loads(json.dumps(data)) == data)
+    except (TypeError, ValueError):
+        return False
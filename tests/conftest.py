@@ -1,8 +1,12 @@
 import yaml
 import pytest
+from collections.abc import Iterator
 from typing import Any
 from pathlib import Path
 
+from brickops.datamesh.naming import clear_pipeline_contexts
+from brickops.dataops.deploy.repo import clear_git_source_cache
+
 
 def read_config(cfg_path: Path) -> dict[str, Any] | Any:
     """Read the configuration from the YAML file."""
@@ -18,3 +22,13 @@ def brickops_default_config() -> dict[str, Any] | Any:
 @pytest.fixture
 def brickops_fullmesh_config() -> dict[str, Any] | Any:
     return read_config(Path(__file__).parent / "datamesh/fixtures/configs/fullmesh.yml")
+
+
+@pytest.fixture(autouse=True)
+def clear_naming_caches() -> Iterator[None]:
+    """Keep resolved naming contexts from leaking between tests."""
+    clear_pipeline_contexts()
+    clear_git_source_cache()
+    yield
+    clear_pipeline_contexts()
+    clear_git_source_cache()
@@ -77,3 +77,111 @@ def test_delete_table_with_requests_exception(requests_mock: Any) -> None:  # no
         client.delete_table(full_name=schema_name)
 
     assert exc.value.message == "Api error while making DELETE call:"
+
+
+def test_iter_jobs_requests_pages_lazily(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token")
+    requests_mock.get(
+        "https://test.com/api/2.2/jobs/list",
+        json={"jobs": [{"id": 1}, {"id": 2}], "next_page_token": "token"},
+    )
+    jobs = client.iter_jobs(page_size=2)
+    assert next(jobs) == {"id": 1}
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.qs == {"limit": ["2"], "expand_tasks": ["false"]}
+
+
+def test_get_pipelines_paginates_on_same_endpoint(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token")
+    requests_mock.get(
+        "https://test.com/api/2.0/pipelines",
+        json={"statuses": [{"pipeline_id": "1"}], "next_page_token": "token"},
+    )
+    requests_mock.get(
+        "https://test.com/api/2.0/pipelines?page_token=token",
+        json={"statuses": [{"pipeline_id": "2"}]},
+    )
+    assert client.get_pipelines() == [{"pipeline_id": "1"}, {"pipeline_id": "2"}]
+    assert requests_mock.last_request.qs == {
+        "max_results": ["100"],
+        "page_token": ["token"],
+    }
+
+
+def test_get_tables_follows_next_page_token(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token")
+    requests_mock.get(
+        "https://test.com/api/2.1/unity-catalog/tables",
+        json={"tables": [{"full_name": "c.s.a"}], "next_page_token": "token"},
+    )
+    requests_mock.get(
+        "https://test.com/api/2.1/unity-catalog/tables?page_token=token",
+        json={"tables": [{"full_name": "c.s.b"}]},
+    )
+    assert client.get_tables("c", "s") == [
+        {"full_name": "c.s.a"},
+        {"full_name": "c.s.b"},
+    ]
+
+
+def test_iter_tables_can_omit_columns_and_properties(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token")
+    requests_mock.get(
+        "https://test.com/api/2.1/unity-catalog/tables", json={"tables": []}
+    )
+    list(client.iter_tables("c", "s", omit_columns=True, omit_properties=True))
+    assert requests_mock.last_request.qs["omit_columns"] == ["true"]
+    assert requests_mock.last_request.qs["omit_properties"] == ["true"]
+    assert requests_mock.last_request.qs["max_results"] == ["1000"]
+
+
+def test_get_schemas_follows_next_page_token(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token")
+    requests_mock.get(
+        "https://test.com/api/2.1/unity-catalog/schemas",
+        json={"schemas": [{"name": "a"}], "next_page_token": "token"},
+    )
+    requests_mock.get(
+        "https://test.com/api/2.1/unity-catalog/schemas?page_token=token",
+        json={"schemas": [{"name": "b"}]},
+    )
+    assert client.get_schemas("c") == [{"name": "a"}, {"name": "b"}]
+
+
+def test_get_repos_lists_all_prefixes_with_pagination(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token")
+
+    def respond(request: Any, context: Any) -> dict[str, Any]:  # noqa: ANN401
+        prefix = request.qs["path_prefix"][0]
+        if "page_token" in request.qs:
+            return {"repos": [{"path": f"{prefix}/b"}]}
+        return {"repos": [{"path": f"{prefix}/a"}], "next_page_token": "token"}
+
+    requests_mock.get("https://test.com/api/2.0/repos", json=respond)
+    paths = [repo["path"] for repo in client.get_repos()]
+    assert paths == [
+        "/repos/a",
+        "/repos/b",
+        "/users/a",
+        "/users/b",
+        "/shared/a",
+        "/shared/b",
+    ]
+
+
+def test_find_repo_only_lists_repos_under_notebook_owner(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token")
+    requests_mock.get(
+        "https://test.com/api/2.0/repos",
+        json={
+            "repos": [
+                {"path": "/Repos/user@test.com/dp"},
+                {"path": "/Repos/user@test.com/dp-notebooks"},
+            ],
+            "next_page_token": "token",
+        },
+    )
+    repo = client.find_repo("/Repos/user@test.com/dp-notebooks/domains/nb")
+    assert repo == {"path": "/Repos/user@test.com/dp-notebooks"}
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.qs["path_prefix"] == ["/repos/user@test.com"]
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from brickops.databricks.api import ApiClient, ApiClientError
+from brickops.databricks.asyncapi import AsyncApiClient
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for the Databricks REST API."""
+
+    deleted: list[str] = []  # noqa: RUF012
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/api/2.1/unity-catalog/tables"):
+            self._reply(200, {"tables": [{"full_name": "cat.schema.tbl"}]})
+        else:
+            self._reply(404, {"error_code": "NOT_FOUND"})
+
+    def do_DELETE(self) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        threading.Event().wait(0.05)
+        with cls.lock:
+            cls.in_flight -= 1
+            cls.deleted.append(self.path.rsplit("/", 1)[-1])
+        self._reply(200, {})
+
+    def _reply(self, status: int, body: dict[str, Any]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: Any) -> None:  # noqa: ANN401
+        pass
+
+
+@pytest.fixture
+def stub_server() -> Iterator[str]:
+    StubHandler.deleted = []
+    StubHandler.max_in_flight = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_tables_against_stub_server(stub_server: str) -> None:
+    async def run() -> list[dict[str, Any]]:
+        async with AsyncApiClient(stub_server, "test_token") as client:
+            return await client.get_tables("cat", "schema")
+
+    assert asyncio.run(run()) == [{"full_name": "cat.schema.tbl"}]
+
+
+def test_concurrent_deletes_respect_concurrency_limit(stub_server: str) -> None:
+    tables = [f"cat.schema.tbl{i}" for i in range(12)]
+
+    async def run() -> None:
+        async with AsyncApiClient(stub_server, "test_token", concurrency=4) as client:
+            await asyncio.gather(*(client.delete_table(tbl) for tbl in tables))
+
+    asyncio.run(run())
+    assert sorted(StubHandler.deleted) == sorted(tables)
+    assert 1 < StubHandler.max_in_flight <= 4
+
+
+def test_errors_are_raised_as_api_client_error(stub_server: str) -> None:
+    async def run() -> None:
+        async with AsyncApiClient(stub_server, "test_token") as client:
+            await client.get_clusters()
+
+    with pytest.raises(ApiClientError):
+        asyncio.run(run())
+
+
+def test_iter_tables_against_stub_server(stub_server: str) -> None:
+    async def run() -> list[dict[str, Any]]:
+        async with AsyncApiClient(stub_server, "test_token") as client:
+            return [table async for table in client.iter_tables("cat", "schema")]
+
+    assert asyncio.run(run()) == [{"full_name": "cat.schema.tbl"}]
+
+
+def test_public_api_client_methods_are_mirrored() -> None:
+    public = {
+        name
+        for name in vars(ApiClient)
+        if not name.startswith("_") and callable(getattr(ApiClient, name))
+    }
+    internal = {"paginate", "unpack_response", "send", "build_url", "handle_errors"}
+    assert public - internal - set(vars(AsyncApiClient)) == set()
@@ -0,0 +1,64 @@
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+import brickops
+from brickops.databricks import context
+from brickops.databricks.context import get_context, get_dbutils, get_spark
+
+
+@pytest.fixture(autouse=True)
+def reset_context() -> Iterator[None]:
+    context._registered.clear()
+    context.refresh_context()
+    yield
+    context._registered.clear()
+    context.refresh_context()
+
+
+def fake_dbutils(notebook_path: str = "/Repos/user@test.com/nb") -> MagicMock:
+    dbutils = MagicMock()
+    ctx = dbutils.notebook.entry_point.getDbutils().notebook().getContext()
+    ctx.apiUrl().get.return_value = "https://test.com"
+    ctx.apiToken().get.return_value = "token"
+    ctx.notebookPath().get.return_value = notebook_path
+    ctx.userName().get.return_value = "user@test.com"
+    dbutils.widgets.getAll.return_value = {"pipeline_env": "test"}
+    return dbutils
+
+
+def test_get_dbutils_finds_dbutils_in_calling_frames() -> None:
+    dbutils = fake_dbutils()
+    namespace = {"dbutils": dbutils, "get_dbutils": get_dbutils}
+    exec("found = get_dbutils()", namespace)  # noqa: S102
+    assert namespace["found"] is dbutils
+
+
+def test_get_spark_without_spark_fails() -> None:
+    with pytest.raises(RuntimeError, match="spark not found"):
+        get_spark()
+
+
+def test_get_context_is_cached_per_dbutils() -> None:
+    dbutils = fake_dbutils()
+    first = get_context(dbutils)
+    assert get_context(dbutils) is first
+    assert dbutils.widgets.getAll.call_count == 1
+    assert get_context(fake_dbutils("/other")).notebook_path == "/other"
+
+
+def test_get_context_refresh_reads_context_again() -> None:
+    dbutils = fake_dbutils()
+    get_context(dbutils)
+    dbutils.widgets.getAll.return_value = {"pipeline_env": "prod"}
+    assert get_context(dbutils, refresh=True).widgets == {"pipeline_env": "prod"}
+
+
+def test_init_registers_dbutils_and_spark() -> None:
+    dbutils = fake_dbutils()
+    spark = MagicMock()
+    brickops.init(dbutils, spark)
+    assert get_dbutils() is dbutils
+    assert get_spark() is spark
+    assert get_context().notebook_path == "/Repos/user@test.com/nb"
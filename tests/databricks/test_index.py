@@ -0,0 +1,115 @@
+from typing import Any
+
+import pytest
+
+from brickops.databricks.api import ApiClient
+
+JOBS = [
+    {"job_id": 1, "settings": {"name": "flow_a"}},
+    {"job_id": 2, "settings": {"name": "flow_b"}},
+]
+
+
+@pytest.fixture
+def indexed_client(requests_mock: Any) -> ApiClient:  # noqa: ANN401
+    requests_mock.get("https://test.com/api/2.2/jobs/list", json={"jobs": JOBS})
+    client = ApiClient("https://test.com", "test_token")
+    client.build_job_index()
+    return client
+
+
+def test_job_lookups_are_answered_from_index(
+    indexed_client: ApiClient,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    assert indexed_client.get_job_by_name("flow_b") == {
+        "job_id": 2,
+        "settings": {"name": "flow_b"},
+    }
+    assert indexed_client.get_job_by_name("missing") is None
+    assert requests_mock.call_count == 1
+
+
+def test_created_jobs_are_added_to_index(
+    indexed_client: ApiClient,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    requests_mock.post("https://test.com/api/2.1/jobs/create", json={"job_id": 3})
+    indexed_client.create_job("flow_c", {"name": "flow_c"})
+    job = indexed_client.get_job_by_name("flow_c")
+    assert job is not None
+    assert job["job_id"] == 3
+
+
+def test_deleted_jobs_are_removed_from_index(
+    indexed_client: ApiClient,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    requests_mock.post("https://test.com/api/2.1/jobs/delete", json={})
+    indexed_client.delete_job("1")
+    assert indexed_client.get_job_by_name("flow_a") is None
+    assert indexed_client.job_index is not None
+    assert len(indexed_client.job_index) == 1
+
+
+def test_pipeline_lookup_without_index_matches_exact_name(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token")
+    requests_mock.get(
+        "https://test.com/api/2.0/pipelines",
+        json={
+            "statuses": [
+                {"pipeline_id": "1", "name": "sales_core_prod_dlt_x"},
+                {"pipeline_id": "2", "name": "sales_core_prod_dlt"},
+            ]
+        },
+    )
+    pipeline = client.get_pipeline_by_name("sales_core_prod_dlt")
+    assert pipeline is not None
+    assert pipeline["pipeline_id"] == "2"
+    assert requests_mock.last_request.qs["filter"] == [
+        "name like 'sales_core_prod_dlt'"
+    ]
+
+
+def test_pipeline_lookup_without_match_returns_none(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token")
+    requests_mock.get("https://test.com/api/2.0/pipelines", json={})
+    assert client.get_pipeline_by_name("sales_core_prod_dlt") is None
+
+
+def test_pipeline_index_is_kept_up_to_date(requests_mock: Any) -> None:  # noqa: ANN401
+    requests_mock.get(
+        "https://test.com/api/2.0/pipelines",
+        json={"statuses": [{"pipeline_id": "1", "name": "flow_a_dlt"}]},
+    )
+    requests_mock.post("https://test.com/api/2.0/pipelines", json={"pipeline_id": "2"})
+    requests_mock.post("https://test.com/api/2.1/pipelines/delete", json={})
+    client = ApiClient("https://test.com", "test_token")
+    client.build_pipeline_index()
+
+    client.create_pipeline("flow_b_dlt", {"name": "flow_b_dlt"})
+    client.delete_pipeline("1")
+
+    assert client.get_pipeline_by_name("flow_a_dlt") is None
+    assert client.get_pipeline_by_name("flow_b_dlt") == {
+        "pipeline_id": "2",
+        "name": "flow_b_dlt",
+    }
+
+
+def test_job_index_keeps_tags_up_to_date(requests_mock: Any) -> None:  # noqa: ANN401
+    requests_mock.get(
+        "https://test.com/api/2.2/jobs/list",
+        json={"jobs": [{"job_id": 1, "settings": {"name": "a", "tags": {"x": "1"}}}]},
+    )
+    requests_mock.post("https://test.com/api/2.1/jobs/reset", json={})
+    client = ApiClient("https://test.com", "test_token")
+    client.build_job_index()
+    assert client.get_job_by_name("a") == {
+        "job_id": 1,
+        "settings": {"name": "a", "tags": {"x": "1"}},
+    }
+    client.update_job(job_id="1", job_name="a", job_config={"tags": {"x": "2"}})
+    job = client.get_job_by_name("a")
+    assert job is not None
+    assert job["settings"]["tags"] == {"x": "2"}
@@ -0,0 +1,63 @@
+from typing import Any
+
+from brickops.databricks.api import ApiClient
+from brickops.databricks.responsecache import ResponseCache, resource_family
+
+
+def test_get_responses_are_served_from_cache(requests_mock: Any) -> None:  # noqa: ANN401
+    cache = ResponseCache()
+    client = ApiClient("https://test.com", "test_token", cache=cache)
+    requests_mock.get(
+        "https://test.com/api/2.1/clusters/list",
+        json={"clusters": [{"cluster_id": "1"}]},
+    )
+    assert client.get_clusters() == [{"cluster_id": "1"}]
+    assert client.get_clusters() == [{"cluster_id": "1"}]
+    assert requests_mock.call_count == 1
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+def test_cached_responses_are_not_shared_between_callers(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token", cache=ResponseCache())
+    requests_mock.get("https://test.com/api/2.1/clusters/list", json={"clusters": []})
+    client.get_clusters().append({"cluster_id": "mutated"})
+    assert client.get_clusters() == []
+
+
+def test_params_are_part_of_the_cache_key(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token", cache=ResponseCache())
+    requests_mock.get("https://test.com/api/2.1/unity-catalog/schemas", json={})
+    client.get_schemas("a")
+    client.get_schemas("b")
+    client.get_schemas("a")
+    assert requests_mock.call_count == 2
+
+
+def test_mutating_call_invalidates_resource_family(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token", cache=ResponseCache())
+    requests_mock.get("https://test.com/api/2.1/jobs/list", json={"jobs": []})
+    requests_mock.get("https://test.com/api/2.1/clusters/list", json={"clusters": []})
+    requests_mock.post("https://test.com/api/2.1/jobs/delete", json={})
+    client.get_job_by_name("job")
+    client.get_clusters()
+    client.delete_job("1")
+    client.get_job_by_name("job")
+    client.get_clusters()
+    # jobs/list is fetched again, clusters/list is still cached
+    assert requests_mock.call_count == 4
+
+
+def test_zero_ttl_disables_caching_for_endpoint(requests_mock: Any) -> None:  # noqa: ANN401
+    cache = ResponseCache(ttls={"clusters": 0})
+    client = ApiClient("https://test.com", "test_token", cache=cache)
+    requests_mock.get("https://test.com/api/2.1/clusters/list", json={"clusters": []})
+    client.get_clusters()
+    client.get_clusters()
+    assert requests_mock.call_count == 2
+
+
+def test_resource_family() -> None:
+    assert resource_family("jobs/reset") == "jobs"
+    assert resource_family("pipelines/123") == "pipelines"
+    assert resource_family("unity-catalog/tables/a.b.c") == "unity-catalog/tables"
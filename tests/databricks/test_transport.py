@@ -0,0 +1,251 @@
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+import pytest_mock
+import requests
+
+from brickops.databricks.api import ApiClient, ApiClientError
+from brickops.databricks.transport import (
+    RateLimiter,
+    RetryPolicy,
+    SingleFlight,
+    close_sessions,
+    get_rate_limiter,
+    get_session,
+    get_single_flight,
+    parse_retry_after,
+)
+
+
+def test_clients_for_same_host_and_token_share_session() -> None:
+    first = ApiClient("https://test.com", "test_token")
+    second = ApiClient("https://test.com", "test_token")
+    assert first.session is second.session
+
+
+def test_clients_with_different_tokens_get_separate_sessions() -> None:
+    first = ApiClient("https://test.com", "test_token")
+    second = ApiClient("https://test.com", "other_token")
+    assert first.session is not second.session
+
+
+def test_pool_size_is_applied_to_new_session() -> None:
+    session = get_session("https://pool.test.com", "test_token", pool_size=32)
+    adapter = session.get_adapter("https://pool.test.com")
+    assert adapter._pool_maxsize == 32  # type: ignore [attr-defined]
+
+
+def test_pool_grows_for_client_asking_for_more_connections() -> None:
+    first = ApiClient("https://grow.test.com", "test_token")
+    second = ApiClient("https://grow.test.com", "test_token", pool_size=32)
+    third = ApiClient("https://grow.test.com", "test_token", pool_size=4)
+    assert first.session is second.session is third.session
+    adapter = first.session.get_adapter("https://grow.test.com")
+    assert adapter._pool_maxsize == 32  # type: ignore [attr-defined]
+
+
+def test_close_sessions_creates_new_session_on_next_use() -> None:
+    session = get_session("https://test.com", "test_token")
+    close_sessions()
+    assert get_session("https://test.com", "test_token") is not session
+
+
+def test_requests_go_through_shared_session(requests_mock: Any) -> None:  # noqa: ANN401
+    client = ApiClient("https://test.com", "test_token")
+    requests_mock.get("https://test.com/api/2.1/clusters/list", json={"clusters": []})
+    assert client.get_clusters() == []
+    assert requests_mock.last_request.headers["Authorization"] == "Bearer test_token"
+
+
+@pytest.fixture
+def no_sleep(mocker: pytest_mock.MockerFixture) -> Any:  # noqa: ANN401
+    """Replace sleeping with a fake clock that advances instantly."""
+    clock = mocker.patch("brickops.databricks.transport.time.monotonic")
+    clock.return_value = 100.0
+
+    def advance(seconds: float) -> None:
+        clock.return_value += seconds
+
+    return mocker.patch("brickops.databricks.transport.time.sleep", side_effect=advance)
+
+
+def test_get_is_retried_after_throttling(requests_mock: Any, no_sleep: Any) -> None:  # noqa: ANN401
+    client = ApiClient(
+        "https://retry.test.com", "test_token", rate_limiter=RateLimiter()
+    )
+    requests_mock.get(
+        "https://retry.test.com/api/2.1/clusters/list",
+        [
+            {"status_code": 429, "headers": {"Retry-After": "2"}},
+            {"status_code": 503},
+            {"json": {"clusters": [{"cluster_id": "1"}]}},
+        ],
+    )
+    assert client.get_clusters() == [{"cluster_id": "1"}]
+    assert requests_mock.call_count == 3
+    assert no_sleep.call_args_list[0].args == (2.0,)
+
+
+def test_get_gives_up_after_max_attempts(requests_mock: Any, no_sleep: Any) -> None:  # noqa: ANN401
+    client = ApiClient(
+        "https://retry.test.com",
+        "test_token",
+        retry_policies={"GET": RetryPolicy(max_attempts=2)},
+        rate_limiter=RateLimiter(),
+    )
+    requests_mock.get("https://retry.test.com/api/2.1/clusters/list", status_code=503)
+    with pytest.raises(ApiClientError):
+        client.get_clusters()
+    assert requests_mock.call_count == 2
+
+
+def test_post_is_not_retried_by_default(requests_mock: Any, no_sleep: Any) -> None:  # noqa: ANN401
+    client = ApiClient(
+        "https://retry.test.com", "test_token", rate_limiter=RateLimiter()
+    )
+    requests_mock.post("https://retry.test.com/api/2.1/jobs/delete", status_code=503)
+    with pytest.raises(ApiClientError):
+        client.delete_job(job_id="1")
+    assert requests_mock.call_count == 1
+    no_sleep.assert_not_called()
+
+
+def test_connection_errors_are_retried_for_idempotent_calls(
+    requests_mock: Any,  # noqa: ANN401
+    no_sleep: Any,  # noqa: ANN401
+) -> None:
+    client = ApiClient(
+        "https://retry.test.com", "test_token", rate_limiter=RateLimiter()
+    )
+    requests_mock.delete(
+        "https://retry.test.com/api/2.1/unity-catalog/tables/a.b.c",
+        [{"exc": requests.exceptions.ConnectionError}, {"json": {}}],
+    )
+    assert client.delete_table(full_name="a.b.c") == {}
+    assert requests_mock.call_count == 2
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 5, 20])
+def test_backoff_is_bounded(attempt: int) -> None:
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=4.0)
+    assert 0 <= policy.backoff(attempt) <= min(4.0, 0.5 * 2**attempt)
+
+
+def test_parse_retry_after_handles_seconds_and_invalid_values() -> None:
+    response = requests.Response()
+    assert parse_retry_after(response) is None
+    response.headers["Retry-After"] = "3"
+    assert parse_retry_after(response) == 3.0
+    response.headers["Retry-After"] = "not a date"
+    assert parse_retry_after(response) is None
+
+
+def test_rate_limiter_waits_for_pause(no_sleep: Any) -> None:  # noqa: ANN401
+    limiter = RateLimiter(rate=10, burst=1)
+    limiter.pause(5)
+    limiter.acquire()
+    assert no_sleep.call_args_list[0].args == (5.0,)
+
+
+def test_rate_limiter_spaces_requests_beyond_burst(no_sleep: Any) -> None:  # noqa: ANN401
+    limiter = RateLimiter(rate=10, burst=2)
+    for _ in range(4):
+        limiter.acquire()
+    assert sum(call.args[0] for call in no_sleep.call_args_list) == pytest.approx(0.2)
+
+
+def test_rate_limiter_is_shared_per_host() -> None:
+    assert get_rate_limiter("https://test.com") is get_rate_limiter("https://test.com")
+    assert get_rate_limiter("https://test.com") is not get_rate_limiter(
+        "https://other.test.com"
+    )
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float = 5) -> bool:
+    """Poll predicate until it holds, giving up after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        threading.Event().wait(0.001)
+    return True
+
+
+def join_all(threads: list[threading.Thread], timeout: float = 5) -> None:
+    for thread in threads:
+        thread.join(timeout)
+    assert not any(thread.is_alive() for thread in threads)
+
+
+def test_single_flight_coalesces_concurrent_calls() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow() -> int:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 42
+
+    results: list[tuple[int, bool]] = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", slow)))
+    leader.start()
+    assert started.wait(5)
+    waiters = [
+        threading.Thread(target=lambda: results.append(flight.do("key", slow)))
+        for _ in range(3)
+    ]
+    for waiter in waiters:
+        waiter.start()
+    assert wait_until(lambda: flight._calls["key"].waiters == 3)
+    release.set()
+    join_all([leader, *waiters])
+
+    assert len(calls) == 1
+    assert results == [(42, True)] * 4
+
+
+def test_single_flight_shares_exceptions() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+
+    def failing() -> int:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        flight.do("key", failing)
+    assert flight.do("key", lambda: 1) == (1, False)
+
+
+def test_concurrent_identical_gets_are_sent_once(requests_mock: Any) -> None:  # noqa: ANN401
+    release = threading.Event()
+
+    def respond(request: Any, context: Any) -> dict[str, Any]:  # noqa: ANN401
+        release.wait(5)
+        return {"repos": [{"path": "/Repos/a"}]}
+
+    requests_mock.get("https://flight.test.com/api/2.0/repos", json=respond)
+    results: list[list[dict[str, Any]]] = []
+
+    def fetch() -> None:
+        client = ApiClient("https://flight.test.com", "test_token")
+        results.append(client.get("repos", version="2.0")["repos"])
+
+    threads = [threading.Thread(target=fetch) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    flight = get_single_flight("https://flight.test.com", "test_token")
+    assert wait_until(
+        lambda: any(call.waiters == 4 for call in list(flight._calls.values()))
+    )
+    release.set()
+    join_all(threads)
+
+    assert requests_mock.call_count == 1
+    assert results == [[{"path": "/Repos/a"}]] * 5
+    results[0].append({"path": "mutated"})
+    assert results[1] == [{"path": "/Repos/a"}]
@@ -0,0 +1,40 @@
+import pytest
+
+from brickops.datamesh.parsepath.extractname import (
+    PipelineContext,
+    compile_naming_config,
+)
+from brickops.datamesh.parsepath.parse import ParsedPath
+
+
+def test_compiled_naming_config_only_needs_its_placeholders() -> None:
+    template = compile_naming_config("db", "{env}_{username}_{db}_{env}")
+    assert template.fields == ("env", "username", "db")
+
+
+def test_compiled_naming_config_renders_name() -> None:
+    template = compile_naming_config("db", "{org}_{domain}_{env}_{db}")
+    name = template.render(
+        parsed_path=ParsedPath(domain="sales", project="p", flow="f", flowtype="t"),
+        pipeline_context=PipelineContext(
+            username="user", gitbranch="main", gitshortref="abcdefgh", env="test"
+        ),
+        resource_name="dbfoo",
+    )
+    assert name == "_sales_test_dbfoo"
+
+
+def test_compiled_naming_config_is_reused() -> None:
+    assert compile_naming_config("job", "{domain}_{env}") is compile_naming_config(
+        "job", "{domain}_{env}"
+    )
+
+
+def test_naming_config_with_unknown_placeholder_fails() -> None:
+    with pytest.raises(ValueError, match="'branch'"):
+        compile_naming_config("job", "{domain}_{branch}")
+
+
+def test_naming_config_with_invalid_characters_fails() -> None:
+    with pytest.raises(ValueError, match="Only alphanumeric"):
+        compile_naming_config("job", "{domain}.{env}")
@@ -1,14 +1,23 @@
+import json
+from pathlib import Path
+
 import pytest
 import pytest_mock
 
 from typing import Any
 from brickops.databricks.context import DbContext
+from brickops.datamesh import naming
+from brickops.dataops.deploy.repo import GIT_SOURCE_TTL
 from brickops.datamesh.naming import (
     dbname,
     tablename,
+    tablenames,
+    NamingSession,
     jobname,
     pipelinename,
     name_from_path,
+    clear_pipeline_contexts,
+    set_pipeline_context_ttl,
 )
 
 
@@ -234,3 +243,225 @@ def test_pipelinename(
 ) -> None:
     result = pipelinename(db_context=db_context, env="test")
     assert result == "domainfoo_projectfoo_test_TestUser_gitbranch_abcdefgh_dlt"
+
+
+def test_pipeline_context_is_resolved_once_per_notebook(
+    db_context_empty_widgets_short_path: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+) -> None:
+    git_source = mocker.patch(
+        "brickops.datamesh.naming.git_source", return_value=GIT_SOURCE
+    )
+    for tbl in ["tbl1", "tbl2", "tbl3"]:
+        tablename(
+            tbl=tbl,
+            db="dbfoo",
+            cat="training",
+            db_context=db_context_empty_widgets_short_path,
+        )
+    assert git_source.call_count == 1
+
+
+def test_pipeline_context_is_resolved_again_when_widgets_change(
+    db_context: DbContext,
+) -> None:
+    assert dbname(db_context=db_context, db="test_db", cat="training") == (
+        "training.test_TestUser_gitbranch_abcdefgh_test_db"
+    )
+    db_context.widgets["git_branch"] = "other"
+    assert dbname(db_context=db_context, db="test_db", cat="training") == (
+        "training.test_TestUser_other_abcdefgh_test_db"
+    )
+
+
+def test_pipeline_context_is_resolved_again_after_clear_or_expiry(
+    db_context_empty_widgets_short_path: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+) -> None:
+    git_source = mocker.patch(
+        "brickops.datamesh.naming.git_source", return_value=GIT_SOURCE
+    )
+    jobname(db_context=db_context_empty_widgets_short_path, env="test")
+    clear_pipeline_contexts()
+    jobname(db_context=db_context_empty_widgets_short_path, env="test")
+    assert git_source.call_count == 2
+
+    set_pipeline_context_ttl(0)
+    try:
+        jobname(db_context=db_context_empty_widgets_short_path, env="test")
+        jobname(db_context=db_context_empty_widgets_short_path, env="test")
+    finally:
+        set_pipeline_context_ttl(None)
+    assert git_source.call_count == 4
+
+
+def test_pipeline_context_without_git_widgets_expires_with_git_source(
+    db_context: DbContext,
+    db_context_empty_widgets_short_path: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+) -> None:
+    mocker.patch("brickops.datamesh.naming.GIT_SOURCE_TTL", 0)
+    git_source = mocker.patch(
+        "brickops.datamesh.naming.git_source", return_value=GIT_SOURCE
+    )
+    jobname(db_context=db_context_empty_widgets_short_path, env="test")
+    jobname(db_context=db_context_empty_widgets_short_path, env="test")
+    assert git_source.call_count == 2
+
+    git_src = mocker.spy(naming, "_git_src")
+    jobname(db_context=db_context, env="test")
+    jobname(db_context=db_context, env="test")
+    assert git_src.call_count == 1
+
+
+def test_repos_api_is_skipped_when_widgets_carry_git_info(
+    db_context: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+) -> None:
+    git_source = mocker.patch("brickops.datamesh.naming.git_source")
+    jobname(db_context=db_context, env="test")
+    git_source.assert_not_called()
+
+
+def test_git_info_is_read_from_env_vars(
+    db_context_empty_widgets_short_path: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    git_source = mocker.patch("brickops.datamesh.naming.git_source")
+    monkeypatch.setenv("BRICKOPS_GIT_BRANCH", "envbranch")
+    monkeypatch.setenv("BRICKOPS_GIT_COMMIT", "envcommit123")
+    result = dbname(
+        db="dbfoo", cat="training", db_context=db_context_empty_widgets_short_path
+    )
+    assert result == "training.test_userfoo_envbranch_envcommi_dbfoo"
+    git_source.assert_not_called()
+
+
+def test_git_info_is_read_from_git_source_file(
+    db_context_empty_widgets_short_path: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    git_source = mocker.patch("brickops.datamesh.naming.git_source")
+    git_file = tmp_path / "git_source.json"
+    git_file.write_text(
+        json.dumps({"git_branch": "filebranch", "git_commit": "filecommit123"})
+    )
+    monkeypatch.setenv("BRICKOPS_GIT_SOURCE_FILE", str(git_file))
+    result = dbname(
+        db="dbfoo", cat="training", db_context=db_context_empty_widgets_short_path
+    )
+    assert result == "training.test_userfoo_filebranch_filecomm_dbfoo"
+    git_source.assert_not_called()
+
+
+def test_repos_api_only_fills_missing_git_fields(
+    db_context_empty_widgets_short_path: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mocker.patch("brickops.datamesh.naming.git_source", return_value=GIT_SOURCE)
+    monkeypatch.setenv("BRICKOPS_GIT_BRANCH", "envbranch")
+    result = dbname(
+        db="dbfoo", cat="training", db_context=db_context_empty_widgets_short_path
+    )
+    assert result == "training.test_userfoo_envbranch_apidefgh_dbfoo"
+
+
+def test_offline_mode_never_calls_repos_api(
+    db_context_empty_widgets_short_path: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    git_source = mocker.patch("brickops.datamesh.naming.git_source")
+    monkeypatch.setenv("BRICKOPS_OFFLINE", "1")
+    monkeypatch.setenv("BRICKOPS_GIT_BRANCH", "envbranch")
+    with pytest.raises(RuntimeError, match="git_commit"):
+        dbname(
+            db="dbfoo", cat="training", db_context=db_context_empty_widgets_short_path
+        )
+    git_source.assert_not_called()
+
+
+def test_tablenames_resolves_names_in_order(
+    db_context: DbContext,
+) -> None:
+    result = tablenames(
+        ["tbl1", ("other_db", "tbl2"), ("training.custom_db", "tbl3")],
+        db="test_db",
+        cat="training",
+        db_context=db_context,
+    )
+    assert result == [
+        "training.test_TestUser_gitbranch_abcdefgh_test_db.tbl1",
+        "training.test_TestUser_gitbranch_abcdefgh_other_db.tbl2",
+        "training.custom_db.tbl3",
+    ]
+
+
+def test_tablenames_match_tablename(
+    db_context: DbContext,
+) -> None:
+    tbls = ["tbl1", "tøbbel"]
+    assert tablenames(tbls, db="test_db", db_context=db_context) == [
+        tablename(tbl=tbl, db="test_db", db_context=db_context) for tbl in tbls
+    ]
+
+
+def test_naming_session_resolves_context_and_db_once(
+    db_context: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+) -> None:
+    get_context = mocker.patch(
+        "brickops.datamesh.naming.get_context", return_value=db_context
+    )
+    dbname_spy = mocker.spy(naming, "dbname")
+    session = NamingSession()
+    session.tablenames([f"tbl{i}" for i in range(100)], db="test_db")
+    assert get_context.call_count == 1
+    assert dbname_spy.call_count == 1
+    assert session.cat == "domainfoo"
+
+
+def test_tablenames_without_db_fails(
+    db_context: DbContext,
+) -> None:
+    with pytest.raises(ValueError, match="db must be a non-empty string"):
+        tablenames(["tbl1"], db_context=db_context)
+
+
+def test_pipeline_context_is_shared_through_disk_cache(
+    db_context_empty_widgets_short_path: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv("BRICKOPS_CACHE_DIR", str(tmp_path))
+    git_source = mocker.patch(
+        "brickops.datamesh.naming.git_source", return_value=GIT_SOURCE
+    )
+    name = jobname(db_context=db_context_empty_widgets_short_path, env="test")
+    clear_pipeline_contexts()  # As in a new process
+    assert jobname(db_context=db_context_empty_widgets_short_path, env="test") == name
+    assert git_source.call_count == 1
+
+
+def test_unpinned_pipeline_context_expires_from_disk_cache_with_git_source(
+    db_context_empty_widgets_short_path: DbContext,
+    mocker: pytest_mock.plugin.MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv("BRICKOPS_CACHE_DIR", str(tmp_path))
+    clock = mocker.patch("brickops.diskcache.time")
+    clock.time.return_value = 1000.0
+    git_source = mocker.patch(
+        "brickops.datamesh.naming.git_source", return_value=GIT_SOURCE
+    )
+    jobname(db_context=db_context_empty_widgets_short_path, env="test")
+    clear_pipeline_contexts()  # As in a new process
+    clock.time.return_value += GIT_SOURCE_TTL + 1
+    jobname(db_context=db_context_empty_widgets_short_path, env="test")
+    assert git_source.call_count == 2
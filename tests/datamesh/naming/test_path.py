@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 import pytest_mock
 
@@ -163,3 +165,42 @@ def test_parsepath_supports_explore_folders_w_org() -> None:
         flowtype="exploration",
         flow="a_notebook",
     )
+
+
+def test_parsepath_without_flowtype_level() -> None:
+    assert parsepath("/domains/sales/projects/test_project/explore/a_notebook") == (
+        ParsedPath(
+            domain="sales",
+            project="test_project",
+            activity="explore",
+            flowtype="",
+            flow="a_notebook",
+        )
+    )
+
+
+def test_parsepath_uses_last_mesh_section_and_ignores_marker_case() -> None:
+    parsed = parsepath(
+        "/Repos/u/domains/old/projects/p/x/DOMAINS/sales/Projects/proj/flows/prep/nb"
+    )
+    assert (parsed.domain, parsed.project, parsed.flow) == ("sales", "proj", "nb")
+
+
+def test_parsepath_requires_org_when_path_contains_orgs() -> None:
+    assert parsepath("/orgs/domains/sales/projects/p/flows/prep/nb") == ParsedPath(
+        domain="", project="", flowtype="", flow=""
+    )
+
+
+def test_parsepath_outside_mesh_returns_empty_path() -> None:
+    assert parsepath("/Users/someone/notebook") == ParsedPath(
+        domain="", project="", flowtype="", flow=""
+    )
+
+
+def test_parsed_path_is_immutable_and_cached() -> None:
+    path = "/domains/sales/projects/test_project/flows/prep/a_notebook"
+    parsed = parsepath(path)
+    assert parsepath(path) is parsed
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        parsed.domain = "other"  # type: ignore [misc]
@@ -4,6 +4,7 @@ from typing import Any
 import brickops
 from brickops.datamesh.cfg import (
     get_config,
+    clear_config_cache,
     read_config,
     find_config,
 )
@@ -13,7 +14,7 @@ from pathlib import Path
 @pytest.fixture
 def reset_config_state() -> Any:
     """Reset the module's global state between tests."""
-    read_config.cache_clear()
+    clear_config_cache()
     yield
 
 
@@ -97,7 +98,7 @@ def test_read_config_first_call(
     # Setup
     mocker.patch(
         "brickops.datamesh.cfg.find_config",
-        return_value="/path/to/.brickopscfg/config.yml",
+        return_value=Path("/path/to/.brickopscfg/config.yml"),
     )
 
     mock_config = {"key": "value"}
@@ -110,7 +111,7 @@ def test_read_config_first_call(
     assert result == mock_config
     brickops.datamesh.cfg.find_config.assert_called_once()  # type: ignore[attr-defined]
     brickops.datamesh.cfg._read_yaml.assert_called_once_with(  # type: ignore[attr-defined]
-        "/path/to/.brickopscfg/config.yml"
+        Path("/path/to/.brickopscfg/config.yml")
     )
 
 
@@ -123,7 +124,7 @@ def test_read_config_cache(
     # Setup
     mocker.patch(
         "brickops.datamesh.cfg.find_config",
-        return_value="/path/to/.brickopscfg/config.yml",
+        return_value=Path("/path/to/.brickopscfg/config.yml"),
     )
     mocker.patch("brickops.datamesh.cfg._read_yaml", return_value=mock_config)
 
@@ -133,9 +134,9 @@ def test_read_config_cache(
     # Execute - second call should use cache
     result = read_config()
 
-    # Verify
+    # Verify - the config location is looked up again, but not parsed again
     assert result == mock_config
-    brickops.datamesh.cfg.find_config.assert_called_once()  # type: ignore[attr-defined]
+    assert brickops.datamesh.cfg.find_config.call_count == 2  # type: ignore[attr-defined]
     brickops.datamesh.cfg._read_yaml.assert_called_once()  # type: ignore[attr-defined]
 
 
@@ -214,3 +215,60 @@ def test_find_config_with_actual_directory(
     expected_path = temp_repo_with_config / ".brickopscfg" / "config.yml"
 
     assert config_path == expected_path
+
+
+def test_read_config_reads_changed_config_again(
+    temp_repo_with_config: Any,
+    reset_config_state: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(temp_repo_with_config)
+    assert read_config() is read_config()
+
+    config_path = temp_repo_with_config / ".brickopscfg" / "config.yml"
+    config_path.write_text("naming: {}\n")
+    assert read_config() == {"naming": {}}
+
+
+def test_read_config_follows_cwd_to_another_repo(
+    temp_repo_with_config: Any,
+    reset_config_state: Any,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    other_repo = tmp_path_factory.mktemp("other")
+    (other_repo / ".brickopscfg").mkdir()
+    (other_repo / ".brickopscfg" / "config.yml").write_text("other: true\n")
+
+    monkeypatch.chdir(temp_repo_with_config)
+    assert "naming" in read_config()  # type: ignore[operator]
+    monkeypatch.chdir(other_repo)
+    assert read_config() == {"other": True}
+
+
+def test_find_config_remembers_folders_without_config(
+    tmp_path: Path,
+    reset_config_state: Any,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: pytest_mock.plugin.MockerFixture,
+) -> None:
+    nested_dir = tmp_path / "level1" / "level2"
+    nested_dir.mkdir(parents=True)
+    monkeypatch.chdir(nested_dir)
+    find_config()
+    exists = mocker.spy(Path, "exists")
+    monkeypatch.chdir(nested_dir.parent)
+    find_config()
+    exists.assert_not_called()
+
+
+def test_read_config_from_start_dir(
+    temp_repo_with_config: Any,
+    reset_config_state: Any,
+) -> None:
+    """The config is found from start_dir, not from the working directory."""
+    assert not Path.cwd().is_relative_to(temp_repo_with_config)
+    config = read_config(temp_repo_with_config)
+    assert config is not None
+    assert config["naming"]["job"]["prod"] == "{org}_{domain}_{project}_{env}"
+    assert get_config("naming", start_dir=temp_repo_with_config) == config["naming"]
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pytest
+
+from brickops.databricks.context import DbContext
+
+JOB_DEPLOYMENT = """tasks:
+  - task_key: revenue
+    serverless: true
+"""
+PIPELINE_DEPLOYMENT = """pipeline_tasks:
+  - pipeline_key: revenue
+schema: dltrevenue
+"""
+# Flows folder of the mesh tree, relative to the repo root
+FLOWS = "domains/sales/projects/shop/flows/prep"
+# A job flow and a pipeline flow, by path relative to the repo root
+MESH_TREE = {
+    f"{FLOWS}/orders/deployment.yml": JOB_DEPLOYMENT,
+    f"{FLOWS}/orders/revenue.py": "# orders\n",
+    f"{FLOWS}/revenue/deployment.yml": PIPELINE_DEPLOYMENT,
+    f"{FLOWS}/revenue/revenue.py": "# revenue\n",
+}
+
+
+def write_files(root: Path, files: dict[str, str]) -> None:
+    for path, content in files.items():
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(content)
+
+
+@pytest.fixture
+def db_context() -> DbContext:
+    """Context of a deploy tool notebook run by a service principal."""
+    return DbContext(
+        api_url="https://test.com",
+        api_token="test_token",  # noqa: S106
+        notebook_path="/Repos/Production/dp-notebooks/tools/deploy/deploy_all",
+        username="ServicePrincipal",
+    )
@@ -4,10 +4,11 @@ import pytest
 import pytest_mock
 
 from brickops.databricks.context import DbContext
+from brickops.dataops.deploy.diff import config_hash
 from brickops.dataops.deploy.job.buildconfig.build import build_job_config
 from brickops.dataops.deploy.job.buildconfig.job_config import JobConfig, defaultconfig
 from brickops.dataops.deploy.readconfig import read_config_yaml
-from brickops.datamesh.cfg import read_config
+from brickops.datamesh.cfg import clear_config_cache
 
 
 @pytest.fixture
@@ -107,6 +108,7 @@ def test_that_tags_are_set_correctly(
         "git_commit": "abcdefgh123",
         "git_url": "git_url",
         "deployment": "test_TestUser_gitbranch_abcdefgh",
+        "config_hash": config_hash(result.dict()),
     }
 
 
@@ -124,7 +126,7 @@ def test_that_service_prinical_is_set__when_running_as_sp(
 def test_that_job_name_is_correct_when_in_prod_env(
     basic_config: dict[str, Any], db_context: DbContext
 ) -> None:
-    read_config.cache_clear()  # Clear the cache to ensure the config is reloaded
+    clear_config_cache()  # Clear the cache to ensure the config is reloaded
     db_context.username = "service_principal"
     db_context.is_service_principal = True
     result = build_job_config(basic_config, env="prod", db_context=db_context)
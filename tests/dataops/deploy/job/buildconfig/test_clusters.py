@@ -0,0 +1,60 @@
+from typing import Any
+
+import pytest
+
+from brickops.databricks.api import ApiClient
+from brickops.databricks.context import DbContext
+from brickops.dataops.deploy.job.buildconfig.clusters import ClusterCatalog
+from brickops.dataops.deploy.job.buildconfig.enrichtasks import enrich_tasks
+from brickops.dataops.deploy.job.buildconfig.job_config import defaultconfig
+
+CLUSTERS = [
+    {"cluster_id": "1", "cluster_name": "shared"},
+    {"cluster_id": "2", "cluster_name": "twin"},
+    {"cluster_id": "3", "cluster_name": "twin"},
+]
+
+
+@pytest.fixture
+def clusters_list(requests_mock: Any) -> Any:  # noqa: ANN401
+    return requests_mock.get(
+        "https://test.com/api/2.1/clusters/list", json={"clusters": CLUSTERS}
+    )
+
+
+def test_cluster_catalog_resolves_names_from_one_listing(
+    clusters_list: Any,  # noqa: ANN401
+) -> None:
+    catalog = ClusterCatalog(ApiClient("https://test.com", "test_token"))
+    assert catalog.cluster_id("shared") == "1"
+    assert catalog.cluster_id("shared") == "1"
+    with pytest.raises(RuntimeError, match="not found"):
+        catalog.cluster_id("missing")
+    assert clusters_list.call_count == 1
+
+
+def test_cluster_catalog_rejects_ambiguous_names(
+    clusters_list: Any,  # noqa: ANN401
+) -> None:
+    catalog = ClusterCatalog(ApiClient("https://test.com", "test_token"))
+    with pytest.raises(RuntimeError, match="ambiguous"):
+        catalog.cluster_id("twin")
+
+
+def test_enrich_tasks_lists_clusters_once_per_job(
+    clusters_list: Any,  # noqa: ANN401
+) -> None:
+    job_config = defaultconfig()
+    job_config.tasks = [
+        {"task_key": f"task_{i}", "existing_cluster_name": "shared"} for i in range(3)
+    ]
+    job_config.git_source = {"git_path": "test"}
+    db_context = DbContext(
+        api_url="https://test.com",
+        api_token="test_token",  # noqa: S106
+        username="username",
+        notebook_path="test/notebook_path",
+    )
+    result = enrich_tasks(job_config, db_context=db_context)
+    assert [task["existing_cluster_id"] for task in result.tasks] == ["1", "1", "1"]
+    assert clusters_list.call_count == 1
@@ -3,6 +3,7 @@ import pytest
 
 from brickops.databricks.context import DbContext
 from brickops.datamesh import cfg
+from brickops.dataops.deploy.diff import config_hash
 from brickops.dataops.deploy.readconfig import read_config_yaml
 from brickops.dataops.deploy.pipeline.buildconfig.build import build_pipeline_config
 from brickops.dataops.deploy.pipeline.buildconfig.pipeline_config import (
@@ -124,9 +125,11 @@ def test_build_pipeline_config_returns_expected_result_for_valid_config(
     basic_config: dict[str, Any],
     db_context: DbContext,
 ) -> None:
-    cfg.read_config.cache_clear()  # Clear the cache to ensure the config is reloaded
+    cfg.clear_config_cache()  # Clear the cache to ensure the config is reloaded
     result = build_pipeline_config(basic_config, "test", db_context)
-    assert result.export_dict() == DEV_EXPECTED_CONFIG
+    exported: dict[str, Any] = result.export_dict()
+    assert exported["tags"].pop("config_hash") == config_hash(exported)
+    assert exported == DEV_EXPECTED_CONFIG
 
 
 def test_build_pipeline_sets_correct_run_as(
@@ -147,6 +150,7 @@ def test_tags_are_set_correctly(
         "git_url": "git_url",
         "deployment": "test_TestUser_gitbranch_abcdefgh",
         "pipeline_env": "test",
+        "config_hash": config_hash(result.export_dict()),
     }
 
 
@@ -162,7 +166,7 @@ def test_service_prinical_is_set_when_running_as_sp(
 def test_pipeline_name_is_correct_when_in_prod_env(
     basic_config: dict[str, Any], db_context: DbContext
 ) -> None:
-    cfg.read_config.cache_clear()  # Clear the cache to ensure the config is reloaded
+    cfg.clear_config_cache()  # Clear the cache to ensure the config is reloaded
     db_context.username = "service_principal"
     db_context.is_service_principal = True
     db_context.notebook_path = "/Repos/test@vlfk.no/dp-notebooks/something/domains/domainfoo/projects/projectfoo/flows/flowfoo/task_key"
@@ -173,7 +177,7 @@ def test_pipeline_name_is_correct_when_in_prod_env(
 def test_pipeline_name_is_correct_when_in_prod_env_w_org(
     basic_config: dict[str, Any], db_context: DbContext
 ) -> None:
-    cfg.read_config.cache_clear()  # Clear the cache to ensure the config is reloaded
+    cfg.clear_config_cache()  # Clear the cache to ensure the config is reloaded
     db_context.username = "service_principal"
     db_context.is_service_principal = True
     db_context.notebook_path = "/Repos/test@vlfk.no/dp-notebooks/something/org/acme/domains/domainfoo/projects/projectfoo/flows/flowfoo/task_key"
@@ -0,0 +1,225 @@
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from brickops.databricks.context import DbContext
+from brickops.dataops.deploy.bulk import deploy_all, discover_deployments
+from dataops.deploy.conftest import FLOWS, JOB_DEPLOYMENT, MESH_TREE, write_files
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A checkout with one job flow, one pipeline flow and one example flow."""
+    root = tmp_path / "dp-notebooks"
+    dotgit = root / ".git"
+    (dotgit / "refs" / "heads").mkdir(parents=True)
+    (dotgit / "HEAD").write_text("ref: refs/heads/main\n")
+    (dotgit / "refs" / "heads" / "main").write_text(COMMIT)
+    (dotgit / "config").write_text(
+        '[remote "origin"]\n\turl = https://github.com/org/dp-notebooks\n'
+    )
+    write_files(
+        root, MESH_TREE | {f"{FLOWS}/example_flow/deployment.yml": JOB_DEPLOYMENT}
+    )
+    return root
+
+
+def test_discover_deployments_skips_examples(repo: Path) -> None:
+    assert [path.parent.name for path in discover_deployments(repo)] == [
+        "orders",
+        "revenue",
+    ]
+
+
+def test_deploy_all_builds_and_deploys_every_flow(
+    repo: Path,
+    db_context: DbContext,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    requests_mock.get(
+        "https://test.com/api/2.2/jobs/list",
+        json={"jobs": [{"job_id": 1, "settings": {"name": "sales_shop_prod"}}]},
+    )
+    requests_mock.get(
+        "https://test.com/api/2.1/jobs/get",
+        json={"job_id": 1, "settings": {"name": "sales_shop_prod"}},
+    )
+    requests_mock.get("https://test.com/api/2.0/pipelines", json={"statuses": []})
+    reset = requests_mock.post("https://test.com/api/2.1/jobs/reset", json={})
+    create = requests_mock.post(
+        "https://test.com/api/2.0/pipelines", json={"pipeline_id": "p1"}
+    )
+
+    results = deploy_all(repo / "domains", db_context=db_context, concurrency=2)
+
+    assert [(r.kind, r.name, r.status, r.error) for r in results] == [
+        ("job", "sales_shop_prod", "updated", None),
+        ("pipeline", "sales_shop_prod_dlt", "created", None),
+    ]
+    assert reset.last_request.json()["job_id"] == 1
+    job_settings = reset.last_request.json()["new_settings"]
+    assert job_settings["tasks"][0]["notebook_task"]["notebook_path"] == (
+        "domains/sales/projects/shop/flows/prep/orders/revenue"
+    )
+    assert job_settings["tags"]["git_commit"] == COMMIT
+    flow_folder = repo / FLOWS
+    assert create.last_request.json()["libraries"] == [
+        {"notebook": {"path": f"{flow_folder}/revenue/revenue"}}
+    ]
+
+
+def test_deploy_all_skips_unchanged_flows(
+    repo: Path,
+    db_context: DbContext,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    requests_mock.get("https://test.com/api/2.2/jobs/list", json={"jobs": []})
+    requests_mock.get("https://test.com/api/2.0/pipelines", json={"statuses": []})
+    create_job = requests_mock.post(
+        "https://test.com/api/2.1/jobs/create", json={"job_id": 1}
+    )
+    create_pipeline = requests_mock.post(
+        "https://test.com/api/2.0/pipelines", json={"pipeline_id": "p1"}
+    )
+    deploy_all(repo / "domains", db_context=db_context)
+
+    # The api echoes the settings with server-side defaults filled in
+    job_settings = create_job.last_request.json() | {
+        "format": "MULTI_TASK",
+        "max_concurrent_runs": 1,
+    }
+    pipeline_spec = create_pipeline.last_request.json() | {
+        "id": "p1",
+        "channel": "CURRENT",
+    }
+    requests_mock.get(
+        "https://test.com/api/2.2/jobs/list",
+        json={"jobs": [{"job_id": 1, "settings": {"name": "sales_shop_prod"}}]},
+    )
+    requests_mock.get(
+        "https://test.com/api/2.0/pipelines",
+        json={"statuses": [{"pipeline_id": "p1", "name": "sales_shop_prod_dlt"}]},
+    )
+    requests_mock.get(
+        "https://test.com/api/2.1/jobs/get",
+        json={"job_id": 1, "settings": job_settings},
+    )
+    requests_mock.get(
+        "https://test.com/api/2.0/pipelines/p1",
+        json={"pipeline_id": "p1", "spec": pipeline_spec},
+    )
+    reset = requests_mock.post("https://test.com/api/2.1/jobs/reset", json={})
+    update = requests_mock.put("https://test.com/api/2.0/pipelines/p1", json={})
+
+    results = deploy_all(repo / "domains", db_context=db_context)
+
+    assert [result.status for result in results] == ["unchanged", "unchanged"]
+    assert not reset.called
+    assert not update.called
+
+
+def test_deploy_all_skips_jobs_with_matching_config_hash(
+    repo: Path,
+    db_context: DbContext,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    requests_mock.get("https://test.com/api/2.2/jobs/list", json={"jobs": []})
+    requests_mock.get("https://test.com/api/2.0/pipelines", json={"statuses": []})
+    create_job = requests_mock.post(
+        "https://test.com/api/2.1/jobs/create", json={"job_id": 1}
+    )
+    requests_mock.post("https://test.com/api/2.0/pipelines", json={"pipeline_id": "p1"})
+    deploy_all(repo / "domains", db_context=db_context)
+
+    listed_settings = {
+        key: create_job.last_request.json()[key] for key in ("name", "tags")
+    }
+    requests_mock.get(
+        "https://test.com/api/2.2/jobs/list",
+        json={"jobs": [{"job_id": 1, "settings": listed_settings}]},
+    )
+    get_job = requests_mock.get("https://test.com/api/2.1/jobs/get", json={})
+
+    results = deploy_all(repo / "domains", db_context=db_context)
+
+    assert results[0].status == "unchanged"
+    assert not get_job.called
+
+
+def test_deploy_all_uses_naming_config_of_each_flow(
+    repo: Path,
+    db_context: DbContext,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    (repo / ".brickopscfg").mkdir()
+    (repo / ".brickopscfg" / "config.yml").write_text(
+        'naming:\n  job:\n    prod: "{domain}_{project}_custom"\n'
+    )
+    flow_folder = repo / FLOWS
+    (flow_folder / "revenue" / ".brickopscfg").mkdir()
+    (flow_folder / "revenue" / ".brickopscfg" / "config.yml").write_text(
+        'naming:\n  pipeline:\n    prod: "{project}_nested_dlt"\n'
+    )
+    requests_mock.get("https://test.com/api/2.2/jobs/list", json={"jobs": []})
+    requests_mock.get("https://test.com/api/2.0/pipelines", json={"statuses": []})
+    requests_mock.post("https://test.com/api/2.1/jobs/create", json={"job_id": 1})
+    requests_mock.post("https://test.com/api/2.0/pipelines", json={"pipeline_id": "p1"})
+
+    # The working directory is outside the repo, as for the deploy tool
+    assert not Path.cwd().is_relative_to(repo)
+    results = deploy_all(repo / "domains", db_context=db_context)
+
+    assert [result.name for result in results] == [
+        "sales_shop_custom",
+        "shop_nested_dlt",
+    ]
+
+
+def test_deploy_all_creates_a_shared_job_name_once(
+    repo: Path,
+    db_context: DbContext,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    flow_folder = repo / FLOWS
+    (flow_folder / "customers").mkdir()
+    (flow_folder / "customers" / "deployment.yml").write_text(JOB_DEPLOYMENT)
+    requests_mock.get("https://test.com/api/2.2/jobs/list", json={"jobs": []})
+    requests_mock.get("https://test.com/api/2.0/pipelines", json={"statuses": []})
+    requests_mock.get("https://test.com/api/2.1/jobs/get", json={"settings": {}})
+
+    def created(request: Any, context: Any) -> dict[str, Any]:  # noqa: ANN401
+        time.sleep(0.1)  # Let the other flow reach the name index meanwhile
+        return {"job_id": 1}
+
+    create = requests_mock.post("https://test.com/api/2.1/jobs/create", json=created)
+    reset = requests_mock.post("https://test.com/api/2.1/jobs/reset", json={})
+    requests_mock.post("https://test.com/api/2.0/pipelines", json={"pipeline_id": "p1"})
+
+    results = deploy_all(repo / "domains", db_context=db_context, concurrency=3)
+
+    assert [(r.name, r.error) for r in results if r.kind == "job"] == [
+        ("sales_shop_prod", None),
+        ("sales_shop_prod", None),
+    ]
+    assert create.call_count == 1
+    assert reset.last_request.json()["job_id"] == 1
+
+
+def test_deploy_all_reports_failing_flows(
+    repo: Path,
+    db_context: DbContext,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    requests_mock.get("https://test.com/api/2.2/jobs/list", json={"jobs": []})
+    requests_mock.get("https://test.com/api/2.0/pipelines", json={"statuses": []})
+    requests_mock.post("https://test.com/api/2.1/jobs/create", status_code=400)
+    requests_mock.post("https://test.com/api/2.0/pipelines", json={"pipeline_id": "p1"})
+
+    results = deploy_all(repo / "domains", db_context=db_context)
+
+    assert [result.ok for result in results] == [False, True]
+    assert results[0].name == "sales_shop_prod"
@@ -0,0 +1,141 @@
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from brickops.databricks.context import DbContext
+from brickops.dataops.deploy.bulk import deploy_changed, discover_deployments
+from brickops.dataops.deploy.changes import affected_deployments, changed_files
+from dataops.deploy.conftest import FLOWS, MESH_TREE, write_files
+
+NAMING_CONFIG = """naming:
+  job:
+    prod: "{domain}_{project}_job"
+    other: "{domain}_{project}_{env}_{username}_{gitbranch}_{gitshortref}"
+  pipeline:
+    prod: "{domain}_{project}_pipeline"
+    other: "{domain}_{project}_{env}_{username}_{gitbranch}_{gitshortref}_dlt"
+"""
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def commit(repo: Path, files: dict[str, str]) -> str:
+    write_files(repo, files)
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "change")
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A git checkout with a naming config, a job flow and a pipeline flow."""
+    root = tmp_path / "dp-notebooks"
+    root.mkdir()
+    git(root, "init", "-q", "-b", "main")
+    git(root, "remote", "add", "origin", "https://github.com/org/dp-notebooks")
+    commit(
+        root,
+        MESH_TREE | {".brickopscfg/config.yml": NAMING_CONFIG, "README.md": "readme\n"},
+    )
+    return root
+
+
+def affected_flows(repo: Path, base: str) -> list[str]:
+    cfg_paths = discover_deployments(repo)
+    changed = changed_files(repo, base)
+    affected = affected_deployments(repo, cfg_paths, changed, base=base)
+    return sorted(path.parent.name for path in affected)
+
+
+def test_changes_in_a_flow_folder_affect_that_flow(repo: Path) -> None:
+    base = git(repo, "rev-parse", "HEAD")
+    commit(repo, {f"{FLOWS}/orders/revenue.py": "# orders v2\n", "README.md": "v2"})
+    assert affected_flows(repo, base) == ["orders"]
+
+
+def test_job_naming_changes_affect_jobs_only(repo: Path) -> None:
+    base = git(repo, "rev-parse", "HEAD")
+    config = NAMING_CONFIG.replace('"{domain}_{project}_job"', '"{project}_job"')
+    commit(repo, {".brickopscfg/config.yml": config})
+    assert affected_flows(repo, base) == ["orders"]
+
+
+def test_config_changes_without_effect_affect_no_flows(repo: Path) -> None:
+    base = git(repo, "rev-parse", "HEAD")
+    commit(repo, {".brickopscfg/config.yml": "# comment\n" + NAMING_CONFIG})
+    assert affected_flows(repo, base) == []
+
+
+def test_closer_configs_shield_flows_from_root_config(repo: Path) -> None:
+    commit(repo, {f"{FLOWS}/revenue/.brickopscfg/config.yml": NAMING_CONFIG})
+    base = git(repo, "rev-parse", "HEAD")
+    commit(repo, {".brickopscfg/config.yml": "naming: {}\n"})
+    assert affected_flows(repo, base) == ["orders"]
+
+
+def test_deploy_changed_deploys_flows_changed_since_base(
+    repo: Path,
+    db_context: DbContext,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    base = git(repo, "rev-parse", "HEAD")
+    commit(repo, {f"{FLOWS}/orders/revenue.py": "# orders v2\n"})
+    requests_mock.get("https://test.com/api/2.2/jobs/list", json={"jobs": []})
+    requests_mock.get("https://test.com/api/2.0/pipelines", json={"statuses": []})
+    requests_mock.post("https://test.com/api/2.1/jobs/create", json={"job_id": 1})
+
+    results = deploy_changed(repo / "domains", base=base, db_context=db_context)
+
+    assert [(result.name, result.status) for result in results] == [
+        ("sales_shop_job", "created")
+    ]
+
+
+def test_deploy_changed_compares_with_deployed_commits(
+    repo: Path,
+    db_context: DbContext,
+    requests_mock: Any,  # noqa: ANN401
+) -> None:
+    deployed = git(repo, "rev-parse", "HEAD")
+    head = commit(repo, {f"{FLOWS}/orders/revenue.py": "# orders v2\n"})
+    requests_mock.get(
+        "https://test.com/api/2.2/jobs/list",
+        json={
+            "jobs": [
+                {
+                    "job_id": 1,
+                    "settings": {
+                        "name": "sales_shop_job",
+                        "tags": {"git_commit": deployed},
+                    },
+                }
+            ]
+        },
+    )
+    requests_mock.get(
+        "https://test.com/api/2.0/pipelines",
+        json={"statuses": [{"pipeline_id": "p1", "name": "sales_shop_pipeline"}]},
+    )
+    requests_mock.get(
+        "https://test.com/api/2.0/pipelines/p1",
+        json={"spec": {"tags": {"git_commit": deployed}}},
+    )
+    requests_mock.get("https://test.com/api/2.1/jobs/get", json={"settings": {}})
+    reset = requests_mock.post("https://test.com/api/2.1/jobs/reset", json={})
+
+    results = deploy_changed(repo / "domains", db_context=db_context)
+
+    assert [(result.name, result.status) for result in results] == [
+        ("sales_shop_job", "updated")
+    ]
+    assert reset.last_request.json()["new_settings"]["tags"]["git_commit"] == head
@@ -0,0 +1,93 @@
+from typing import Any
+
+from brickops.dataops.deploy.diff import (
+    canonical,
+    config_hash,
+    job_settings_equal,
+    pipeline_spec_equal,
+)
+
+JOB_SETTINGS: dict[str, Any] = {
+    "name": "sales_shop_prod",
+    "tags": {"git_commit": "abc", "deployment": "auto"},
+    "tasks": [
+        {"task_key": "orders", "notebook_task": {"notebook_path": "flows/orders"}},
+        {
+            "task_key": "revenue",
+            "depends_on": [{"task_key": "orders"}],
+            "notebook_task": {"notebook_path": "flows/revenue"},
+        },
+    ],
+    "parameters": [{"name": "env", "default": "prod"}],
+    "max_retries": None,
+}
+
+
+def test_canonical_drops_empty_values_and_sorts_keyed_lists() -> None:
+    assert canonical(
+        {
+            "a": None,
+            "b": [],
+            "c": {},
+            "d": "",
+            "e": 1,
+            "tasks": [{"task_key": "y"}, {"task_key": "x"}],
+        }
+    ) == {"e": "1", "tasks": [{"task_key": "x"}, {"task_key": "y"}]}
+
+
+def test_job_settings_equal_ignores_server_defaults_and_order() -> None:
+    current = {
+        **JOB_SETTINGS,
+        "format": "MULTI_TASK",
+        "max_concurrent_runs": 1,
+        "timeout_seconds": 0,
+        "tasks": [
+            {
+                **JOB_SETTINGS["tasks"][1],
+                "run_if": "ALL_SUCCESS",
+                "timeout_seconds": 0,
+            },
+            JOB_SETTINGS["tasks"][0],
+        ],
+    }
+    del current["max_retries"]
+    assert job_settings_equal(JOB_SETTINGS, current)
+
+
+def test_job_settings_equal_detects_changes() -> None:
+    current = {**JOB_SETTINGS, "tags": {"git_commit": "def", "deployment": "auto"}}
+    assert not job_settings_equal(JOB_SETTINGS, current)
+    current = {**JOB_SETTINGS, "max_concurrent_runs": 2}
+    assert not job_settings_equal(JOB_SETTINGS, current)
+
+
+def test_job_settings_equal_compares_run_as_only_if_echoed() -> None:
+    desired = {**JOB_SETTINGS, "run_as": {"service_principal_name": "sp"}}
+    assert job_settings_equal(desired, JOB_SETTINGS)
+    current = {**JOB_SETTINGS, "run_as": {"user_name": "someone"}}
+    assert not job_settings_equal(desired, current)
+
+
+def test_pipeline_spec_equal_ignores_id_and_defaults() -> None:
+    desired = {
+        "name": "sales_shop_prod_dlt",
+        "catalog": "prod",
+        "libraries": [{"notebook": {"path": "/flows/revenue"}}],
+        "configuration": {"pipelines.trigger.interval": "1 hour"},
+        "photon": False,
+    }
+    current = {**desired, "id": "p1", "channel": "CURRENT", "edition": "ADVANCED"}
+    del current["photon"]
+    assert pipeline_spec_equal(desired, current)
+    assert not pipeline_spec_equal({**desired, "catalog": "dev"}, current)
+
+
+def test_config_hash_is_stable_and_ignores_its_own_tag() -> None:
+    reordered = {**JOB_SETTINGS, "tasks": JOB_SETTINGS["tasks"][::-1]}
+    tagged = {**JOB_SETTINGS, "tags": {**JOB_SETTINGS["tags"], "config_hash": "x"}}
+    assert config_hash(JOB_SETTINGS) == config_hash(reordered)
+    assert config_hash(JOB_SETTINGS) == config_hash(tagged)
+    assert config_hash(JOB_SETTINGS) != config_hash(
+        {**JOB_SETTINGS, "tags": {"git_commit": "def"}}
+    )
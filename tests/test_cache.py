@@ -0,0 +1,41 @@
+import pytest_mock
+
+from brickops.cache import TTLCache
+
+
+def test_entries_expire_after_ttl(mocker: pytest_mock.MockerFixture) -> None:
+    clock = mocker.patch("brickops.cache.time.monotonic", return_value=100.0)
+    cache: TTLCache[str, int] = TTLCache(ttl=10)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    clock.return_value = 111.0
+    assert cache.get("a") is None
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_stats_count_hits_and_misses() -> None:
+    cache: TTLCache[str, int] = TTLCache()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_invalidate_removes_matching_keys() -> None:
+    cache: TTLCache[str, int] = TTLCache()
+    cache.set("jobs/list", 1)
+    cache.set("jobs/get", 2)
+    cache.set("repos", 3)
+    assert cache.invalidate(lambda key: key.startswith("jobs")) == 2
+    assert len(cache) == 1
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+import pytest_mock
+
+from brickops.diskcache import DiskCache, get_disk_cache
+
+
+def test_values_are_shared_between_cache_instances(tmp_path: Path) -> None:
+    DiskCache(tmp_path).set("ns", ("https://test.com", "/nb"), {"a": 1})
+    assert DiskCache(tmp_path).get("ns", ("https://test.com", "/nb")) == {"a": 1}
+    assert DiskCache(tmp_path).get("ns", ("https://test.com", "/other")) is None
+
+
+def test_entries_expire_after_ttl(
+    tmp_path: Path, mocker: pytest_mock.MockerFixture
+) -> None:
+    clock = mocker.patch("brickops.diskcache.time.time", return_value=100.0)
+    cache = DiskCache(tmp_path, ttl=10)
+    cache.set("ns", "key", 1)
+    assert cache.get("ns", "key") == 1
+    clock.return_value = 111.0
+    assert cache.get("ns", "key") is None
+
+
+def test_writes_leave_no_temporary_files(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path)
+    cache.set("ns", "key", 1)
+    cache.set("ns", "key", 2)
+    assert [path.suffix for path in (tmp_path / "ns").iterdir()] == [".json"]
+    assert cache.get("ns", "key") == 2
+
+
+def test_unreadable_entries_are_misses(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path)
+    cache.set("ns", "key", 1)
+    next((tmp_path / "ns").iterdir()).write_text("{not json")
+    assert cache.get("ns", "key") is None
+
+
+def test_cache_is_opt_in(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("BRICKOPS_CACHE_DIR", raising=False)
+    assert get_disk_cache() is None
+    monkeypatch.setenv("BRICKOPS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("BRICKOPS_CACHE_TTL", "60")
+    cache = get_disk_cache()
+    assert cache is not None
+    assert (cache.directory, cache.ttl) == (tmp_path, 60.0)
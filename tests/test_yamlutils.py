@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+import pytest_mock
+
+from brickops import yamlutils
+from brickops.yamlutils import read_yaml
+
+DEPLOYMENT = """tasks:
+  - task_key: revenue
+    depends_on: []
+schedule:
+  cron: "0 0 * * *"
+"""
+
+
+def test_read_yaml_parses_file(tmp_path: Path) -> None:
+    path = tmp_path / "deployment.yml"
+    path.write_text(DEPLOYMENT)
+    assert read_yaml(path) == {
+        "tasks": [{"task_key": "revenue", "depends_on": []}],
+        "schedule": {"cron": "0 0 * * *"},
+    }
+
+
+def test_read_yaml_reuses_snapshot_of_unchanged_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    monkeypatch.setenv("BRICKOPS_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "deployment.yml"
+    path.write_text(DEPLOYMENT)
+    load_yaml = mocker.spy(yamlutils, "load_yaml")
+
+    first = read_yaml(path)
+    assert read_yaml(path) == first
+    assert load_yaml.call_count == 1
+
+    path.write_text("tasks: []\n")
+    assert read_yaml(path) == {"tasks": []}
+    assert load_yaml.call_count == 2
+
+
+def test_read_yaml_does_not_snapshot_content_json_cannot_hold(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("BRICKOPS_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "deployment.yml"
+    path.write_text("start: 2024-01-01\n1: one\n")
+    first = read_yaml(path)
+    assert read_yaml(path) == first
+    assert not (tmp_path / "cache").exists()
@@ -1,17 +1,12 @@
 # Databricks notebook source
-from pathlib import Path
+from brickops.dataops.deploy.bulk import deploy_all
 
-deploy_notebooks = [
-    str(path)
-    for path in Path("/Workspace/Repos/Production/dp-notebooks/domains").glob(
-        "**/deploy"
-    )
-    if "example_" not in str(path)
-]
+results = deploy_all("/Workspace/Repos/Production/dp-notebooks/domains")
 
-display(deploy_notebooks)
+display([result.dict() for result in results])
 
 # COMMAND ----------
 
-for notebook in deploy_notebooks:
-    dbutils.notebook.run(str(notebook), timeout_seconds=180)
+failed = [result.path for result in results if not result.ok]
+if failed:
+    raise RuntimeError(f"Deploy failed for {len(failed)} flows: {failed}")